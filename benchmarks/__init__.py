@@ -0,0 +1,5 @@
+"""
+Headless performance benchmarks for Textual.
+
+Run the suite with `python -m benchmarks`, see `benchmarks/README.md` for details.
+"""
@@ -0,0 +1,85 @@
+"""
+Run the benchmark suite.
+
+```
+python -m benchmarks --output results.json
+python -m benchmarks --compare baseline.json
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+
+from benchmarks import scenarios  # noqa: F401 (registers scenarios)
+from benchmarks._harness import (
+    SCENARIOS,
+    compare_results,
+    load_results,
+    run_scenarios,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Run Textual benchmarks."
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        metavar="SCENARIO",
+        help="Scenarios to run (default: all).",
+    )
+    parser.add_argument("--list", action="store_true", help="List scenarios and exit.")
+    parser.add_argument(
+        "-o", "--output", metavar="PATH", help="Write JSON results to PATH."
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="PATH",
+        help="Compare with previous results in PATH, and exit with 1 on regression.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative change considered to be a regression (default: 0.1).",
+    )
+    args = parser.parse_args()
+
+    if args.list:
+        for name, scenario in SCENARIOS.items():
+            print(f"{name:<24} {scenario.description}")
+        return 0
+
+    unknown = [name for name in args.names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    selected = [SCENARIOS[name] for name in (args.names or SCENARIOS)]
+    results = asyncio.run(run_scenarios(selected))
+    results_json = json.dumps(results, indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(results_json)
+    else:
+        print(results_json)
+
+    if args.compare:
+        report, regressions = compare_results(
+            load_results(args.compare), results, args.threshold
+        )
+        print("\n".join(report), file=sys.stderr)
+        if regressions:
+            print("\nRegressions:", file=sys.stderr)
+            print("\n".join(regressions), file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
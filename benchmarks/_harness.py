@@ -0,0 +1,336 @@
+"""
+The benchmark harness.
+
+Apps are driven through [App.run_test][textual.app.App.run_test] with the headless driver.
+While a scenario runs, the compositor and the app are instrumented to record time spent
+in layout and in `render_update`, the number of frames, and the number of bytes that
+would have been written to the terminal.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import wraps
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Iterator
+
+from textual import __version__
+from textual._color_pipeline import numpy
+from textual._compositor import Compositor, CompositorUpdate
+from textual._render_pool import get_render_threads
+from textual.app import App
+from textual.pilot import Pilot
+
+DriveCallable = Callable[[Pilot[Any]], Awaitable[None]]
+"""Type of a coroutine function that drives an app."""
+
+
+@dataclass
+class Scenario:
+    """A benchmark scenario."""
+
+    name: str
+    """Name of the scenario (used as a key in the results)."""
+    description: str
+    """A short description."""
+    app_factory: Callable[[], App[Any]]
+    """Callable that returns the app to benchmark."""
+    drive: DriveCallable
+    """Coroutine function that operates the app via a pilot."""
+    size: tuple[int, int] = (120, 40)
+    """Size of the (virtual) terminal."""
+
+
+SCENARIOS: dict[str, Scenario] = {}
+"""Registered scenarios."""
+
+
+def scenario(
+    name: str,
+    app_factory: Callable[[], App[Any]],
+    *,
+    size: tuple[int, int] = (120, 40),
+) -> Callable[[DriveCallable], DriveCallable]:
+    """Decorator to register a benchmark scenario.
+
+    The decorated coroutine function receives a `Pilot`, and should perform the work to be measured.
+    The first line of the docstring is used as the description.
+
+    Args:
+        name: Name of the scenario.
+        app_factory: Callable that returns the app to benchmark.
+        size: Size of the terminal.
+    """
+
+    def register(drive: DriveCallable) -> DriveCallable:
+        description = (drive.__doc__ or "").strip().splitlines()[0:1]
+        SCENARIOS[name] = Scenario(
+            name, description[0] if description else "", app_factory, drive, size
+        )
+        return drive
+
+    return register
+
+
+@dataclass
+class Recorder:
+    """Records timings while a scenario is running."""
+
+    timings: dict[str, list[float]] = field(default_factory=dict)
+    """Elapsed times (in seconds), keyed by the name of the measured operation."""
+    frames: int = 0
+    """Number of frames written."""
+    output_bytes: int = 0
+    """Number of bytes (UTF-8) that would have been written to the terminal."""
+    recording: bool = False
+    """Only record while this is `True`."""
+
+    def add_timing(self, name: str, elapsed: float) -> None:
+        """Record a timing.
+
+        Args:
+            name: Name of operation.
+            elapsed: Elapsed time in seconds.
+        """
+        if self.recording:
+            self.timings.setdefault(name, []).append(elapsed)
+
+    def add_frame(self, terminal_sequence: str) -> None:
+        """Record a frame.
+
+        Args:
+            terminal_sequence: The data for the frame.
+        """
+        if self.recording:
+            self.frames += 1
+            self.output_bytes += len(terminal_sequence.encode("utf-8"))
+
+    def summarize_timings(self, name: str) -> dict[str, float]:
+        """Summarize the timings for a given operation.
+
+        Args:
+            name: Name of operation.
+
+        Returns:
+            A dict of statistics, with times in milliseconds.
+        """
+        times = [elapsed * 1000 for elapsed in self.timings.get(name, [])]
+        if not times:
+            return {"count": 0, "total_ms": 0.0, "mean_ms": 0.0, "p95_ms": 0.0}
+        times.sort()
+        return {
+            "count": len(times),
+            "total_ms": sum(times),
+            "mean_ms": statistics.fmean(times),
+            "p95_ms": times[min(len(times) - 1, int(len(times) * 0.95))],
+        }
+
+
+def _timed(recorder: Recorder, name: str, method: Callable) -> Callable:
+    """Wrap a method so that calls to it are timed."""
+
+    @wraps(method)
+    def timed_method(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            recorder.add_timing(name, perf_counter() - start)
+
+    return timed_method
+
+
+@contextmanager
+def instrument(recorder: Recorder) -> Iterator[Recorder]:
+    """Instrument the compositor and the app.
+
+    Args:
+        recorder: Recorder to receive measurements.
+    """
+    patches: list[tuple[type, str, Callable]] = [
+        (
+            Compositor,
+            "render_update",
+            _timed(recorder, "render_update", Compositor.render_update),
+        ),
+        (
+            Compositor,
+            "render_inline",
+            _timed(recorder, "render_update", Compositor.render_inline),
+        ),
+        (Compositor, "reflow", _timed(recorder, "layout", Compositor.reflow)),
+        (
+            Compositor,
+            "reflow_visible",
+            _timed(recorder, "layout", Compositor.reflow_visible),
+        ),
+    ]
+
+    original_display = App._display
+
+    def _display(app: App, screen, renderable) -> None:
+        # The headless driver doesn't write anything, so we generate the output here.
+        if isinstance(renderable, CompositorUpdate) and not app._batch_count:
+            recorder.add_frame(renderable.render_segments(app.console))
+        original_display(app, screen, renderable)
+
+    patches.append((App, "_display", _display))
+
+    originals = [(owner, name, owner.__dict__[name]) for owner, name, _ in patches]
+    for owner, name, replacement in patches:
+        setattr(owner, name, replacement)
+    try:
+        yield recorder
+    finally:
+        for owner, name, original in originals:
+            setattr(owner, name, original)
+
+
+async def run_scenario(scenario: Scenario) -> dict[str, Any]:
+    """Run a single scenario.
+
+    Args:
+        scenario: Scenario to run.
+
+    Returns:
+        A dict of results.
+    """
+    recorder = Recorder()
+    gc.collect()
+    app = scenario.app_factory()
+    with instrument(recorder):
+        tracemalloc.start()
+        async with app.run_test(size=scenario.size) as pilot:
+            await pilot.pause()
+            memory, _peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            widget_count = sum(
+                len(list(screen.walk_children(with_self=True)))
+                for screen in app.screen_stack
+            )
+
+            recorder.recording = True
+            start = perf_counter()
+            await scenario.drive(pilot)
+            await pilot.pause()
+            duration = perf_counter() - start
+            recorder.recording = False
+
+    return {
+        "description": scenario.description,
+        "size": list(scenario.size),
+        "duration_s": duration,
+        "frames": recorder.frames,
+        "fps": recorder.frames / duration if duration else 0.0,
+        "render_update": recorder.summarize_timings("render_update"),
+        "layout": recorder.summarize_timings("layout"),
+        "widgets": widget_count,
+        "memory_bytes": memory,
+        "memory_per_widget_bytes": memory / widget_count if widget_count else 0.0,
+        "output_bytes": recorder.output_bytes,
+        "bytes_per_frame": (
+            recorder.output_bytes / recorder.frames if recorder.frames else 0.0
+        ),
+    }
+
+
+async def run_scenarios(scenarios: list[Scenario]) -> dict[str, Any]:
+    """Run a number of scenarios.
+
+    Args:
+        scenarios: Scenarios to run.
+
+    Returns:
+        Results suitable for writing as JSON.
+    """
+    results: dict[str, Any] = {}
+    for scenario in scenarios:
+        results[scenario.name] = await run_scenario(scenario)
+    return {
+        "textual_version": __version__,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "render_threads": get_render_threads(),
+        "numpy": None if numpy is None else numpy.__version__,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "results": results,
+    }
+
+
+# Metrics compared when checking for regressions, and whether higher values are better.
+COMPARED_METRICS: dict[str, bool] = {
+    "duration_s": False,
+    "fps": True,
+    "render_update.mean_ms": False,
+    "layout.mean_ms": False,
+    "memory_per_widget_bytes": False,
+    "bytes_per_frame": False,
+}
+
+
+def _get_metric(result: dict[str, Any], metric: str) -> float | None:
+    """Get a (possibly nested) metric from a result."""
+    value: Any = result
+    for key in metric.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return float(value)
+
+
+def compare_results(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> tuple[list[str], list[str]]:
+    """Compare results with a baseline.
+
+    Args:
+        baseline: Previous results (as written by `run_scenarios`).
+        current: New results.
+        threshold: Relative change (e.g. 0.1 for 10%) above which a metric is a regression.
+
+    Returns:
+        A tuple of report lines, and regression descriptions.
+    """
+    report: list[str] = []
+    regressions: list[str] = []
+    baseline_results = baseline.get("results", {})
+    for name, result in current["results"].items():
+        if name not in baseline_results:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old = _get_metric(baseline_results[name], metric)
+            new = _get_metric(result, metric)
+            if old is None or new is None or not old:
+                continue
+            change = (new - old) / old
+            line = f"{name:<24} {metric:<26} {old:>12.3f} {new:>12.3f} {change:>+8.1%}"
+            report.append(line)
+            worse = -change if higher_is_better else change
+            if worse > threshold:
+                regressions.append(line)
+    return report, regressions
+
+
+def load_results(path: str) -> dict[str, Any]:
+    """Load results from a JSON file.
+
+    Args:
+        path: Path to JSON.
+
+    Returns:
+        Results.
+    """
+    with open(path, encoding="utf-8") as results_file:
+        return json.load(results_file)
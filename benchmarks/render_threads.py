@@ -0,0 +1,65 @@
+"""
+Measures how rendering scales with the number of render threads.
+
+Runs the `pane_repaint` scenario (whose panes enable `PARALLEL_RENDER`) in a subprocess for
+each number of threads, and reports the mean time of `Compositor.render_update`, and the
+speedup compared to the first number of threads.
+
+```
+python -m benchmarks.render_threads
+python -m benchmarks.render_threads 1 2 4 8 16
+```
+
+Threads are only expected to make rendering faster on a free-threaded build of Python.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+THREAD_COUNTS = [1, 2, 4, 8]
+SCENARIO = "pane_repaint"
+
+
+def run_pane_repaint(threads: int) -> dict:
+    """Run the scenario with a number of render threads.
+
+    Args:
+        threads: Value of `TEXTUAL_RENDER_THREADS`.
+
+    Returns:
+        The results written by the benchmark suite.
+    """
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks", SCENARIO],
+        env={**os.environ, "TEXTUAL_RENDER_THREADS": str(threads)},
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    thread_counts = [int(threads) for threads in sys.argv[1:]] or THREAD_COUNTS
+    results: dict[str, dict[str, float]] = {}
+    environment: dict = {}
+    single_thread_ms: float | None = None
+    for threads in thread_counts:
+        run = run_pane_repaint(threads)
+        environment = {key: run[key] for key in ("python", "cpu_count", "gil_enabled")}
+        mean_ms = run["results"][SCENARIO]["render_update"]["mean_ms"]
+        if single_thread_ms is None:
+            single_thread_ms = mean_ms
+        results[str(threads)] = {
+            "render_update_mean_ms": mean_ms,
+            "speedup": single_thread_ms / mean_ms if mean_ms else 0.0,
+        }
+    print(json.dumps({**environment, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
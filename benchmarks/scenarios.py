@@ -0,0 +1,273 @@
+"""
+Benchmark scenarios.
+
+Each scenario is an app factory, and a coroutine function which drives the app.
+Only the time spent in the coroutine function is measured.
+"""
+
+from __future__ import annotations
+
+from rich.segment import Segment
+from rich.style import Style
+
+from textual.app import App, ComposeResult
+from textual.containers import Grid, VerticalScroll
+from textual.pilot import Pilot
+from textual.screen import ModalScreen
+from textual.strip import Strip
+from textual.virtual import VirtualScroll
+from textual.widget import Widget
+from textual.widgets import DataTable, Label, Log, Static, TextArea, Tree
+
+from benchmarks._harness import scenario
+
+
+class DataTableApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield DataTable()
+
+    def on_mount(self) -> None:
+        table = self.query_one(DataTable)
+        table.add_columns("ID", "Name", "Value", "Status", "Notes")
+        table.add_rows(
+            (
+                row,
+                f"Row {row}",
+                row * 3.14,
+                "OK" if row % 3 else "FAIL",
+                "-" * (row % 20),
+            )
+            for row in range(10_000)
+        )
+        table.focus()
+
+
+@scenario("datatable_scroll", DataTableApp)
+async def datatable_scroll(pilot: Pilot) -> None:
+    """Scroll through a 10,000 row DataTable."""
+    for _ in range(20):
+        await pilot.press("pagedown")
+    for _ in range(50):
+        await pilot.press("down")
+    await pilot.press("end")
+    await pilot.press("home")
+
+
+class LogApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield Log()
+
+
+@scenario("log_tailing", LogApp)
+async def log_tailing(pilot: Pilot) -> None:
+    """Write lines to a Log, in batches, while tailing."""
+    log = pilot.app.query_one(Log)
+    for batch in range(100):
+        log.write_lines(
+            f"{batch:04d}:{line:04d} Lorem ipsum dolor sit amet, consectetur adipiscing elit"
+            for line in range(100)
+        )
+        await pilot.pause()
+
+
+class TextAreaApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield TextArea(
+            "\n".join(
+                f"{line_no:05d} The quick brown fox jumps over the lazy dog."
+                for line_no in range(10_000)
+            )
+        )
+
+    def on_mount(self) -> None:
+        text_area = self.query_one(TextArea)
+        text_area.focus()
+        text_area.move_cursor((5_000, 0), center=True)
+
+
+@scenario("text_area_typing", TextAreaApp)
+async def text_area_typing(pilot: Pilot) -> None:
+    """Type in the middle of a 10,000 line TextArea."""
+    for _ in range(5):
+        await pilot.press(*"Hello, World! ")
+        await pilot.press("enter")
+
+
+class TreeApp(App[None]):
+    def compose(self) -> ComposeResult:
+        tree: Tree[None] = Tree("root")
+
+        def add_children(node, depth: int) -> None:
+            if depth == 0:
+                return
+            for index in range(4):
+                child = node.add(f"depth {depth} node {index}")
+                add_children(child, depth - 1)
+
+        add_children(tree.root, 6)
+        yield tree
+
+    def on_mount(self) -> None:
+        self.query_one(Tree).focus()
+
+
+@scenario("tree_expansion", TreeApp)
+async def tree_expansion(pilot: Pilot) -> None:
+    """Expand a deep Tree, and move the cursor through it."""
+    tree = pilot.app.query_one(Tree)
+    tree.root.expand_all()
+    await pilot.pause()
+    for _ in range(20):
+        await pilot.press("pagedown")
+    tree.root.collapse_all()
+    await pilot.pause()
+
+
+class VerticalScrollApp(App[None]):
+    def compose(self) -> ComposeResult:
+        with VerticalScroll():
+            for index in range(1000):
+                yield Label(f"Label number {index}")
+
+    def on_mount(self) -> None:
+        self.query_one(VerticalScroll).focus()
+
+
+@scenario("vertical_scroll_1000", VerticalScrollApp)
+async def vertical_scroll(pilot: Pilot) -> None:
+    """Scroll a VerticalScroll containing 1000 widgets."""
+    for _ in range(10):
+        await pilot.press("pagedown")
+    await pilot.press("home")
+    for _ in range(20):
+        await pilot.press("down")
+
+
+class VirtualScrollApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield VirtualScroll(
+            100_000,
+            lambda index: Label(f"Label number {index}"),
+            update_item=lambda label, index: label.update(f"Label number {index}"),
+        )
+
+    def on_mount(self) -> None:
+        self.query_one(VirtualScroll).focus()
+
+
+@scenario("virtual_scroll_100k", VirtualScrollApp)
+async def virtual_scroll(pilot: Pilot) -> None:
+    """Scroll a VirtualScroll with 100,000 items."""
+    for _ in range(10):
+        await pilot.press("pagedown")
+    await pilot.press("end")
+    await pilot.press("home")
+    for _ in range(20):
+        await pilot.press("down")
+
+
+@scenario("command_palette", App)
+async def command_palette(pilot: Pilot) -> None:
+    """Open the command palette, and type a query."""
+    await pilot.press("ctrl+p")
+    await pilot.pause()
+    await pilot.press(*"theme")
+    await pilot.pause(0.1)
+    for _ in range(5):
+        await pilot.press("backspace")
+    await pilot.press(*"quit")
+    await pilot.pause(0.1)
+    await pilot.press("escape")
+
+
+class Pane(Static):
+    """A static which may be rendered in parallel (with `TEXTUAL_RENDER_THREADS` > 1)."""
+
+    PARALLEL_RENDER = True
+
+
+class PanesApp(App[None]):
+    CSS = """
+    Grid { grid-size: 8 6; }
+    Pane { border: round $primary; padding: 0 1; height: 1fr; }
+    """
+
+    def compose(self) -> ComposeResult:
+        with Grid():
+            for pane in range(48):
+                yield Pane(
+                    "\n".join(
+                        f"Pane {pane} line {line}: lorem ipsum dolor sit amet"
+                        for line in range(20)
+                    )
+                )
+
+
+@scenario("pane_repaint", PanesApp, size=(300, 100))
+async def pane_repaint(pilot: Pilot) -> None:
+    """Repaint 48 panes on a 300x100 screen, by switching themes and resizing."""
+    for theme in ["nord", "gruvbox", "textual-light", "textual-dark"] * 2:
+        pilot.app.theme = theme
+        await pilot.pause()
+    for width in (280, 300):
+        await pilot.resize_terminal(width, 100)
+        await pilot.pause()
+
+
+class Gradient(Widget):
+    """A widget with a distinct background color in every cell."""
+
+    STYLES = [
+        [Style(bgcolor=f"#{x:02x}{y * 4:02x}80") for x in range(256)] for y in range(64)
+    ]
+
+    def render_line(self, y: int) -> Strip:
+        styles = self.STYLES[y % 64]
+        return Strip([Segment(" ", styles[x % 256]) for x in range(self.size.width)])
+
+
+class TintedGradientApp(App[None]):
+    CSS = "Gradient { tint: $primary 20%; }"
+
+    def compose(self) -> ComposeResult:
+        yield Gradient()
+
+
+@scenario("tinted_gradient", TintedGradientApp, size=(200, 60))
+async def tinted_gradient(pilot: Pilot) -> None:
+    """Repaint a tinted gradient with 12,000 distinct colors."""
+    gradient = pilot.app.query_one(Gradient)
+    for theme in ["nord", "textual-dark"]:
+        pilot.app.theme = theme
+        await pilot.pause()
+        for _ in range(5):
+            gradient.refresh()
+            await pilot.pause()
+
+
+class Dialog(ModalScreen[None]):
+    CSS = "Dialog { align: center middle; } Dialog > Label { border: round $primary; }"
+
+    def compose(self) -> ComposeResult:
+        yield Label("Working...")
+
+
+class ModalApp(App[None]):
+    def compose(self) -> ComposeResult:
+        for line in range(50):
+            yield Static(
+                f"[b]Line {line}[/b] " + "lorem [i]ipsum[/i] dolor sit amet " * 6
+            )
+
+    def on_mount(self) -> None:
+        self.push_screen(Dialog())
+
+
+@scenario("modal_backdrop", ModalApp, size=(200, 60))
+async def modal_backdrop(pilot: Pilot) -> None:
+    """Update the contents of a modal screen, over a tinted background."""
+    for index in range(20):
+        await pilot.app.screen.mount(Label(f"Step {index}"))
+        await pilot.pause()
+        await pilot.app.screen.query(Label).last().remove()
+        await pilot.pause()
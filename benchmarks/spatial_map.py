@@ -0,0 +1,70 @@
+"""
+Micro-benchmark for spatial maps.
+
+Measures the cost of inserting children of a tall vertical container in to each type of
+spatial map, and the cost of querying the visible children (as happens when scrolling).
+
+```
+python -m benchmarks.spatial_map
+```
+"""
+
+from __future__ import annotations
+
+import json
+from time import perf_counter
+
+from textual._spatial_map import SpatialMap, VerticalSpatialMap
+from textual.geometry import NULL_OFFSET, Region
+
+SPATIAL_MAPS = {"grid": SpatialMap, "vertical": VerticalSpatialMap}
+CHILD_COUNTS = [10_000, 100_000]
+VIEWPORT = Region(0, 0, 120, 40)
+QUERY_COUNT = 1000
+
+
+def bench_spatial_map(name: str, child_count: int) -> dict[str, float]:
+    """Benchmark a spatial map with children stacked vertically.
+
+    Args:
+        name: Name of spatial map (key in `SPATIAL_MAPS`).
+        child_count: Number of children.
+
+    Returns:
+        Timings in milliseconds.
+    """
+    # Children are 3 lines high, with varying widths
+    regions_and_values = [
+        (Region(0, index * 3, 40 + index % 80, 3), NULL_OFFSET, False, False, index)
+        for index in range(child_count)
+    ]
+    start = perf_counter()
+    spatial_map = SPATIAL_MAPS[name]()
+    spatial_map.insert(regions_and_values)
+    insert_time = perf_counter() - start
+
+    total_height = child_count * 3
+    step = max(1, (total_height - VIEWPORT.height) // QUERY_COUNT)
+    queries = [VIEWPORT.translate((0, y)) for y in range(0, total_height, step)]
+    start = perf_counter()
+    for query in queries:
+        spatial_map.get_values_in_region(query)
+    query_time = perf_counter() - start
+
+    return {
+        "insert_ms": insert_time * 1000,
+        "query_us": query_time / len(queries) * 1_000_000,
+    }
+
+
+def main() -> None:
+    results = {
+        f"{name}_{child_count}": bench_spatial_map(name, child_count)
+        for child_count in CHILD_COUNTS
+        for name in SPATIAL_MAPS
+    }
+    print(json.dumps({"results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
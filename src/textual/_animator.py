@@ -223,12 +223,13 @@ class BoundAnimator:
 class Animator:
     """An object to manage updates to a given attribute over a period of time."""
 
-    def __init__(self, app: App, frames_per_second: int = 60) -> None:
+    def __init__(self, app: App) -> None:
         """Initialise the animator object.
 
+        Animations are advanced once per frame by the app's frame clock.
+
         Args:
             app: The application that owns the animator.
-            frames_per_second: The number of frames/second to run the animation at.
         """
         self._animations: dict[AnimationKey, Animation] = {}
         """Dictionary that maps animation keys to the corresponding animation instances."""
@@ -236,13 +237,6 @@ class Animator:
         """Dictionary of scheduled animations, comprising of their keys and the timer objects."""
         self.app = app
         """The app that owns the animator object."""
-        self._timer = Timer(
-            app,
-            1 / frames_per_second,
-            name="Animator",
-            callback=self,
-            pause=True,
-        )
 
     @cached_property
     def _idle_event(self) -> asyncio.Event:
@@ -255,20 +249,16 @@ class Animator:
         return asyncio.Event()
 
     async def start(self) -> None:
-        """Start the animator task."""
+        """Start the animator."""
         self._idle_event.set()
         self._complete_event.set()
-        self._timer._start()
+        if self._animations:
+            self.app._frame_clock.request_animation_frame()
 
     async def stop(self) -> None:
-        """Stop the animator task."""
-        try:
-            self._timer.stop()
-        except asyncio.CancelledError:
-            pass
-        finally:
-            self._idle_event.set()
-            self._complete_event.set()
+        """Stop the animator."""
+        self._idle_event.set()
+        self._complete_event.set()
 
     def bind(self, obj: object) -> BoundAnimator:
         """Bind the animator to a given object.
@@ -461,7 +451,7 @@ class Animator:
                 self.app.call_later(on_complete)
 
         self._animations[animation_key] = animation
-        self._timer.resume()
+        self.app._frame_clock.request_animation_frame()
         self._idle_event.clear()
         self._complete_event.clear()
 
@@ -554,8 +544,8 @@ class Animator:
             animation.on_complete()
 
     def __call__(self) -> None:
+        """Advance animations (called by the frame clock)."""
         if not self._animations:
-            self._timer.pause()
             self._idle_event.set()
             if not self._scheduled:
                 self._complete_event.set()
@@ -570,14 +560,16 @@ class Animator:
                     del self._animations[animation_key]
                     if animation.on_complete is not None:
                         animation.on_complete()
+            # Request another frame, which will also set the idle event if complete
+            self.app._frame_clock.request_animation_frame()
 
     def _get_time(self) -> float:
-        """Get the current wall clock time, via the internal Timer.
+        """Get the current wall clock time.
 
         Returns:
             The wall clock time.
         """
-        # N.B. We could remove this method and always call `self._timer.get_time()` internally,
+        # N.B. We could remove this method and always call `_time.get_time()` internally,
         # but it's handy to have in mocking situations.
         return _time.get_time()
 
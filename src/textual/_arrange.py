@@ -121,7 +121,9 @@ def arrange(
             WidgetPlacement.apply_absolute(layout_placements)
             placements.extend(layout_placements)
 
-    return DockArrangeResult(placements, set(display_widgets), scroll_spacing)
+    return DockArrangeResult(
+        placements, set(display_widgets), scroll_spacing, widget.SPATIAL_INDEX
+    )
 
 
 def _arrange_dock_widgets(
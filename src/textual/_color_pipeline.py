@@ -0,0 +1,243 @@
+"""
+Batched color transformations, used by the line filters and tints.
+
+Transforming styles one segment at a time, with an `lru_cache` per operation, performs poorly
+when a screen contains more distinct colors than fit in the caches (gradients, heatmaps, tinted
+screens). Here, the styles in a list of segments are deduplicated, the styles which aren't in a
+[StyleCache][textual._color_pipeline.StyleCache] are transformed together, and the colors in
+those styles are blended in a single batch (with NumPy, if it is installed).
+
+The size of the caches may be set with the `TEXTUAL_COLOR_CACHE_SIZE` environment variable.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Hashable, Iterable, List, Sequence, Tuple
+
+from rich.color import Color as RichColor
+from rich.color import ColorTriplet
+from rich.style import Style
+
+from textual.color import Color
+from textual.constants import COLOR_CACHE_SIZE
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+RGB = Tuple[int, int, int]
+"""Red, green, and blue components."""
+
+NUMPY_MIN_COLORS = 64
+"""Minimum number of colors to blend with NumPy (Python is faster for fewer colors)."""
+
+StyleTransform = Callable[..., List[Style]]
+"""A callable which transforms a list of styles (with additional arguments)."""
+
+
+def blend_rgb(
+    colors: Sequence[RGB],
+    destinations: Sequence[RGB],
+    factor: float | Sequence[float],
+) -> list[RGB]:
+    """Blend a number of colors towards destination colors.
+
+    This is equivalent to [Color.blend][textual.color.Color.blend] for each pair of colors:
+    components are truncated to integers.
+
+    Args:
+        colors: Colors to blend from.
+        destinations: Colors to blend to, one per color.
+        factor: A blend factor, 0 -> 1, or a blend factor per color.
+
+    Returns:
+        Blended colors.
+    """
+    if numpy is not None and len(colors) >= NUMPY_MIN_COLORS:
+        start = numpy.array(colors, dtype=numpy.int64)
+        end = numpy.array(destinations, dtype=numpy.int64)
+        factors = (
+            factor
+            if isinstance(factor, (int, float))
+            else numpy.array(factor, dtype=numpy.float64)[:, numpy.newaxis]
+        )
+        blended = (start + (end - start) * factors).astype(numpy.int64)
+        return [(red, green, blue) for red, green, blue in blended.tolist()]
+    if isinstance(factor, (int, float)):
+        return [
+            (
+                int(red1 + (red2 - red1) * factor),
+                int(green1 + (green2 - green1) * factor),
+                int(blue1 + (blue2 - blue1) * factor),
+            )
+            for (red1, green1, blue1), (red2, green2, blue2) in zip(
+                colors, destinations
+            )
+        ]
+    return [
+        (
+            int(red1 + (red2 - red1) * color_factor),
+            int(green1 + (green2 - green1) * color_factor),
+            int(blue1 + (blue2 - blue1) * color_factor),
+        )
+        for (red1, green1, blue1), (red2, green2, blue2), color_factor in zip(
+            colors, destinations, factor
+        )
+    ]
+
+
+def blend_rich_colors(
+    colors: Sequence[RichColor],
+    destinations: Sequence[RichColor],
+    factor: float | Sequence[float],
+) -> list[RichColor]:
+    """Blend a number of Rich colors towards destination Rich colors.
+
+    Colors must have RGB triplets (i.e. not be ANSI colors).
+
+    Args:
+        colors: Colors to blend from.
+        destinations: Colors to blend to, one per color.
+        factor: A blend factor, 0 -> 1, or a blend factor per color.
+
+    Returns:
+        Blended truecolor colors.
+    """
+    from_triplet = RichColor.from_triplet
+    return [
+        from_triplet(ColorTriplet(*rgb))
+        for rgb in blend_rgb(
+            [color.triplet for color in colors],  # type: ignore[misc]
+            [color.triplet for color in destinations],  # type: ignore[misc]
+            factor,
+        )
+    ]
+
+
+def tint_rich_colors(colors: Sequence[RichColor], tint: Color) -> list[RichColor]:
+    """Tint a number of Rich colors.
+
+    This is equivalent to `(Color.from_rich_color(color) + tint).rich_color` for each color.
+
+    Args:
+        colors: Colors to tint.
+        tint: Color of tint (presumably with alpha).
+
+    Returns:
+        Tinted colors.
+    """
+    from_rich_color = Color.from_rich_color
+    if tint.auto or tint.ansi is not None or not 0 < tint.a < 1:
+        # Edge cases which don't blend RGB components
+        return [(from_rich_color(color) + tint).rich_color for color in colors]
+    from_triplet = RichColor.from_triplet
+    return [
+        from_triplet(ColorTriplet(*rgb))
+        for rgb in blend_rgb(
+            [
+                from_rich_color(color).rgb if color.triplet is None else color.triplet
+                for color in colors
+            ],
+            [tint.rgb] * len(colors),
+            tint.a,
+        )
+    ]
+
+
+def tint_styles(styles: Sequence[Style], tint: Color) -> list[Style]:
+    """Tint the foreground and background colors of a number of styles.
+
+    Args:
+        styles: Styles to tint.
+        tint: Color of tint (presumably with alpha).
+
+    Returns:
+        Tinted styles.
+    """
+    colors: list[RichColor] = []
+    add_color = colors.append
+    for style in styles:
+        if style.color is not None:
+            add_color(style.color)
+        if style.bgcolor is not None:
+            add_color(style.bgcolor)
+    tinted_colors = iter(tint_rich_colors(colors, tint))
+    style_from_color = Style.from_color
+    return [
+        style
+        + style_from_color(
+            None if style.color is None else next(tinted_colors),
+            None if style.bgcolor is None else next(tinted_colors),
+        )
+        for style in styles
+    ]
+
+
+class StyleCache:
+    """A cache of transformed styles, which transforms missing styles in batches.
+
+    When the cache is full, it is cleared. This is cheaper than discarding styles one at a time,
+    and the working set is typically the styles on screen, which will be cached again.
+    """
+
+    def __init__(self, maxsize: int = COLOR_CACHE_SIZE) -> None:
+        """
+        Args:
+            maxsize: Maximum number of transformed styles to cache.
+        """
+        self.maxsize = maxsize
+        """Maximum number of transformed styles to cache."""
+        self.hits = 0
+        """Number of styles which were found in the cache."""
+        self.misses = 0
+        """Number of styles which were transformed."""
+        self._styles: dict[tuple[Style, tuple[Hashable, ...]], Style] = {}
+
+    def __len__(self) -> int:
+        return len(self._styles)
+
+    def __repr__(self) -> str:
+        return f"<StyleCache size={len(self)} maxsize={self.maxsize} hits={self.hits} misses={self.misses}>"
+
+    @property
+    def hit_rate(self) -> float:
+        """Proportion of styles which were found in the cache (0 if nothing was looked up)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        self._styles.clear()
+
+    def map_styles(
+        self, styles: Iterable[Style], transform: StyleTransform, *args: Hashable
+    ) -> dict[Style, Style]:
+        """Transform a number of styles, using cached styles where possible.
+
+        Args:
+            styles: Styles to transform (duplicates are transformed once).
+            transform: A callable which transforms a list of styles (with `args`).
+            *args: Additional arguments for `transform`, which are part of the cache key.
+
+        Returns:
+            A mapping of the original styles on to transformed styles.
+        """
+        cached_styles = self._styles
+        get_style = cached_styles.get
+        mapping: dict[Style, Style] = {}
+        missing: list[Style] = []
+        for style in dict.fromkeys(styles):
+            if (transformed_style := get_style((style, args))) is None:
+                missing.append(style)
+            else:
+                mapping[style] = transformed_style
+        self.hits += len(mapping)
+        if missing:
+            self.misses += len(missing)
+            if len(cached_styles) + len(missing) > self.maxsize:
+                cached_styles.clear()
+            for style, transformed_style in zip(missing, transform(missing, *args)):
+                mapping[style] = transformed_style
+                cached_styles[(style, args)] = transformed_style
+        return mapping
@@ -12,6 +12,10 @@ without having to render the entire screen.
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from contextvars import copy_context
+from functools import lru_cache
+from itertools import accumulate
 from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
@@ -33,6 +37,8 @@ from textual import errors
 from textual._cells import cell_len
 from textual._context import visible_screen_stack
 from textual._loop import loop_last
+from textual._render_pool import MIN_PARALLEL_RENDERS, get_render_pool
+from textual._sgr import SGREncoder
 from textual.geometry import NULL_SPACING, Offset, Region, Size, Spacing
 from textual.map_geometry import MapGeometry
 from textual.strip import Strip, StripRenderable
@@ -50,12 +56,38 @@ class ReflowResult(NamedTuple):
     hidden: set[Widget]  # Widgets that are hidden
     shown: set[Widget]  # Widgets that are shown
     resized: set[Widget]  # Widgets that have been resized
+    # Widgets and geometry (in layer order) that were arranged, or `None` for all widgets
+    arranged: list[tuple[Widget, MapGeometry]] | None = None
 
 
+# Painting order of widgets with `overlay: screen`
+OVERLAY_ORDER = (1, 0, 0)
+
 # Maps a widget on to its geometry (information that describes its position in the composition)
 CompositorMap: TypeAlias = "dict[Widget, MapGeometry]"
 
 
+@lru_cache(maxsize=None)
+def _can_render_in_thread(widget_type: type[Widget]) -> bool:
+    """Check if a widget may be rendered in a thread, in parallel with other widgets.
+
+    Widgets must declare that they are thread-safe with `PARALLEL_RENDER`. Widgets which
+    override `render_line` or `render_lines` may update their state (or create widgets)
+    as they render, so they are always rendered on the event loop's thread.
+
+    Args:
+        widget_type: The type of a widget.
+
+    Returns:
+        `True` if the widget may be rendered in a thread.
+    """
+    return (
+        widget_type.PARALLEL_RENDER
+        and widget_type.render_line is Widget.render_line
+        and widget_type.render_lines is Widget.render_lines
+    )
+
+
 class CompositorUpdate:
     """An update generated by the compositor, which also doubles as console renderables."""
 
@@ -104,13 +136,17 @@ class LayoutUpdate(CompositorUpdate):
         sequences: list[str] = []
         append = sequences.append
         extend = sequences.extend
+        encoder = SGREncoder(console)
+        encode = encoder.encode
         x = self.region.x
         move_to = Control.move_to
         for last, (y, line) in loop_last(enumerate(self.strips, self.region.y)):
             append(move_to(x, y).segment.text)
-            extend([strip.render(console) for strip in line])
+            for strip in line:
+                extend(encode(strip))
             if not last:
                 append("\n")
+        append(encoder.finish())
         return "".join(sequences)
 
     def __rich_repr__(self) -> rich.repr.Result:
@@ -121,9 +157,24 @@ class LayoutUpdate(CompositorUpdate):
 class InlineUpdate(CompositorUpdate):
     """A renderable to write an inline update."""
 
-    def __init__(self, strips: list[Strip], clear: bool = False) -> None:
+    def __init__(
+        self,
+        strips: list[Strip],
+        clear: bool = False,
+        size: Size | None = None,
+        lines: list[int] | None = None,
+    ) -> None:
+        """
+        Args:
+            strips: Strips for every line of the inline area.
+            clear: Also clear below the inline update (set when size decreases).
+            size: Size of the inline area.
+            lines: Indices of the lines to write, or `None` to write every line.
+        """
         self.strips = strips
         self.clear = clear
+        self.size = size
+        self.lines = lines
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
@@ -145,10 +196,29 @@ class InlineUpdate(CompositorUpdate):
         """
         sequences: list[str] = []
         append = sequences.append
+        extend = sequences.extend
+        encoder = SGREncoder(console)
+        if self.lines is not None:
+            # Partial update; move the cursor (relative to the top of the inline area)
+            # to each changed line. The size hasn't changed, so there is no need to
+            # query the cursor position.
+            cursor_y = 0
+            for y in self.lines:
+                if y > cursor_y:
+                    append(f"\x1b[{y - cursor_y}B")
+                append("\r")
+                extend(encoder.encode(self.strips[y]))
+                cursor_y = y
+            append(encoder.finish())
+            if cursor_y:
+                append(f"\x1b[{cursor_y}A")
+            append("\r")
+            return "".join(sequences)
         for last, strip in loop_last(self.strips):
-            append(strip.render(console))
+            extend(encoder.encode(strip))
             if not last:
                 append("\n")
+        append(encoder.finish())
         if self.clear:
             if len(self.strips) > 1:
                 append("\n")
@@ -243,6 +313,9 @@ class ChopsUpdate(CompositorUpdate):
         """
         sequences: list[str] = []
         append = sequences.append
+        extend = sequences.extend
+        encoder = SGREncoder(console)
+        encode = encoder.encode
 
         move_to = Control.move_to
         chops = self.chops
@@ -261,16 +334,17 @@ class ChopsUpdate(CompositorUpdate):
 
                 if x2 > x >= x1 and end <= x2:
                     append(move_to(x, y).segment.text)
-                    append(strip.render(console))
+                    extend(encode(strip))
                     continue
 
                 strip = strip.crop(0, min(end, x2) - x)
                 append(move_to(x, y).segment.text)
-                append(strip.render(console))
+                extend(encode(strip))
 
             if y != last_y:
                 append("\n")
 
+        append(encoder.finish())
         terminal_sequences = "".join(sequences)
         return terminal_sequences
 
@@ -308,6 +382,15 @@ class Compositor:
         # Regions that require an update
         self._dirty_regions: set[Region] = set()
 
+        # Incremented when the composition changes (used to cache renders of the screen)
+        self.version = 0
+
+        # Maps widgets on to their region, and a map of line number on to the end
+        # offsets and styles of the segments in that line (used by get_style_at)
+        self._style_map: dict[
+            Widget, tuple[Region, dict[int, tuple[list[int], list[Style | None]]]]
+        ] = {}
+
         # Mapping of line numbers on to lists of widget and regions
         self._layers_visible: list[list[tuple[Widget, Region, Region]]] | None = None
 
@@ -319,6 +402,7 @@ class Compositor:
         self.widgets.clear()
         self._visible_widgets = None
         self._layers_visible = None
+        self._style_map.clear()
 
     @classmethod
     def _regions_to_spans(
@@ -362,21 +446,42 @@ class Compositor:
         yield "size", self.size
         yield "widgets", self.widgets
 
-    def reflow(self, parent: Widget, size: Size) -> ReflowResult:
+    def reflow(
+        self,
+        parent: Widget,
+        size: Size,
+        layout_roots: Iterable[Widget] | None = None,
+    ) -> ReflowResult:
         """Reflow (layout) widget and its children.
 
+        If `layout_roots` is given, only those widgets (and their descendants) will be
+        arranged, providing the full map is up to date. Otherwise every widget is arranged.
+
         Args:
             parent: The root widget.
             size: Size of the area to be filled.
+            layout_roots: Containers whose layout changed, but whose size did not,
+                or `None` to arrange everything.
 
         Returns:
             Hidden, shown, and resized widgets.
         """
+        if (
+            layout_roots is not None
+            and parent is self.root
+            and size == self.size
+            and not self._full_map_invalidated
+        ):
+            reflow_result = self._reflow_subtrees(parent, size, layout_roots)
+            if reflow_result is not None:
+                return reflow_result
+
         self._cuts = None
         self._layers = None
         self._layers_visible = None
         self._visible_widgets = None
         self._visible_map = None
+        self._style_map.clear()
         self.root = parent
         self.size = size
 
@@ -396,6 +501,7 @@ class Compositor:
 
         # Replace map and widgets
         self._full_map = map
+        self._full_map_invalidated = False
         self.widgets = widgets
 
         # Contains widgets + geometry for every widget that changed (added, removed, or updated)
@@ -405,6 +511,8 @@ class Compositor:
         common_widgets = old_widgets & new_widgets
 
         # Mark dirty regions.
+        if changes:
+            self.version += 1
         screen_region = size.region
         if screen_region not in self._dirty_regions:
             regions = {
@@ -428,6 +536,133 @@ class Compositor:
             resized=resized_widgets,
         )
 
+    def _reflow_subtrees(
+        self, parent: Widget, size: Size, layout_roots: Iterable[Widget]
+    ) -> ReflowResult | None:
+        """Arrange the given containers only, and splice the results in to the full map.
+
+        Args:
+            parent: The root widget.
+            size: Size of the area to be filled.
+            layout_roots: Containers to arrange.
+
+        Returns:
+            Hidden, shown, and resized widgets, or `None` if a full reflow is required.
+        """
+        old_map = self._full_map
+        roots = set(layout_roots)
+        if not roots or parent in roots:
+            return None
+
+        subtrees: list[tuple[Widget, MapGeometry]] = []
+        for root in roots:
+            if any(ancestor in roots for ancestor in root.ancestors):
+                # Arranged as part of another root
+                continue
+            geometry = old_map.get(root)
+            if (
+                geometry is None
+                or root._render_widget is not root
+                or len(geometry.order) < 2
+                or geometry.order[0] == OVERLAY_ORDER
+            ):
+                # Not in the map, loading, or in an overlay: can't be arranged in isolation.
+                return None
+            subtrees.append((root, geometry))
+
+        # Geometry in the map is ordered by its position in the tree,
+        # so every widget in a subtree has an order which begins with the order of the root.
+        root_orders = [
+            (len(geometry.order), geometry.order) for _, geometry in subtrees
+        ]
+
+        def in_subtree(widget: Widget, order: tuple[tuple[int, int, int], ...]) -> bool:
+            """Check if a widget in the (old) map was placed by one of the roots."""
+            if order[0] == OVERLAY_ORDER:
+                # Overlays are placed at the top level, so the order doesn't tell us the parent.
+                return widget._parent is None or any(
+                    ancestor in roots for ancestor in widget.ancestors
+                )
+            for order_length, root_order in root_orders:
+                if order[:order_length] == root_order:
+                    return True
+            return False
+
+        old_subtree_map = {
+            widget: geometry
+            for widget, geometry in old_map.items()
+            if in_subtree(widget, geometry.order)
+        }
+
+        subtree_map, subtree_widgets = self._arrange_root(
+            parent, size, visible_only=False, subtrees=subtrees
+        )
+
+        self._cuts = None
+        self._layers = None
+        self._layers_visible = None
+        self._visible_widgets = None
+        self._visible_map = None
+        self._style_map.clear()
+
+        # Widgets that were previously arranged within the roots.
+        old_subtree_widgets = {
+            widget
+            for widget in self.widgets
+            if widget in old_subtree_map
+            or (
+                widget not in old_map
+                and (
+                    widget._parent is None
+                    or any(ancestor in roots for ancestor in widget.ancestors)
+                )
+            )
+        }
+
+        map = {
+            widget: geometry
+            for widget, geometry in old_map.items()
+            if widget not in old_subtree_map
+        }
+        map.update(subtree_map)
+        self._full_map = map
+        self.widgets = (self.widgets - old_subtree_widgets) | subtree_widgets
+
+        changes = subtree_map.items() ^ old_subtree_map.items()
+
+        if changes:
+            self.version += 1
+        screen_region = size.region
+        if screen_region not in self._dirty_regions:
+            regions = {
+                region
+                for region in (
+                    map_geometry.clip.intersection(map_geometry.region)
+                    for _, map_geometry in changes
+                )
+                if region
+            }
+            self._dirty_regions.update(regions)
+
+        common_widgets = old_subtree_map.keys() & subtree_map.keys()
+        resized_widgets = {
+            widget
+            for widget, (region, *_) in changes
+            if (
+                widget in common_widgets
+                and old_subtree_map[widget].region.size != region.size
+            )
+        }
+        arranged = sorted(
+            subtree_map.items(), key=lambda item: item[1].order, reverse=True
+        )
+        return ReflowResult(
+            hidden=old_subtree_widgets - subtree_widgets,
+            shown=subtree_map.keys() - old_map.keys(),
+            resized=resized_widgets,
+            arranged=arranged,
+        )
+
     def reflow_visible(self, parent: Widget, size: Size) -> set[Widget]:
         """Reflow only the visible children.
 
@@ -462,6 +697,8 @@ class Compositor:
         changes = map.items() ^ old_map.items()
 
         # Mark dirty regions.
+        if changes:
+            self.version += 1
         screen_region = size.region
         if screen_region not in self._dirty_regions:
             regions = {
@@ -523,7 +760,11 @@ class Compositor:
         return self._visible_widgets
 
     def _arrange_root(
-        self, root: Widget, size: Size, visible_only: bool = True
+        self,
+        root: Widget,
+        size: Size,
+        visible_only: bool = True,
+        subtrees: Iterable[tuple[Widget, MapGeometry]] | None = None,
     ) -> tuple[CompositorMap, set[Widget]]:
         """Arrange a widget's children based on its layout attribute.
 
@@ -531,6 +772,8 @@ class Compositor:
             root: Top level widget.
             size: Size of visible area (screen).
             visible_only: Only update visible widgets (used in scrolling).
+            subtrees: Widgets (and their existing geometry) to arrange in place of the root,
+                or `None` to arrange from the root.
 
         Returns:
             Compositor map and set of widgets.
@@ -682,7 +925,7 @@ class Compositor:
                                 sub_widget,
                                 sub_region,
                                 widget_region,
-                                ((1, 0, 0),) if overlay else widget_order,
+                                (OVERLAY_ORDER,) if overlay else widget_order,
                                 layer_order,
                                 no_clip if overlay else sub_clip,
                                 visible,
@@ -740,17 +983,39 @@ class Compositor:
                     dock_gutter,
                 )
 
-        # Add top level (root) widget
-        add_widget(
-            root,
-            size.region,
-            size.region,
-            ((0, 0, 0),),
-            layer_order,
-            size.region,
-            True,
-            NULL_SPACING,
-        )
+        if subtrees is None:
+            # Add top level (root) widget
+            add_widget(
+                root,
+                size.region,
+                size.region,
+                ((0, 0, 0),),
+                layer_order,
+                size.region,
+                True,
+                NULL_SPACING,
+            )
+        else:
+            # Re-arrange widgets at their existing location
+            for widget, (
+                region,
+                order,
+                clip,
+                _,
+                _,
+                virtual_region,
+                dock_gutter,
+            ) in subtrees:
+                add_widget(
+                    widget,
+                    virtual_region,
+                    region,
+                    order,
+                    order[-1][2],
+                    clip,
+                    True,
+                    dock_gutter,
+                )
         widgets -= invisible_widgets
         return map, widgets
 
@@ -883,18 +1148,25 @@ class Compositor:
         x -= region.x
         y -= region.y
 
-        visible_screen_stack.set(widget.app._background_screens)
-        lines = widget.render_lines(Region(0, y, region.width, 1))
-
-        if not lines:
-            return Style.null()
-        end = 0
-
-        for segment in lines[0]:
-            end += segment.cell_length
-            if x < end:
-                return segment.style or Style.null()
+        # The styles in a line are cached until the widget is updated or moved,
+        # so moving the mouse doesn't require the line to be rendered again
+        style_map = self._style_map.get(widget)
+        if style_map is None or style_map[0] != region:
+            style_map = self._style_map[widget] = (region, {})
+        line_styles = style_map[1]
+        if (segment_styles := line_styles.get(y)) is None:
+            visible_screen_stack.set(widget.app._background_screens)
+            lines = widget.render_lines(Region(0, y, region.width, 1))
+            segments = list(lines[0]) if lines else []
+            segment_styles = line_styles[y] = (
+                list(accumulate(segment.cell_length for segment in segments)),
+                [segment.style for segment in segments],
+            )
 
+        ends, styles = segment_styles
+        index = bisect_right(ends, x)
+        if index < len(styles):
+            return styles[index] or Style.null()
         return Style.null()
 
     def get_widget_and_offset_at(
@@ -1063,36 +1335,51 @@ class Compositor:
         intersection = _Region.intersection
         contains_region = _Region.contains_region
 
+        renders: list[tuple[Widget, Region, Region, Region]] = []
+        add_render = renders.append
         for widget, region, clip in widget_regions:
             if contains_region(clip, region):
-                yield (
-                    region,
-                    clip,
-                    widget.render_lines(
-                        _Region(
-                            0,
-                            0,
-                            region.width,
-                            region.height,
-                        )
-                    ),
+                add_render(
+                    (widget, region, clip, _Region(0, 0, region.width, region.height))
                 )
             else:
                 new_x, new_y, new_width, new_height = intersection(region, clip)
                 if new_width and new_height:
-                    yield (
-                        region,
-                        clip,
-                        widget.render_lines(
+                    add_render(
+                        (
+                            widget,
+                            region,
+                            clip,
                             _Region(
                                 new_x - region.x,
                                 new_y - region.y,
                                 new_width,
                                 new_height,
-                            )
-                        ),
+                            ),
+                        )
                     )
 
+        if len(renders) >= MIN_PARALLEL_RENDERS and (render_pool := get_render_pool()):
+            # Widgets render independently, so may be rendered in parallel.
+            # Results are returned in the original (layer) order.
+            context = copy_context()
+            submit = render_pool.submit
+            futures = [
+                (
+                    submit(context.copy().run, widget.render_lines, crop)
+                    if _can_render_in_thread(type(widget))
+                    else None
+                )
+                for widget, _region, _clip, crop in renders
+            ]
+            for (widget, region, clip, crop), future in zip(renders, futures):
+                yield region, clip, (
+                    widget.render_lines(crop) if future is None else future.result()
+                )
+        else:
+            for widget, region, clip, crop in renders:
+                yield region, clip, widget.render_lines(crop)
+
     def render_update(
         self,
         full: bool = False,
@@ -1122,20 +1409,36 @@ class Compositor:
         size: Size,
         screen_stack: list[Screen] | None = None,
         clear: bool = False,
-    ) -> RenderableType:
+        previous_update: InlineUpdate | None = None,
+    ) -> InlineUpdate | None:
         """Render an inline update.
 
+        If the previous update (i.e. what is currently in the terminal) is the same size,
+        only the lines which have changed will be written.
+
         Args:
             size: Inline size.
             screen_stack: Screen stack list. Defaults to None.
             clear: Also clear below the inline update (set when size decreases).
+            previous_update: The previous inline update, or `None` to write every line.
 
         Returns:
-            A renderable.
+            An inline update, or `None` if there are no changes.
         """
         visible_screen_stack.set([] if screen_stack is None else screen_stack)
         strips = self.render_strips(size)
-        return InlineUpdate(strips, clear=clear)
+        if previous_update is not None and previous_update.size == size and not clear:
+            lines = [
+                y
+                for y, (strip, previous_strip) in enumerate(
+                    zip(strips, previous_update.strips)
+                )
+                if strip != previous_strip
+            ]
+            if not lines:
+                return None
+            return InlineUpdate(strips, size=size, lines=lines)
+        return InlineUpdate(strips, clear=clear, size=size)
 
     def render_full_update(self, simplify: bool = False) -> LayoutUpdate:
         """Render a full update.
@@ -1258,6 +1561,11 @@ class Compositor:
         ):
             self._full_map_invalidated = True
 
+        style_map = self._style_map
+        if style_map:
+            for widget in widgets:
+                style_map.pop(widget, None)
+
         regions: list[Region] = []
         add_region = regions.append
         get_widget = self.visible_widgets.__getitem__
@@ -1269,4 +1577,6 @@ class Compositor:
                 if update_region := intersection(dirty_region.translate(offset)):
                     add_region(update_region)
 
+        if regions:
+            self.version += 1
         self._dirty_regions.update(regions)
@@ -0,0 +1,233 @@
+"""
+The order in which widgets receive focus.
+
+Widgets are focused depth first, with siblings sorted by their position. Sorting depends on
+the layout, and the structure depends on the DOM, so a `FocusOrder` is built once and reused
+until either changes. Whether a widget may receive focus right now (it may be disabled, hidden,
+or refuse focus) is checked only when the chain is requested, or when moving focus.
+"""
+
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, cast
+
+if TYPE_CHECKING:
+    from textual.dom import DOMNode
+    from textual.widget import Widget
+
+
+class FocusOrder:
+    """Displayed widgets in focus order, with the extent of each widget's descendants."""
+
+    def __init__(self, root: DOMNode, updates: int) -> None:
+        """
+        Args:
+            root: Root node (typically a screen).
+            updates: The value of the root node's `_nodes._updates` when built.
+        """
+        self.root = root
+        self.updates = updates
+        self.widgets: list[Widget] = []
+        """Widgets in focus order."""
+        self.ends: list[int] = []
+        """Index after the last descendant of each widget."""
+        self.indexes: dict[Widget, int] = {}
+        """Maps widgets on to their index."""
+        self._build()
+
+    def _build(self) -> None:
+        """Build the focus order."""
+        focus_sorter = attrgetter("_focus_sort_key")
+        widgets = self.widgets
+        ends = self.ends
+        add_widget = widgets.append
+        add_end = ends.append
+        node_stack: list[Iterator[Widget]] = [
+            iter(sorted(self.root.displayed_children, key=focus_sorter))
+        ]
+        # Indices of the widgets whose children are on the node stack
+        open_indexes: list[int] = []
+        while node_stack:
+            node = next(node_stack[-1], None)
+            if node is None:
+                node_stack.pop()
+                if open_indexes:
+                    ends[open_indexes.pop()] = len(widgets)
+                continue
+            index = len(widgets)
+            add_widget(node)
+            add_end(index + 1)
+            if children := node.displayed_children:
+                node_stack.append(iter(sorted(children, key=focus_sorter)))
+                open_indexes.append(index)
+        self.indexes = {widget: index for index, widget in enumerate(widgets)}
+
+    def get_range(self, node: DOMNode) -> range:
+        """Get the range of indices covered by the descendants of a node.
+
+        Args:
+            node: A node, which may be the root.
+
+        Returns:
+            A range of indices (empty if the node isn't displayed).
+        """
+        if node is self.root:
+            return range(len(self.widgets))
+        index = self.indexes.get(node)  # type: ignore[call-overload]
+        if index is None:
+            return range(0)
+        return range(index + 1, self.ends[index])
+
+    def get_chain(self, root: DOMNode, visible: bool) -> list[Widget]:
+        """Get the widgets which may currently receive focus.
+
+        Args:
+            root: Root of the chain (the screen, or a widget which traps focus).
+            visible: Visibility of the root.
+
+        Returns:
+            A list of widgets in focus order.
+        """
+        widgets = self.widgets
+        ends = self.ends
+        chain: list[Widget] = []
+        add_widget = chain.append
+        index_range = self.get_range(root)
+        index = index_range.start
+        end = index_range.stop
+        # End indices and visibility of the open containers
+        parent_stack: list[tuple[int, bool]] = []
+        while index < end:
+            while parent_stack and index >= parent_stack[-1][0]:
+                parent_stack.pop()
+            node = widgets[index]
+            if node._check_disabled():
+                index = ends[index]
+                continue
+            node_styles_visibility = node.styles.get_rule("visibility")
+            node_is_visible = (
+                node_styles_visibility != "hidden"
+                if node_styles_visibility
+                else (parent_stack[-1][1] if parent_stack else visible)
+            )
+            if node.is_container and node.allow_focus_children():
+                parent_stack.append((ends[index], node_is_visible))
+                next_index = index + 1
+            else:
+                next_index = ends[index]
+            if node_is_visible and node.allow_focus():
+                add_widget(node)
+            index = next_index
+        return chain
+
+    def _check_focusable(
+        self, index: int, root: DOMNode, visible: bool
+    ) -> tuple[bool, int | None]:
+        """Check if the widget at the given index may currently receive focus.
+
+        Args:
+            index: Index of widget.
+            root: Root of the chain.
+            visible: Visibility of the root.
+
+        Returns:
+            A tuple of whether the widget may be focused, and the index of the outermost
+                ancestor which prevents its descendants from being focused (or `None`).
+        """
+        widget = self.widgets[index]
+        blocking_ancestor: Widget | None = None
+        visibility: str | None = None
+        node: Widget | None = widget
+        while node is not None and node is not root:
+            if node._check_disabled() or (
+                node is not widget
+                and not (node.is_container and node.allow_focus_children())
+            ):
+                blocking_ancestor = node
+            if visibility is None:
+                visibility = cast("str | None", node.styles.get_rule("visibility"))
+            # Every ancestor below the root is a widget
+            node = cast("Widget | None", node._parent)
+        if blocking_ancestor is not None:
+            return False, self.indexes[blocking_ancestor]
+        is_visible = visibility != "hidden" if visibility else visible
+        return is_visible and widget.allow_focus(), None
+
+    def is_focusable(self, index: int, root: DOMNode, visible: bool) -> bool:
+        """Check if the widget at the given index may currently receive focus.
+
+        Args:
+            index: Index of widget.
+            root: Root of the chain.
+            visible: Visibility of the root.
+
+        Returns:
+            `True` if the widget may be focused.
+        """
+        return self._check_focusable(index, root, visible)[0]
+
+    def iter_focusable(
+        self,
+        root: DOMNode,
+        visible: bool,
+        index_range: range,
+        start: int,
+        direction: int,
+    ) -> Iterable[Widget]:
+        """Iterate over the widgets which may currently receive focus, from a starting index.
+
+        Iteration wraps around the range, and ends before returning to the start.
+
+        Args:
+            root: Root of the chain.
+            visible: Visibility of the root.
+            index_range: Range of indices to consider.
+            start: Index to start from (not included).
+            direction: 1 to iterate forward, or -1 to iterate backward.
+
+        Returns:
+            An iterable of widgets.
+        """
+        ends = self.ends
+        first = index_range.start
+        length = len(index_range)
+        check_focusable = self._check_focusable
+        step = 1
+        while step <= length:
+            index = first + (start - first + direction * step) % length
+            focusable, blocking_index = check_focusable(index, root, visible)
+            if focusable:
+                yield self.widgets[index]
+            elif blocking_index is not None and direction > 0:
+                # Skip the descendants of a widget which blocks focus
+                step += max(0, ends[blocking_index] - index - 1)
+            step += 1
+
+    def find(
+        self,
+        root: DOMNode,
+        visible: bool,
+        index_range: range,
+        start: int,
+        direction: int = 1,
+        predicate: Callable[[Widget], bool] | None = None,
+    ) -> Widget | None:
+        """Find the next widget which may receive focus, and matches a predicate.
+
+        Args:
+            root: Root of the chain.
+            visible: Visibility of the root.
+            index_range: Range of indices to consider.
+            start: Index to start from (not included).
+            direction: 1 to search forward, or -1 to search backward.
+            predicate: Callable which returns `True` for a matching widget, or `None`
+                to match any widget.
+
+        Returns:
+            A widget, or `None` if no widget matches.
+        """
+        for widget in self.iter_focusable(root, visible, index_range, start, direction):
+            if predicate is None or predicate(widget):
+                return widget
+        return None
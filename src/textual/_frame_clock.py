@@ -0,0 +1,209 @@
+"""
+The frame clock schedules all the work required to produce a frame.
+
+Rather than the animator, each screen, and each widget with `auto_refresh` having independent
+timers, a single task wakes once per frame to advance animations, perform automatic refreshes,
+then layout and paint any screens which requested an update. When nothing has requested a
+frame, the clock sleeps until the next automatic refresh (if any).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from textual import _time, constants
+from textual._compat import cached_property
+
+if TYPE_CHECKING:
+    from textual.app import App
+    from textual.dom import DOMNode
+    from textual.screen import Screen
+
+MAX_FRAME_SKIP = 4
+"""Maximum number of frames to skip when output is backlogged."""
+MAX_OUTPUT_BACKLOG = 6
+"""Screen updates are deferred while there are at least this many writes waiting for output."""
+
+
+class FrameClock:
+    """Runs per-frame work for an app, from a single task."""
+
+    def __init__(self, app: App, frames_per_second: int = constants.MAX_FPS) -> None:
+        """
+        Args:
+            app: The app.
+            frames_per_second: Maximum number of frames per second.
+        """
+        self.app = app
+        self.frame_period = 1 / frames_per_second
+        """Minimum time between frames (when output isn't backlogged)."""
+        self.frame_count = 0
+        """Number of frames run."""
+        self._animate = False
+        """Should the animator be called on the next frame?"""
+        self._screens: dict[Screen, None] = {}
+        """Screens which requested an update on the next frame."""
+        self._auto_refresh: WeakKeyDictionary[DOMNode, tuple[float, float]] = (
+            WeakKeyDictionary()
+        )
+        """Maps nodes with an auto refresh on to the interval and time of the next refresh."""
+        self._last_frame_time = 0.0
+        self._task: asyncio.Task | None = None
+
+    @cached_property
+    def _wake(self) -> asyncio.Event:
+        """Set when a frame is requested."""
+        return asyncio.Event()
+
+    def start(self) -> None:
+        """Start the clock."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="frame clock")
+
+    async def stop(self) -> None:
+        """Stop the clock, and wait for the task to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def request_animation_frame(self) -> None:
+        """Request the animator is called on the next frame."""
+        self._animate = True
+        self._wake.set()
+
+    def request_update(self, screen: Screen) -> None:
+        """Request a screen is updated on the next frame.
+
+        Args:
+            screen: Screen to update.
+        """
+        self._screens[screen] = None
+        self._wake.set()
+
+    def discard_update(self, screen: Screen) -> None:
+        """Discard a request to update a screen (typically because it was updated already).
+
+        Args:
+            screen: A screen.
+        """
+        self._screens.pop(screen, None)
+
+    def set_auto_refresh(self, node: DOMNode, interval: float | None) -> None:
+        """Set (or clear) the automatic refresh interval for a node.
+
+        Args:
+            node: A DOM node.
+            interval: Time between refreshes, or `None` to disable automatic refresh.
+        """
+        if interval is None:
+            self._auto_refresh.pop(node, None)
+        else:
+            self._auto_refresh[node] = (interval, _time.get_time() + interval)
+            self._wake.set()
+
+    def get_frame_period(self) -> float:
+        """Get the time between frames, which increases when output is backlogged.
+
+        Returns:
+            Time in seconds.
+        """
+        return self.frame_period * (1 + min(self._get_output_backlog(), MAX_FRAME_SKIP))
+
+    def _get_output_backlog(self) -> int:
+        """Get the number of writes waiting to be sent to the output device.
+
+        Returns:
+            Number of writes.
+        """
+        driver = self.app._driver
+        return 0 if driver is None else driver.output_backlog
+
+    def _get_sleep_time(self) -> float | None:
+        """Get the time until the next automatic refresh.
+
+        Returns:
+            Time in seconds, or `None` if there are no automatic refreshes.
+        """
+        if not self._auto_refresh:
+            return None
+        next_refresh = min(due for _, due in self._auto_refresh.values())
+        return max(0.0, next_refresh - _time.get_time())
+
+    async def _run(self) -> None:
+        """Run frames as they are requested."""
+        wake: asyncio.Event = self._wake
+        get_time = _time.get_time
+        # The first frame is a frame period after it was requested
+        await wake.wait()
+        self._last_frame_time = get_time()
+        while True:
+            if not (self._animate or self._screens):
+                sleep_time = self._get_sleep_time()
+                if sleep_time is None:
+                    await wake.wait()
+                elif sleep_time:
+                    # Not `asyncio.wait_for`, which may swallow a cancellation (Python < 3.12)
+                    timer_handle = asyncio.get_running_loop().call_later(
+                        sleep_time, wake.set
+                    )
+                    try:
+                        await wake.wait()
+                    finally:
+                        timer_handle.cancel()
+            wake.clear()
+            next_frame_time = self._last_frame_time + self.get_frame_period()
+            if (delay := next_frame_time - get_time()) > 0:
+                await _time.sleep(delay)
+            self._last_frame_time = get_time()
+            if not self.app._exit:
+                self._run_frame()
+
+    def _run_frame(self) -> None:
+        """Advance animations, perform automatic refreshes, and update screens."""
+        app = self.app
+        self.frame_count += 1
+
+        if self._animate:
+            self._animate = False
+            try:
+                app.animator()
+            except Exception as error:
+                app._handle_exception(error)
+
+        if self._auto_refresh:
+            now = _time.get_time()
+            for node, (interval, due) in list(self._auto_refresh.items()):
+                if node._closed:
+                    del self._auto_refresh[node]
+                    continue
+                if due > now:
+                    continue
+                # Skip refreshes which couldn't be run in time
+                due += interval
+                self._auto_refresh[node] = (
+                    interval,
+                    due if due > now else now + interval,
+                )
+                with node._context():
+                    try:
+                        node.automatic_refresh()
+                    except Exception as error:
+                        app._handle_exception(error)
+
+        if self._screens and self._get_output_backlog() < MAX_OUTPUT_BACKLOG:
+            # If the output is backlogged, screens remain pending, and their
+            # dirty regions are combined in to a later (more up to date) frame.
+            screens = list(self._screens)
+            self._screens.clear()
+            for screen in screens:
+                with screen._context():
+                    try:
+                        screen._on_timer_update()
+                    except Exception as error:
+                        app._handle_exception(error)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+
+class PrefixSum:
+    """A sequence of non-negative integers, with efficient prefix sums.
+
+    Values are stored in a Fenwick (binary indexed) tree, so that updating a value,
+    calculating the sum of the values before an index, and finding the index which
+    contains a given offset, are all O(log n).
+
+    Typically used to map between the index of an item, and the line on which it starts.
+    """
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        """
+        Args:
+            values: Initial values.
+        """
+        self._values: list[int] = list(values)
+        self._tree: list[int] = [0, *self._values]
+        tree = self._tree
+        size = len(self._values)
+        for index in range(1, size + 1):
+            parent = index + (index & -index)
+            if parent <= size:
+                tree[parent] += tree[index]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> int:
+        return self._values[index]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._values)
+
+    def __setitem__(self, index: int, value: int) -> None:
+        values = self._values
+        if index < 0:
+            index += len(values)
+        delta = value - values[index]
+        if not delta:
+            return
+        values[index] = value
+        tree = self._tree
+        size = len(values)
+        index += 1
+        while index <= size:
+            tree[index] += delta
+            index += index & -index
+
+    def __repr__(self) -> str:
+        return f"PrefixSum({self._values!r})"
+
+    @property
+    def total(self) -> int:
+        """The sum of all values."""
+        return self.offset(len(self._values))
+
+    def append(self, value: int) -> None:
+        """Append a value.
+
+        Args:
+            value: Value to append.
+        """
+        self._values.append(value)
+        index = len(self._values)
+        # The new node covers the values from index - lowbit(index) to index
+        self._tree.append(
+            value + self.offset(index - 1) - self.offset(index - (index & -index))
+        )
+
+    def extend(self, values: Iterable[int]) -> None:
+        """Append a number of values.
+
+        Args:
+            values: Values to append.
+        """
+        for value in values:
+            self.append(value)
+
+    def offset(self, index: int) -> int:
+        """Get the sum of the values prior to the given index.
+
+        Args:
+            index: Index of a value.
+
+        Returns:
+            Sum of `values[:index]`.
+        """
+        tree = self._tree
+        index = min(index, len(self._values))
+        total = 0
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+    def find(self, offset: int) -> int:
+        """Find the index of the value which contains an offset.
+
+        Args:
+            offset: An offset (e.g. a line number).
+
+        Returns:
+            Index `i` where `offset(i) <= offset < offset(i + 1)`, or the length
+                of the sequence if the offset is beyond the total.
+        """
+        if offset < 0:
+            return 0
+        tree = self._tree
+        size = len(self._values)
+        position = 0
+        step = 1 << size.bit_length()
+        while step:
+            next_position = position + step
+            if next_position <= size and tree[next_position] <= offset:
+                position = next_position
+                offset -= tree[next_position]
+            step >>= 1
+        return position
@@ -3,47 +3,118 @@ from __future__ import annotations
 import asyncio
 from asyncio import Event
 from collections import deque
-from typing import Generic, TypeVar
+from typing import Callable, Generic, Hashable, TypeVar
 
 QueueType = TypeVar("QueueType")
 
+BACKGROUND_INTERVAL = 20
+"""Maximum number of values read from the main lane, while values wait in the background lane."""
+
 
 class Queue(Generic[QueueType]):
     """A cut-down version of asyncio.Queue
 
     This has just enough functionality to run the message pumps.
 
+    Values may be put in a background lane, which is read when the main lane is empty, or
+    after `BACKGROUND_INTERVAL` values from the main lane (so it can't be starved).
+    Values with a coalesce key replace any value with the same key waiting in the queue,
+    and take its place in the queue.
+
     """
 
     def __init__(self) -> None:
-        self.values: deque[QueueType] = deque()
+        self.values: deque[list] = deque()
+        """Entries in the main lane, as `[value, coalesce_key]`."""
+        self.background_values: deque[list] = deque()
+        """Entries in the background lane, as `[value, coalesce_key]`."""
         self.ready_event = Event()
+        self._size = 0
+        self._coalesce: dict[Hashable, list] = {}
+        """Maps coalesce keys on to the entry waiting in the queue."""
+        self.wake_callback: Callable[[], object] | None = None
+        """A callback to invoke (once) when the next value is put in the queue."""
+        self._main_count = 0
+        """Values read from the main lane, since the background lane was last read."""
+
+    def put_nowait(
+        self,
+        value: QueueType,
+        coalesce_key: Hashable | None = None,
+        background: bool = False,
+    ) -> None:
+        """Put a value in the queue.
 
-    def put_nowait(self, value: QueueType) -> None:
-        self.values.append(value)
+        Args:
+            value: Value to put.
+            coalesce_key: A key which identifies values this value supersedes, or `None`
+                to never replace other values.
+            background: Put the value in the background lane.
+        """
+        coalesce = self._coalesce
+        if coalesce_key is not None and (entry := coalesce.get(coalesce_key)):
+            # Replace the waiting value, so it is processed in the original's position
+            entry[0] = value
+        else:
+            entry = [value, coalesce_key]
+            if coalesce_key is not None:
+                coalesce[coalesce_key] = entry
+            if background:
+                self.background_values.append(entry)
+            else:
+                self.values.append(entry)
+            self._size += 1
         self.ready_event.set()
+        if (wake_callback := self.wake_callback) is not None:
+            self.wake_callback = None
+            wake_callback()
+
+    def put_last_nowait(self, value: QueueType) -> None:
+        """Put a value in the main lane, behind every value in the queue (including values
+        in the background lane).
+
+        Args:
+            value: Value to put.
+        """
+        self.values.extend(self.background_values)
+        self.background_values.clear()
+        self.put_nowait(value)
 
     def qsize(self) -> int:
-        return len(self.values)
+        return self._size
 
     def empty(self) -> bool:
-        return not self.values
+        return not self._size
 
     def task_done(self) -> None:
         pass
 
+    def _pop(self) -> QueueType:
+        """Remove and return the next value (the queue must not be empty)."""
+        values = self.values
+        background_values = self.background_values
+        if background_values and (
+            not values or self._main_count >= BACKGROUND_INTERVAL
+        ):
+            value, coalesce_key = background_values.popleft()
+            self._main_count = 0
+        else:
+            value, coalesce_key = values.popleft()
+            if background_values:
+                self._main_count += 1
+        if coalesce_key is not None:
+            del self._coalesce[coalesce_key]
+        self._size -= 1
+        if not self._size:
+            self.ready_event.clear()
+        return value
+
     async def get(self) -> QueueType:
         if not self.ready_event.is_set():
             await self.ready_event.wait()
-        value = self.values.popleft()
-        if not self.values:
-            self.ready_event.clear()
-        return value
+        return self._pop()
 
     def get_nowait(self) -> QueueType:
-        if not self.values:
+        if not self._size:
             raise asyncio.QueueEmpty()
-        value = self.values.popleft()
-        if not self.values:
-            self.ready_event.clear()
-        return value
+        return self._pop()
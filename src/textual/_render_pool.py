@@ -0,0 +1,39 @@
+"""
+A thread pool used to render independent widgets in parallel.
+
+Rendering a widget is pure Python, so threads only help on a free-threaded build of Python
+(with no GIL). The pool is only created if the `TEXTUAL_RENDER_THREADS` environment variable
+is set to more than 1, and is only used for widgets which enable `PARALLEL_RENDER`.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from textual import constants
+
+MIN_PARALLEL_RENDERS = 4
+"""The minimum number of widgets to render, before rendering in parallel."""
+
+
+def get_render_threads() -> int:
+    """Get the number of threads to render with.
+
+    Returns:
+        Number of threads, where 1 means render on the calling thread.
+    """
+    return constants.RENDER_THREADS
+
+
+@lru_cache(maxsize=1)
+def get_render_pool() -> ThreadPoolExecutor | None:
+    """Get the thread pool to render widgets with.
+
+    Returns:
+        A thread pool, or `None` if widgets should be rendered on the calling thread.
+    """
+    threads = get_render_threads()
+    if threads <= 1:
+        return None
+    return ThreadPoolExecutor(threads, thread_name_prefix="textual-render")
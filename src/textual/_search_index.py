@@ -0,0 +1,78 @@
+"""
+Case-insensitive substring search over a list of strings.
+
+Text is lowercased once, when it is added to the index. Searches are narrowed incrementally:
+as a query grows (e.g. with each key press), only the strings which matched the previous query
+are searched.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+
+class SearchIndex:
+    """An index of strings which may be searched for a substring."""
+
+    def __init__(self, texts: Iterable[str | None] = ()) -> None:
+        """
+        Args:
+            texts: Strings to index, or `None` for entries which never match.
+        """
+        self.texts: list[str | None] = []
+        """Lowercased strings."""
+        self._history: list[tuple[str, list[int]]] = []
+        """Previous queries, and their matches, in order of increasing length."""
+        self.extend(texts)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def extend(self, texts: Iterable[str | None]) -> None:
+        """Add strings to the index.
+
+        Args:
+            texts: Strings to add, or `None` for entries which never match.
+        """
+        start = len(self.texts)
+        self.texts.extend([None if text is None else text.lower() for text in texts])
+        new_texts = self.texts[start:]
+        for query, matches in self._history:
+            matches.extend(
+                [
+                    index
+                    for index, text in enumerate(new_texts, start)
+                    if text is not None and query in text
+                ]
+            )
+
+    def search(self, query: str) -> list[int]:
+        """Find the strings which contain a query.
+
+        Args:
+            query: Substring to search for (case-insensitive).
+
+        Returns:
+            The indices of matching strings, in ascending order.
+        """
+        query = query.lower()
+        texts = self.texts
+        if not query:
+            return [index for index, text in enumerate(texts) if text is not None]
+        history = self._history
+        # Discard queries which aren't contained in this query
+        while history and history[-1][0] not in query:
+            history.pop()
+        if history:
+            previous_query, candidates = history[-1]
+            if previous_query == query:
+                return candidates
+            matches = [index for index in candidates if query in texts[index]]  # type: ignore[operator]
+        else:
+            matches = [
+                index
+                for index, text in enumerate(texts)
+                if text is not None and query in text
+            ]
+        history.append((query, matches))
+        return matches
@@ -0,0 +1,176 @@
+"""
+Encodes strips as terminal sequences, with minimal changes to SGR (Select Graphic Rendition) state.
+
+Rendering each segment in isolation (as [Strip.render][textual.strip.Strip.render] does)
+sets every attribute and color, then resets, for every segment. An `SGREncoder` tracks
+the state of the terminal for the duration of an update, and writes only the codes
+required to get from the current style to the next.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import NamedTuple
+
+from rich.color import ColorSystem
+from rich.console import Console
+
+from textual.strip import Strip
+
+RESET = "\x1b[0m"
+LINK_CLOSE = "\x1b]8;;\x1b\\"
+
+
+class SGRState(NamedTuple):
+    """SGR state parsed from the codes generated by `Strip.render_ansi`."""
+
+    attributes: tuple[str, ...]
+    """Attribute codes (bold, italic etc)."""
+    foreground: str
+    """Foreground color codes, or empty string for default."""
+    background: str
+    """Background color codes, or empty string for default."""
+
+
+@lru_cache(maxsize=4096)
+def parse_sgr(ansi: str) -> SGRState:
+    """Parse the SGR parameters generated by `Strip.render_ansi`.
+
+    Args:
+        ansi: SGR parameters separated by semicolons (without the escape sequence).
+
+    Returns:
+        The SGR state.
+    """
+    attributes: list[str] = []
+    foreground = background = ""
+    codes = ansi.split(";") if ansi else []
+    index = 0
+    while index < len(codes):
+        code = codes[index]
+        if code in ("38", "48"):
+            # Extended color: 5;n (8-bit), or 2;r;g;b (truecolor)
+            length = 3 if codes[index + 1] == "5" else 5
+            color = ";".join(codes[index : index + length])
+            index += length
+            if code == "38":
+                foreground = color
+            else:
+                background = color
+            continue
+        value = int(code)
+        if 30 <= value <= 39 or 90 <= value <= 97:
+            foreground = code
+        elif 40 <= value <= 49 or 100 <= value <= 107:
+            background = code
+        else:
+            attributes.append(code)
+        index += 1
+    return SGRState(tuple(attributes), foreground, background)
+
+
+@lru_cache(maxsize=4096)
+def get_sgr_delta(previous: str, ansi: str) -> str:
+    """Get the escape sequence to change the terminal's SGR state.
+
+    Args:
+        previous: SGR parameters currently in effect.
+        ansi: Required SGR parameters.
+
+    Returns:
+        Escape sequence, which may be empty if there is no change.
+    """
+    if previous == ansi:
+        return ""
+    if not ansi:
+        return RESET
+    if not previous:
+        return f"\x1b[{ansi}m"
+    previous_state = parse_sgr(previous)
+    state = parse_sgr(ansi)
+    if not set(previous_state.attributes).issubset(state.attributes):
+        # There are individual codes to disable attributes, but they aren't
+        # symmetrical (bold and dim are disabled together), so reset
+        return f"\x1b[0;{ansi}m"
+    sgr = [code for code in state.attributes if code not in previous_state.attributes]
+    if state.foreground != previous_state.foreground:
+        sgr.append(state.foreground or "39")
+    if state.background != previous_state.background:
+        sgr.append(state.background or "49")
+    return f"\x1b[{';'.join(sgr)}m"
+
+
+class SGREncoder:
+    """Renders strips, while tracking the terminal's SGR and hyperlink state.
+
+    Call [finish][textual._sgr.SGREncoder.finish] after the last strip, so that the terminal
+    is left with the default style.
+    """
+
+    def __init__(self, console: Console) -> None:
+        """
+        Args:
+            console: Console instance.
+        """
+        self.color_system = console._color_system or ColorSystem.TRUECOLOR
+        self._ansi = ""
+        """SGR parameters currently in effect."""
+        self._link = ""
+        """URL of open hyperlink, or empty string for no link."""
+
+    def encode(self, strip: Strip) -> list[str]:
+        """Encode a strip.
+
+        Args:
+            strip: A strip.
+
+        Returns:
+            A list of text and escape sequences, to be joined.
+        """
+        output: list[str] = []
+        append = output.append
+        current_ansi = self._ansi
+        current_link = self._link
+        color_system = self.color_system
+        render_ansi = Strip.render_ansi
+        sgr_delta = get_sgr_delta
+        for text, style, _ in strip:
+            if style is None:
+                ansi = ""
+                link = ""
+            else:
+                ansi = (
+                    render_ansi(style, color_system)
+                    if style._ansi is None
+                    else style._ansi
+                )
+                link = style._link or ""
+            if link != current_link:
+                # Links are compared by URL, as combined styles have new link IDs
+                if current_link:
+                    append(LINK_CLOSE)
+                if link:
+                    append(f"\x1b]8;id={style._link_id};{link}\x1b\\")  # type: ignore[union-attr]
+                current_link = link
+            if ansi != current_ansi:
+                append(sgr_delta(current_ansi, ansi))
+                current_ansi = ansi
+            append(text)
+        self._ansi = current_ansi
+        self._link = current_link
+        return output
+
+    def finish(self) -> str:
+        """Close any open hyperlink, and reset the style.
+
+        Returns:
+            Escape sequences.
+        """
+        sequences = ""
+        if self._link:
+            sequences += LINK_CLOSE
+            self._link = ""
+        if self._ansi:
+            sequences += RESET
+            self._ansi = ""
+        return sequences
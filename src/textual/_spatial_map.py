@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from itertools import product
+from itertools import accumulate, product
+from operator import itemgetter
 from typing import Generic, Iterable, TypeVar
 
-from typing_extensions import TypeAlias
+from typing_extensions import Literal, TypeAlias
 
 from textual.geometry import Offset, Region
 
 ValueType = TypeVar("ValueType")
 GridCoordinate: TypeAlias = "tuple[int, int]"
+SpatialIndexType: TypeAlias = Literal["auto", "grid", "vertical"]
+"""The type of spatial index used to query a container's children.
+
+- `"grid"` buckets children in to a regular grid.
+- `"vertical"` indexes children by their vertical extent, which is best for tall containers.
+- `"auto"` picks one of the above based on the arrangement of the children.
+"""
 
 
 class SpatialMap(Generic[ValueType]):
@@ -101,3 +110,91 @@ class SpatialMap(Generic[ValueType]):
                 add_results(grid_values)
         unique_values = list(dict.fromkeys(results))
         return unique_values
+
+
+class VerticalSpatialMap(SpatialMap[ValueType]):
+    """A spatial map which indexes values by their vertical extent only.
+
+    Values are sorted by the top of their region, with a running maximum of the bottom of
+    their regions. The values under a given region may then be found with a binary search,
+    rather than visiting grid squares.
+
+    This is much faster than a grid for very tall arrangements (such as a vertical layout
+    with thousands of children), but will return more false positives if the values are
+    arranged horizontally.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Tuples of (TOP, BOTTOM, INSERT ORDER, VALUE), sorted by TOP
+        self._entries: list[tuple[int, int, int, ValueType]] = []
+        self._tops: list[int] = []
+        self._max_bottoms: list[int] = []
+
+    def insert(
+        self, regions_and_values: Iterable[tuple[Region, Offset, bool, bool, ValueType]]
+    ) -> None:
+        """Insert values into the Spatial map.
+
+        Values are associated with their region in Euclidean space, and a boolean that
+        indicates fixed regions. Fixed regions don't scroll and are always visible.
+
+        Args:
+            regions_and_values: An iterable of (REGION, OFFSET, FIXED, OVERLAY, VALUE).
+        """
+        append_fixed = self._fixed.append
+        entries = self._entries
+        append_entry = entries.append
+        # Track the bounds of the total region, rather than creating a region per value
+        total_x1, total_y1, total_x2, total_y2 = self.total_region.corners
+        insert_order = len(entries)
+        for region, offset, fixed, overlay, value in regions_and_values:
+            if fixed:
+                append_fixed(value)
+            else:
+                x, y, width, height = region
+                if not overlay:
+                    if x < total_x1:
+                        total_x1 = x
+                    if y < total_y1:
+                        total_y1 = y
+                    if x + width > total_x2:
+                        total_x2 = x + width
+                    if y + height > total_y2:
+                        total_y2 = y + height
+                y += offset.y
+                append_entry((y, y + height, insert_order, value))
+                insert_order += 1
+        self.total_region = Region.from_corners(total_x1, total_y1, total_x2, total_y2)
+        # Typically already sorted, which makes this cheap
+        entries.sort(key=itemgetter(0))
+        self._tops = [top for top, _, _, _ in entries]
+        self._max_bottoms = list(
+            accumulate((bottom for _, bottom, _, _ in entries), max)
+        )
+
+    def get_values_in_region(self, region: Region) -> list[ValueType]:
+        """Get a superset of all the values that intersect with a given region.
+
+        Note that this may return false positives.
+
+        Args:
+            region: A region.
+
+        Returns:
+            Values under the region.
+        """
+        _x, top, _width, height = region
+        bottom = top + height
+        # The first entry which may extend below the top of the region
+        start = bisect_right(self._max_bottoms, top)
+        # The first entry which starts below the bottom of the region
+        end = bisect_left(self._tops, bottom, start)
+        visible_entries = [
+            entry for entry in self._entries[start:end] if entry[1] > top
+        ]
+        # Return values in the order they were inserted (which is painting order)
+        visible_entries.sort(key=itemgetter(2))
+        results: list[ValueType] = self._fixed.copy()
+        results.extend([value for _, _, _, value in visible_entries])
+        return results
@@ -0,0 +1,121 @@
+"""
+Posts messages from other threads to the event loop, in batches.
+
+Waking the event loop from another thread is relatively expensive. Rather than scheduling a
+callback for every message, messages are added to a buffer, and the first message in a batch
+schedules a single callback to put all the buffered messages in their queues.
+
+Callbacks from threads (see [call_from_thread][textual.app.App.call_from_thread]) go through
+the same buffer, so that messages and callbacks from a thread are handled in the order they
+were made.
+
+If the event loop can't keep up, threads posting messages will block until the buffer is drained.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from threading import Event
+from typing import TYPE_CHECKING, Callable, Hashable, Tuple, Union
+
+if TYPE_CHECKING:
+    from textual.message import Message
+    from textual.message_pump import MessagePump
+
+MAX_PENDING = 10_000
+"""Maximum number of buffered messages, before posting threads block."""
+MAX_WAIT = 1.0
+"""Maximum time (in seconds) a thread will block, waiting for the buffer to drain."""
+
+PendingItem = Union[
+    Tuple["MessagePump", "Message", Union[Hashable, None], bool], Callable[[], object]
+]
+"""A message (with its pump, coalesce key, and lane), or a callback."""
+
+
+class ThreadMessages:
+    """A buffer of messages posted from threads other than the event loop's thread."""
+
+    def __init__(self, max_pending: int = MAX_PENDING) -> None:
+        """
+        Args:
+            max_pending: Maximum number of messages to buffer.
+        """
+        self.max_pending = max_pending
+        self._pending: deque[PendingItem] = deque()
+        self._scheduled = False
+        """Has a callback been scheduled to drain the buffer?"""
+        self._drained = Event()
+
+    def post(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        message_pump: MessagePump,
+        message: Message,
+        coalesce_key: Hashable | None = None,
+        background: bool = False,
+    ) -> None:
+        """Post a message from another thread.
+
+        Args:
+            loop: The event loop running the message pump.
+            message_pump: The message pump which will receive the message.
+            message: Message to post.
+            coalesce_key: The message's coalesce key.
+            background: Put the message in the background lane.
+        """
+        self._add(loop, (message_pump, message, coalesce_key, background))
+
+    def call(
+        self, loop: asyncio.AbstractEventLoop, callback: Callable[[], object]
+    ) -> None:
+        """Call a callback on the event loop, after any messages already posted.
+
+        Args:
+            loop: The event loop.
+            callback: A callable, which will be called from the event loop.
+        """
+        self._add(loop, callback)
+
+    def _add(self, loop: asyncio.AbstractEventLoop, item: PendingItem) -> None:
+        """Add an item to the buffer, and schedule a drain if required.
+
+        Args:
+            loop: The event loop.
+            item: A message tuple, or a callback.
+        """
+        pending = self._pending
+        if len(pending) >= self.max_pending:
+            self._drained.clear()
+            if len(pending) >= self.max_pending:
+                # The loop isn't keeping up, so wait for the buffer to drain. The wait is
+                # limited, in case the loop is blocked waiting for this thread.
+                self._drained.wait(MAX_WAIT)
+        pending.append(item)
+        if not self._scheduled:
+            self._scheduled = True
+            try:
+                loop.call_soon_threadsafe(self._drain)
+            except RuntimeError:
+                # Loop is closed
+                self._scheduled = False
+                raise
+
+    def _drain(self) -> None:
+        """Put buffered messages in their queues, and call buffered callbacks (called from the
+        event loop)."""
+        # Reset before draining, so that messages posted from here will schedule another drain.
+        self._scheduled = False
+        pending = self._pending
+        popleft = pending.popleft
+        for _ in range(len(pending)):
+            item = popleft()
+            if isinstance(item, tuple):
+                message_pump, message, coalesce_key, background = item
+                message_pump._message_queue.put_nowait(
+                    message, coalesce_key, background
+                )
+            else:
+                item()
+        self._drained.set()
@@ -76,17 +76,19 @@ from textual._ansi_sequences import SYNC_END, SYNC_START
 from textual._ansi_theme import ALABASTER, MONOKAI
 from textual._callback import invoke
 from textual._compat import cached_property
-from textual._compositor import CompositorUpdate
+from textual._compositor import CompositorUpdate, InlineUpdate
 from textual._context import active_app, active_message_pump
 from textual._context import message_hook as message_hook_context_var
 from textual._dispatch_key import dispatch_key
 from textual._event_broker import NoHandler, extract_handler_actions
 from textual._files import generate_datetime_filename
+from textual._frame_clock import FrameClock
 from textual._path import (
     CSSPathType,
     _css_path_type_as_list,
     _make_path_object_relative,
 )
+from textual._thread_messages import ThreadMessages
 from textual._types import AnimationLevel
 from textual._wait import wait_for_idle
 from textual.actions import ActionParseResult, SkipAction
@@ -650,6 +652,7 @@ class App(Generic[ReturnType], DOMNode):
         self._exit_renderables: list[RenderableType] = []
 
         self._action_targets = {"app", "screen", "focused"}
+        self._frame_clock = FrameClock(self)
         self._animator = Animator(self)
         self._animate = self._animator.bind(self)
 
@@ -740,6 +743,8 @@ class App(Generic[ReturnType], DOMNode):
         self._registry: WeakSet[DOMNode] = WeakSet()
 
         self._keymap: Keymap = {}
+        self._bindings_updates = 0
+        """Incremented when bindings (or the keymap) change, to invalidate cached binding chains."""
 
         # Sensitivity on X is double the sensitivity on Y to account for
         # cells being twice as tall as wide
@@ -771,6 +776,8 @@ class App(Generic[ReturnType], DOMNode):
                 self._devtools_redirector = StdoutRedirector(self.devtools)
 
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread_messages = ThreadMessages()
+        """Buffer of messages posted from other threads."""
         self._return_value: ReturnType | None = None
         """Internal attribute used to set the return value for the app."""
         self._return_code: int | None = None
@@ -850,6 +857,8 @@ class App(Generic[ReturnType], DOMNode):
 
         self._previous_inline_height: int | None = None
         """Size of previous inline update."""
+        self._previous_inline_update: InlineUpdate | None = None
+        """The previous inline update, used to write only changed lines."""
 
         self._resize_event: events.Resize | None = None
         """A pending resize event, sent on idle."""
@@ -1815,7 +1824,7 @@ class App(Generic[ReturnType], DOMNode):
             The result of the callback.
         """
 
-        if self._loop is None:
+        if (loop := self._loop) is None:
             raise RuntimeError("App is not running")
 
         if self._thread_id == threading.get_ident():
@@ -1824,15 +1833,24 @@ class App(Generic[ReturnType], DOMNode):
             )
 
         callback_with_args = partial(callback, *args, **kwargs)
+        future: Future[CallThreadReturnType] = Future()
 
-        async def run_callback() -> CallThreadReturnType:
+        async def run_callback() -> None:
             """Run the callback, set the result or error on the future."""
             with self._context():
-                return await invoke(callback_with_args)
-
-        # Post the message to the main loop
-        future: Future[CallThreadReturnType] = asyncio.run_coroutine_threadsafe(
-            run_callback(), loop=self._loop
+                try:
+                    future.set_result(await invoke(callback_with_args))
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as error:
+                    future.set_exception(error)
+
+        # A reference to the task, while this thread waits for the result
+        tasks: list[asyncio.Task[None]] = []
+        # Start the callback after any messages already posted from threads
+        self._thread_messages.call(
+            loop, lambda: tasks.append(asyncio.ensure_future(run_callback()))
         )
         result = future.result()
         return result
@@ -2009,6 +2027,7 @@ class App(Generic[ReturnType], DOMNode):
         self._bindings.bind(
             keys, action, description, show=show, key_display=key_display
         )
+        self._bindings_updates += 1
 
     def get_key_display(self, binding: Binding) -> str:
         """Format a bound key for display in footer / key panel etc.
@@ -3447,9 +3466,11 @@ class App(Generic[ReturnType], DOMNode):
                         self.stylesheet.apply(default_screen)
 
                     await self.animator.start()
+                    self._frame_clock.start()
 
                 except Exception:
                     await self.animator.stop()
+                    await self._frame_clock.stop()
                     raise
 
                 finally:
@@ -3466,6 +3487,7 @@ class App(Generic[ReturnType], DOMNode):
                 self._running = False
                 try:
                     await self.animator.stop()
+                    await self._frame_clock.stop()
                 finally:
                     await Timer._stop_all(self._timers)
 
@@ -3625,6 +3647,7 @@ class App(Generic[ReturnType], DOMNode):
         before: int | None = None,
         after: int | None = None,
         cache: dict[tuple, RulesMap] | None = None,
+        styled_rules_cache: dict[tuple, RulesMap] | None = None,
     ) -> list[Widget]:
         """Register widget(s) so they may receive events.
 
@@ -3634,6 +3657,7 @@ class App(Generic[ReturnType], DOMNode):
             before: A location to mount before.
             after: A location to mount after.
             cache: Optional rules map cache.
+            styled_rules_cache: Optional cache of rules as set on a widget.
 
         Returns:
             List of modified widgets.
@@ -3644,6 +3668,8 @@ class App(Generic[ReturnType], DOMNode):
 
         if cache is None:
             cache = {}
+        if styled_rules_cache is None:
+            styled_rules_cache = {}
         widget_list: Iterable[Widget]
         if before is not None or after is not None:
             # There's a before or after, which means there's going to be an
@@ -3666,9 +3692,14 @@ class App(Generic[ReturnType], DOMNode):
                 add_new_widget(widget)
                 self._register_child(parent, widget, before, after)
                 if widget._nodes:
-                    self._register(widget, *widget._nodes, cache=cache)
+                    self._register(
+                        widget,
+                        *widget._nodes,
+                        cache=cache,
+                        styled_rules_cache=styled_rules_cache,
+                    )
         for widget in new_widgets:
-            apply_stylesheet(widget, cache=cache)
+            apply_stylesheet(widget, cache=cache, styled_rules_cache=styled_rules_cache)
             widget._start_messages()
 
         if not self._running:
@@ -3789,6 +3820,9 @@ class App(Generic[ReturnType], DOMNode):
             self.call_next(self._check_recompose)
             return self
 
+        if repaint:
+            # Write every line of the next inline update
+            self._reset_inline_update()
         if self._screen_stack:
             self.screen.refresh(repaint=repaint, layout=layout)
         self.check_idle()
@@ -3837,6 +3871,17 @@ class App(Generic[ReturnType], DOMNode):
                 and not self.is_headless
                 and self._driver is not None
             ):
+                if (
+                    isinstance(renderable, CompositorUpdate)
+                    and not self._driver.is_inline
+                ):
+                    cursor_position = self.screen.outer_size.clamp_offset(
+                        self.cursor_position
+                    )
+                    if self._driver.write_update(renderable, cursor_position):
+                        self._previous_cursor_position = cursor_position
+                        self._driver.flush()
+                        return
                 console = self.console
                 self._begin_update()
                 try:
@@ -3853,6 +3898,8 @@ class App(Generic[ReturnType], DOMNode):
                                 terminal_sequence += Control.move(
                                     *cursor_position
                                 ).segment.text
+                                if isinstance(renderable, InlineUpdate):
+                                    self._previous_inline_update = renderable
                             else:
                                 terminal_sequence = renderable.render_segments(console)
                                 terminal_sequence += Control.move_to(
@@ -3889,6 +3936,34 @@ class App(Generic[ReturnType], DOMNode):
         finally:
             self.post_display_hook()
 
+    def _reset_inline_update(self) -> None:
+        """Forget the previous inline update, so that the next is written in full.
+
+        Called when the inline area in the terminal may no longer match the previous update.
+        """
+        self._previous_inline_update = None
+        self._previous_inline_height = None
+
+    def _update_inline_cursor(self) -> None:
+        """Move the cursor in inline mode, when there are no changed lines to write."""
+        if (
+            self._batch_count
+            or not self._running
+            or self._closed
+            or self.is_headless
+            or self._driver is None
+        ):
+            return
+        cursor_position = self.screen.outer_size.clamp_offset(self.cursor_position)
+        if cursor_position != self._previous_cursor_position:
+            self._driver.write(
+                Control.move(
+                    *(cursor_position - self._previous_cursor_position)
+                ).segment.text
+            )
+            self._previous_cursor_position = cursor_position
+            self._driver.flush()
+
     def post_display_hook(self) -> None:
         """Called immediately after a display is done. Used in tests."""
 
@@ -4022,6 +4097,7 @@ class App(Generic[ReturnType], DOMNode):
         """
 
         self._keymap = self._normalize_keymap(keymap)
+        self._bindings_updates += 1
         self.refresh_bindings()
 
     def update_keymap(self, keymap: Keymap) -> None:
@@ -4035,6 +4111,7 @@ class App(Generic[ReturnType], DOMNode):
         """
 
         self._keymap = {**self._keymap, **self._normalize_keymap(keymap)}
+        self._bindings_updates += 1
         self.refresh_bindings()
 
     def handle_bindings_clash(
@@ -4352,6 +4429,8 @@ class App(Generic[ReturnType], DOMNode):
         if self._size == event.size:
             return
         self._size = event.size
+        # The terminal may have reflowed the inline area
+        self._previous_inline_update = None
         if self._resize_timer is None:
             self._resize_timer = self.set_timer(1 / 120, self._check_resize)
 
@@ -4712,6 +4791,8 @@ class App(Generic[ReturnType], DOMNode):
     @on(Driver.SignalResume)
     def _resume_signal(self) -> None:
         """Signal that the application is being resumed from a suspension."""
+        # Other processes may have written over the inline area
+        self._reset_inline_update()
         self.app_resume_signal.publish(self)
 
     @contextmanager
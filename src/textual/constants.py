@@ -169,6 +169,19 @@ SMOOTH_SCROLL: Final[bool] = _get_environ_int("TEXTUAL_SMOOTH_SCROLL", 1) == 1
 """Should smooth scrolling be enabled? set `TEXTUAL_SMOOTH_SCROLL=0` to disable smooth scrolling.
 """
 
+RENDER_THREADS: Final[int] = _get_environ_int("TEXTUAL_RENDER_THREADS", 1, minimum=1)
+"""Number of threads used to render widgets in parallel.
+
+The default of 1 renders every widget on the event loop's thread. Set to more than 1 to
+render widgets which enable `PARALLEL_RENDER` in a pool of threads. This is only likely
+to be faster on a free-threaded build of Python (with no GIL).
+"""
+
+COLOR_CACHE_SIZE: Final[int] = _get_environ_int(
+    "TEXTUAL_COLOR_CACHE_SIZE", 16384, minimum=1
+)
+"""Maximum number of transformed styles cached by line filters and tints."""
+
 DIM_FACTOR: Final[float] = (
     _get_environ_int("TEXTUAL_DIM_FACTOR", 66, minimum=0, maximum=100) / 100
 )
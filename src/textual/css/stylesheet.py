@@ -473,6 +473,7 @@ class Stylesheet:
         *,
         animate: bool = False,
         cache: dict[tuple, RulesMap] | None = None,
+        styled_rules_cache: dict[tuple, RulesMap] | None = None,
     ) -> None:
         """Apply the stylesheet to a DOM node.
 
@@ -484,6 +485,8 @@ class Stylesheet:
                 rule will be applied.
             animate: Animate changed rules.
             cache: An optional cache when applying a group of nodes.
+            styled_rules_cache: An optional cache of the rules as set on a node (after
+                validation), used with `cache` to style new nodes in a group.
         """
         # Dictionary of rule attribute names e.g. "text_background" to list of tuples.
         # The tuples contain the rule specificity, and the value for that rule.
@@ -530,7 +533,17 @@ class Stylesheet:
             )
             cached_result: RulesMap | None = cache.get(cache_key)
             if cached_result is not None:
-                self.replace_rules(node, cached_result, animate=animate)
+                # Rules as set on a previous node, after validation by the style properties
+                if (
+                    styled_rules_cache is not None
+                    and (styled_rules := styled_rules_cache.get(cache_key)) is not None
+                    and not animate
+                    and not node._is_mounted
+                    and not node.styles.base._rules
+                ):
+                    self._set_unmounted_rules(node, styled_rules)
+                else:
+                    self.replace_rules(node, cached_result, animate=animate)
                 self._process_component_classes(node)
                 return
 
@@ -601,9 +614,11 @@ class Stylesheet:
                         rule_value = getattr(_DEFAULT_STYLES, initial_rule_name)
                     node_rules[initial_rule_name] = rule_value  # type: ignore[literal-required]
 
-            if cache_key is not None:
-                cache[cache_key] = node_rules
             self.replace_rules(node, node_rules, animate=animate)
+            if cache is not None and cache_key is not None:
+                cache[cache_key] = node_rules
+                if styled_rules_cache is not None and not animate:
+                    styled_rules_cache[cache_key] = node.styles.base.get_rules()
         self._process_component_classes(node)
 
     def _process_component_classes(self, node: DOMNode) -> None:
@@ -632,6 +647,24 @@ class Stylesheet:
             if refresh_node:
                 node.refresh()
 
+    @classmethod
+    def _set_unmounted_rules(cls, node: DOMNode, rules: RulesMap) -> None:
+        """Set style rules on a node which has no rules and hasn't been mounted.
+
+        This is a fast path for styling newly registered nodes. Because the rules were
+        validated when set on a previous node, and refreshing an unmounted node does
+        nothing, the rules may be copied without going through the style properties.
+
+        Args:
+            node: A DOM node.
+            rules: Mapping of validated rules.
+        """
+        if rules:
+            node.styles.base.merge_rules(rules)
+            if "display" in rules and node._parent is not None:
+                node._nodes.updated()
+        node.notify_style_update()
+
     @classmethod
     def replace_rules(
         cls, node: DOMNode, rules: RulesMap, animate: bool = False
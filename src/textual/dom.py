@@ -49,7 +49,6 @@ from textual.css.tokenizer import TokenError
 from textual.message_pump import MessagePump
 from textual.reactive import Reactive, ReactiveError, _Mutated, _watch
 from textual.style import Style as VisualStyle
-from textual.timer import Timer
 from textual.walk import walk_breadth_first, walk_breadth_search_id, walk_depth_first
 from textual.worker_manager import WorkerManager
 
@@ -182,6 +181,14 @@ class DOMNode(MessagePump):
     # Names of potential computed reactives
     _computes: ClassVar[frozenset[str]]
 
+    # Names of validate, watch, and compute methods defined on the class
+    _reactive_methods: ClassVar[frozenset[str]] = frozenset()
+
+    # Computed reactives, the name of their compute method, and any declared dependencies
+    _reactive_computes: ClassVar[
+        tuple[tuple[str, str, frozenset[str] | None], ...]
+    ] = ()
+
     _PSEUDO_CLASSES: ClassVar[dict[str, Callable[[App[Any]], bool]]] = {}
     """Pseudo class checks."""
 
@@ -213,7 +220,6 @@ class DOMNode(MessagePump):
         self._component_styles: dict[str, RenderStyles] = {}
 
         self._auto_refresh: float | None = None
-        self._auto_refresh_timer: Timer | None = None
         self._css_types = {cls.__name__ for cls in self._css_bases(self.__class__)}
         self._bindings = (
             BindingsMap()
@@ -465,13 +471,8 @@ class DOMNode(MessagePump):
 
     @auto_refresh.setter
     def auto_refresh(self, interval: float | None) -> None:
-        if self._auto_refresh_timer is not None:
-            self._auto_refresh_timer.stop()
-            self._auto_refresh_timer = None
-        if interval is not None:
-            self._auto_refresh_timer = self.set_interval(
-                interval, self.automatic_refresh, name=f"auto refresh {self!r}"
-            )
+        # Automatic refreshes are scheduled by the app's frame clock
+        self.app._frame_clock.set_auto_refresh(self, interval)
         self._auto_refresh = interval
 
     @property
@@ -590,13 +591,46 @@ class DOMNode(MessagePump):
             css_type_names.add(base.__name__)
         cls._merged_bindings = cls._merge_bindings()
         cls._css_type_names = frozenset(css_type_names)
-        cls._computes = frozenset(
+        reactive_methods = cls._reactive_methods = frozenset(
             [
-                name.lstrip("_")[8:]
+                name
                 for name in dir(cls)
+                if name.startswith(
+                    (
+                        "_compute_",
+                        "compute_",
+                        "_validate_",
+                        "validate_",
+                        "_watch_",
+                        "watch_",
+                    )
+                )
+            ]
+        )
+        computes = cls._computes = frozenset(
+            [
+                name.lstrip("_")[8:]
+                for name in reactive_methods
                 if name.startswith(("_compute_", "compute_"))
             ]
         )
+        reactive_computes: list[tuple[str, str, frozenset[str] | None]] = []
+        for name in reactives:
+            if name not in computes:
+                continue
+            compute_name = (
+                f"compute_{name}"
+                if f"compute_{name}" in reactive_methods
+                else f"_compute_{name}"
+            )
+            reactive_computes.append(
+                (
+                    name,
+                    compute_name,
+                    getattr(getattr(cls, compute_name), "_reactive_depends_on", None),
+                )
+            )
+        cls._reactive_computes = tuple(reactive_computes)
 
     def get_component_styles(self, *names: str) -> RenderStyles:
         """Get a "component" styles object (must be defined in COMPONENT_CLASSES classvar).
@@ -1128,6 +1162,10 @@ class DOMNode(MessagePump):
         Implementing this method will hide key bindings from the footer and key panel that would
         be *consumed* by the focused widget.
 
+        The result is cached along with the screen's binding chain. If the result depends on
+        the state of the widget, call [`refresh_bindings`][textual.dom.DOMNode.refresh_bindings]
+        when that state changes.
+
         Args:
             key: A key identifier.
             character: A character associated with the key, or `None` if there isn't one.
@@ -11,7 +11,10 @@ from textual import events, log, messages
 from textual.events import MouseUp
 
 if TYPE_CHECKING:
+    from textual._compositor import CompositorUpdate
     from textual.app import App
+    from textual.drivers._writer_thread import WriterMetrics
+    from textual.geometry import Offset
 
 
 class Driver(ABC):
@@ -64,6 +67,30 @@ class Driver(ABC):
         """Can this driver be suspended?"""
         return False
 
+    @property
+    def output_backlog(self) -> int:
+        """Number of writes waiting to be sent to the output device."""
+        return 0
+
+    @property
+    def output_metrics(self) -> WriterMetrics | None:
+        """Metrics for the output written by the driver, or `None` if not available."""
+        return None
+
+    def write_update(self, update: CompositorUpdate, cursor_position: Offset) -> bool:
+        """Write a compositor update, in a format specific to the driver.
+
+        Drivers which write terminal sequences should return `False`.
+
+        Args:
+            update: An update from the compositor.
+            cursor_position: Position of the cursor.
+
+        Returns:
+            `True` if the update was written, or `False` to write the update as terminal sequences.
+        """
+        return False
+
     def send_message(self, message: messages.Message) -> None:
         """Send a message to the target app.
 
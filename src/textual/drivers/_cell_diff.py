@@ -0,0 +1,282 @@
+"""
+Encodes compositor updates as compact cell diffs, for the web driver.
+
+Rather than terminal sequences, a cell diff packet contains the cells which changed since the
+previous packet. Styles are sent once, as entries in a style table, and referenced by index.
+
+A packet is a [binary encoded](textual._binary_encode) list, which may be compressed with zlib:
+
+    ["cells", width, height, cursor_x, cursor_y, styles, runs]
+
+- `styles` is a flat list of `style_id, sgr, link` for styles not previously sent (or
+  which replace a previous entry with the same `style_id`). `sgr` is the SGR parameters
+  (without the escape sequence), and `link` is a URL or empty string.
+- `runs` is a flat list of `y, x, style_id, text` for each run of changed cells. Double width
+  characters occupy two cells, so the following cell is skipped.
+
+The [CellDiffDecoder][textual.drivers._cell_diff.CellDiffDecoder] is a reference
+implementation of a client.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Any, Iterable, NamedTuple
+
+from rich.cells import get_character_cell_size
+from rich.color import ColorSystem
+from rich.segment import Segment
+
+from textual._binary_encode import dump, load
+from textual.strip import Strip
+
+MAX_STYLES = 4096
+"""Maximum size of the style table, before it is cleared and the style IDs are reused."""
+
+_BLANK = object()
+"""Placeholder for cells the client doesn't know about."""
+
+
+class Cell(NamedTuple):
+    """A decoded cell."""
+
+    text: str
+    """Character(s) in the cell, or empty string if covered by a double width character."""
+    sgr: str
+    """SGR parameters."""
+    link: str
+    """URL of link, or empty string."""
+
+
+class CellDiffEncoder:
+    """Encodes compositor updates as cell diffs, while tracking the state of the client."""
+
+    def __init__(
+        self, color_system: ColorSystem = ColorSystem.TRUECOLOR, compress: bool = False
+    ) -> None:
+        """
+        Args:
+            color_system: The color system used to generate SGR parameters.
+            compress: Compress packets with zlib.
+        """
+        self.color_system = color_system
+        self.compress = compress
+        self._styles: dict[tuple[str, str], int] = {}
+        """Maps SGR parameters and link on to a style ID."""
+        self._size = (0, 0)
+        self._cells: list[list[object]] = []
+        """Shadow copy of the client's cells, as (text, sgr, link) tuples."""
+        self._cursor = (0, 0)
+
+    def reset(self) -> None:
+        """Reset the state, so the next packet will contain every cell in the update."""
+        self._styles.clear()
+        self._size = (0, 0)
+        self._cells = []
+
+    def _get_style(self, segment: Segment) -> tuple[str, str]:
+        """Get the SGR parameters and link for a segment.
+
+        Args:
+            segment: A segment.
+
+        Returns:
+            A tuple of SGR parameters and link URL.
+        """
+        style = segment.style
+        if style is None:
+            return ("", "")
+        if (sgr := style._ansi) is None:
+            sgr = Strip.render_ansi(style, self.color_system)
+        return (sgr, style._link or "")
+
+    def _get_style_ids(
+        self, new_styles: Iterable[tuple[str, str]]
+    ) -> tuple[dict[tuple[str, str], int], list[str | int]]:
+        """Get the style table, after adding styles.
+
+        If the table would grow beyond `MAX_STYLES`, it is cleared first, so that no
+        ID refers to two different styles within a packet. The shadow cells store
+        resolved styles, so cleared IDs never need to be compared.
+
+        Args:
+            new_styles: Styles referenced by the packet.
+
+        Returns:
+            A tuple of the style table, and a flat list of the styles added to it.
+        """
+        styles = self._styles
+        referenced = list(dict.fromkeys(new_styles))
+        added = [key for key in referenced if key not in styles]
+        if added and len(styles) + len(added) > MAX_STYLES:
+            styles.clear()
+            added = referenced
+        table: list[str | int] = []
+        for key in added:
+            style_id = styles[key] = len(styles)
+            table.extend((style_id, *key))
+        return styles, table
+
+    def encode(
+        self,
+        segments: Iterable[Segment],
+        width: int,
+        height: int,
+        cursor: tuple[int, int] = (0, 0),
+    ) -> bytes | None:
+        """Encode the segments generated by a compositor update.
+
+        Args:
+            segments: Segments, with cursor move control codes to position lines.
+            width: Width of the screen.
+            height: Height of the screen.
+            cursor: Cursor position.
+
+        Returns:
+            An encoded packet, or `None` if no cells changed.
+        """
+        if self._size != (width, height):
+            self._size = (width, height)
+            self._cells = [[_BLANK] * width for _ in range(height)]
+        cells = self._cells
+        # Updated cells, per line, as x -> (text, sgr, link)
+        updates: dict[int, dict[int, tuple[str, str, str]]] = {}
+        get_style = self._get_style
+        cell_size = get_character_cell_size
+        x = y = 0
+        for segment in segments:
+            text, _, control = segment
+            if control:
+                for code in control:
+                    if len(code) == 3:
+                        _, x, y = code  # type: ignore[misc]
+                continue
+            if text == "\n":
+                x = 0
+                y += 1
+                continue
+            if not 0 <= y < height:
+                continue
+            sgr, link = get_style(segment)
+            line_updates = updates.setdefault(y, {})
+            for character in text:
+                character_width = cell_size(character)
+                if not character_width:
+                    # Combine zero width characters with the previous cell
+                    if (previous := line_updates.get(x - 1)) is not None:
+                        line_updates[x - 1] = (previous[0] + character, *previous[1:])
+                    continue
+                if x + character_width > width:
+                    break
+                line_updates[x] = (character, sgr, link)
+                x += character_width
+
+        # Changed runs, as (y, x, (sgr, link), text)
+        changed_runs: list[tuple[int, int, tuple[str, str], str]] = []
+        for y, line_updates in sorted(updates.items()):
+            line = cells[y]
+            line_changes = {
+                x: cell
+                for x, cell in line_updates.items()
+                if line[x] != cell
+                or (cell_size(cell[0][0]) == 2 and line[x + 1] != ("", *cell[1:]))
+            }
+            run_x = -1
+            run_style: tuple[str, str] | None = None
+            run_text: list[str] = []
+            next_x = -1
+            for x, (text, sgr, link) in sorted(line_changes.items()):
+                style = (sgr, link)
+                if x != next_x or style != run_style:
+                    if run_text and run_style is not None:
+                        changed_runs.append((y, run_x, run_style, "".join(run_text)))
+                    run_x = x
+                    run_style = style
+                    run_text = []
+                run_text.append(text)
+                line[x] = (text, sgr, link)
+                next_x = x + 1
+                if cell_size(text[0]) == 2:
+                    line[x + 1] = ("", sgr, link)
+                    next_x += 1
+            if run_text and run_style is not None:
+                changed_runs.append((y, run_x, run_style, "".join(run_text)))
+
+        if not changed_runs and cursor == self._cursor:
+            return None
+        style_ids, new_styles = self._get_style_ids(
+            style for _, _, style, _ in changed_runs
+        )
+        runs: list[str | int] = []
+        for y, x, style, text in changed_runs:
+            runs.extend((y, x, style_ids[style], text))
+        self._cursor = cursor
+        cursor_x, cursor_y = cursor
+        packet = dump(["cells", width, height, cursor_x, cursor_y, new_styles, runs])
+        return zlib.compress(packet) if self.compress else packet
+
+
+class CellDiffDecoder:
+    """Decodes cell diff packets. A reference implementation of a client, used in tests."""
+
+    def __init__(self, compress: bool = False) -> None:
+        """
+        Args:
+            compress: Packets are compressed with zlib.
+        """
+        self.compress = compress
+        self.width: int = 0
+        self.height: int = 0
+        self.cursor: tuple[int, int] = (0, 0)
+        self.cells: list[list[Cell]] = []
+        self._styles: dict[int, tuple[str, str]] = {}
+
+    def decode(self, packet: bytes) -> None:
+        """Decode a packet, and apply it to the cells.
+
+        Args:
+            packet: A packet generated by `CellDiffEncoder`.
+        """
+        if self.compress:
+            packet = zlib.decompress(packet)
+        width: int
+        height: int
+        cursor_x: int
+        cursor_y: int
+        styles: list[Any]
+        runs: list[Any]
+        _, width, height, cursor_x, cursor_y, styles, runs = load(packet)  # type: ignore[misc]
+        if (width, height) != (self.width, self.height):
+            self.width = width
+            self.height = height
+            blank = Cell(" ", "", "")
+            self.cells = [[blank] * width for _ in range(height)]
+        self.cursor = (cursor_x, cursor_y)
+        for index in range(0, len(styles), 3):
+            style_id, sgr, link = styles[index : index + 3]
+            self._styles[style_id] = (sgr, link)
+        for index in range(0, len(runs), 4):
+            y, x, style_id, text = runs[index : index + 4]
+            sgr, link = self._styles[style_id]
+            line = self.cells[y]
+            for character in text:
+                character_width = get_character_cell_size(character)
+                if not character_width:
+                    previous = line[x - 1]
+                    line[x - 1] = previous._replace(text=previous.text + character)
+                    continue
+                line[x] = Cell(character, sgr, link)
+                if character_width == 2:
+                    line[x + 1] = Cell("", sgr, link)
+                x += character_width
+
+    def get_line_text(self, y: int) -> str:
+        """Get the text of a line.
+
+        Args:
+            y: Line number.
+
+        Returns:
+            The characters in the line.
+        """
+        return "".join(cell.text for cell in self.cells[y])
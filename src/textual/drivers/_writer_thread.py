@@ -1,21 +1,43 @@
 from __future__ import annotations
 
 import threading
-from queue import Queue
-from typing import IO
+from time import perf_counter
+from typing import IO, NamedTuple
 
-from typing_extensions import Final
 
-MAX_QUEUED_WRITES: Final[int] = 30
+class WriterMetrics(NamedTuple):
+    """Metrics for the output written by a [WriterThread][textual.drivers._writer_thread.WriterThread]."""
+
+    bytes_written: int
+    """Number of bytes written (when encoded as UTF-8)."""
+    bytes_per_second: float
+    """Average bytes written per second, since the thread started."""
+    flushes: int
+    """Number of times the file was flushed."""
+    max_backlog: int
+    """Maximum number of writes waiting to be written."""
 
 
 class WriterThread(threading.Thread):
-    """A thread / file-like to do writes to stdout in the background."""
+    """A thread / file-like to do writes to stdout in the background.
+
+    Writes never block the caller. If the output can't keep up, pending writes are
+    merged, and written together when the file is ready.
+    """
 
     def __init__(self, file: IO[str]) -> None:
         super().__init__(daemon=True, name="textual-output")
-        self._queue: Queue[str | None] = Queue(MAX_QUEUED_WRITES)
         self._file = file
+        self._condition = threading.Condition()
+        self._pending: list[str] = []
+        """Writes waiting to be written."""
+        self._writing = 0
+        """Number of writes currently being written."""
+        self._stopping = False
+        self._start_time = perf_counter()
+        self._bytes_written = 0
+        self._flushes = 0
+        self._max_backlog = 0
 
     def write(self, text: str) -> None:
         """Write text. Text will be enqueued for writing.
@@ -23,7 +45,28 @@ class WriterThread(threading.Thread):
         Args:
             text: Text to write to the file.
         """
-        self._queue.put(text)
+        with self._condition:
+            pending = self._pending
+            pending.append(text)
+            if len(pending) > self._max_backlog:
+                self._max_backlog = len(pending)
+            self._condition.notify()
+
+    @property
+    def backlog(self) -> int:
+        """Number of writes waiting to be written, or being written."""
+        return len(self._pending) + self._writing
+
+    @property
+    def metrics(self) -> WriterMetrics:
+        """Metrics for the output written so far."""
+        elapsed = perf_counter() - self._start_time
+        return WriterMetrics(
+            self._bytes_written,
+            self._bytes_written / elapsed if elapsed else 0.0,
+            self._flushes,
+            self._max_backlog,
+        )
 
     def isatty(self) -> bool:
         """Pretend to be a terminal.
@@ -49,20 +92,31 @@ class WriterThread(threading.Thread):
         """Run the thread."""
         write = self._file.write
         flush = self._file.flush
-        get = self._queue.get
-        qsize = self._queue.qsize
-        # Read from the queue, write to the file.
+        condition = self._condition
+        # Take every pending write, and write them to the file together.
         # Flush when there is a break.
         while True:
-            text: str | None = get()
-            if text is None:
-                break
+            with condition:
+                while not (self._pending or self._stopping):
+                    condition.wait()
+                pending = self._pending
+                if not pending:
+                    break
+                self._pending = []
+                self._writing = len(pending)
+            text = "".join(pending)
             write(text)
-            if qsize() == 0:
+            self._bytes_written += len(text.encode("utf-8", "replace"))
+            self._writing = 0
+            if not self._pending:
                 flush()
+                self._flushes += 1
         flush()
+        self._flushes += 1
 
     def stop(self) -> None:
-        """Stop the thread, and block until it finished."""
-        self._queue.put(None)
+        """Stop the thread (after writing any pending text), and block until it finished."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
         self.join()
@@ -18,7 +18,7 @@ from textual._loop import loop_last
 from textual._parser import ParseError
 from textual._xterm_parser import XTermParser
 from textual.driver import Driver
-from textual.drivers._writer_thread import WriterThread
+from textual.drivers._writer_thread import WriterMetrics, WriterThread
 from textual.geometry import Size
 from textual.message import Message
 from textual.messages import InBandWindowResize
@@ -184,6 +184,16 @@ class LinuxDriver(Driver):
         write("\x1b[?1006l")
         self.flush()
 
+    @property
+    def output_backlog(self) -> int:
+        """Number of writes waiting to be sent to the output device."""
+        return 0 if self._writer_thread is None else self._writer_thread.backlog
+
+    @property
+    def output_metrics(self) -> WriterMetrics | None:
+        """Metrics for the output written by the driver, or `None` if not available."""
+        return None if self._writer_thread is None else self._writer_thread.metrics
+
     def write(self, data: str) -> None:
         """Write data to the output device.
 
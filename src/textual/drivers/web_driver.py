@@ -6,6 +6,10 @@ The Remote driver uses the following packet structure.
 4 byte little endian integer for the size of the payload.
 Arbitrary payload.
 
+If the server sends a "cell_diff" meta packet, updates are written as "C" packets
+(or "Z" packets if compressed with zlib) containing only the cells which changed.
+See `textual.drivers._cell_diff` for the format.
+
 
 """
 
@@ -20,7 +24,7 @@ from codecs import getincrementaldecoder
 from functools import partial
 from pathlib import Path
 from threading import Event, Thread
-from typing import Any, BinaryIO, Literal, TextIO, cast
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, TextIO, cast
 
 from textual import events, log, messages
 from textual._binary_encode import dump as binary_dump
@@ -28,8 +32,12 @@ from textual._xterm_parser import XTermParser
 from textual.app import App
 from textual.driver import Driver
 from textual.drivers._byte_stream import ByteStream
+from textual.drivers._cell_diff import CellDiffEncoder
 from textual.drivers._input_reader import InputReader
-from textual.geometry import Size
+from textual.geometry import Offset, Size
+
+if TYPE_CHECKING:
+    from textual._compositor import CompositorUpdate
 
 WINDOWS = sys.platform == "win32"
 
@@ -71,6 +79,9 @@ class WebDriver(Driver):
         """Maps delivery keys to file-like objects, used
         for delivering files to the browser."""
 
+        self._cell_diff_encoder: CellDiffEncoder | None = None
+        """Encodes updates as cell diffs, if requested by the server."""
+
     @property
     def is_web(self) -> bool:
         return True
@@ -105,6 +116,34 @@ class WebDriver(Driver):
         packed_bytes = binary_dump(data)
         self._write(b"P%s%s" % (len(packed_bytes).to_bytes(4, "big"), packed_bytes))
 
+    def write_update(self, update: CompositorUpdate, cursor_position: Offset) -> bool:
+        """Write an update as a cell diff packet, if enabled by the server.
+
+        Args:
+            update: An update from the compositor.
+            cursor_position: Position of the cursor.
+
+        Returns:
+            `True` if the update was written, or `False` to write the update as terminal sequences.
+        """
+        encoder = self._cell_diff_encoder
+        if encoder is None:
+            return False
+        console = self._app.console
+        width, height = (80, 24) if self._size is None else self._size
+        packet = encoder.encode(
+            update.__rich_console__(console, console.options),  # type: ignore[attr-defined]
+            width,
+            height,
+            cursor_position,
+        )
+        if packet is not None:
+            packet_type = b"Z" if encoder.compress else b"C"
+            self._write(
+                b"%s%s%s" % (packet_type, len(packet).to_bytes(4, "big"), packet)
+            )
+        return True
+
     def flush(self) -> None:
         pass
 
@@ -243,6 +282,18 @@ class WebDriver(Driver):
             self._app.post_message(events.AppFocus())
         elif packet_type == "blur":
             self._app.post_message(events.AppBlur())
+        elif packet_type == "cell_diff":
+            # The server supports cell diffs
+            compress = bool(payload.get("compress", False))
+            color_system = self._app.console._color_system
+            self._cell_diff_encoder = (
+                CellDiffEncoder(compress=compress)
+                if color_system is None
+                else CellDiffEncoder(color_system, compress=compress)
+            )
+            self.write_meta({"type": "cell_diff", "version": 1, "compress": compress})
+            # Repaint, so the client has every cell
+            self._app.call_later(self._app.refresh)
         elif packet_type == "quit":
             self._app.post_message(messages.ExitApp())
         elif packet_type == "exit":
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Callable
 
 from textual.driver import Driver
 from textual.drivers import win32
-from textual.drivers._writer_thread import WriterThread
+from textual.drivers._writer_thread import WriterMetrics, WriterThread
 
 if TYPE_CHECKING:
     from textual.app import App
@@ -44,6 +44,16 @@ class WindowsDriver(Driver):
         """Can this driver be suspended?"""
         return True
 
+    @property
+    def output_backlog(self) -> int:
+        """Number of writes waiting to be sent to the output device."""
+        return 0 if self._writer_thread is None else self._writer_thread.backlog
+
+    @property
+    def output_metrics(self) -> WriterMetrics | None:
+        """Metrics for the output written by the driver, or `None` if not available."""
+        return None if self._writer_thread is None else self._writer_thread.metrics
+
     def write(self, data: str) -> None:
         """Write data to the output device.
 
@@ -15,7 +15,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Type, TypeVar
+from typing import TYPE_CHECKING, Hashable, Type, TypeVar
 
 import rich.repr
 from rich.style import Style
@@ -146,6 +146,9 @@ class Resize(Event, bubble=False):
     def can_replace(self, message: "Message") -> bool:
         return isinstance(message, Resize)
 
+    def _get_coalesce_key(self) -> Hashable | None:
+        return Resize
+
     def __rich_repr__(self) -> rich.repr.Result:
         yield "size", self.size
         yield "virtual_size", self.virtual_size, self.size
@@ -576,6 +579,21 @@ class MouseMove(MouseEvent, bubble=True, verbose=True):
     - [X] Verbose
     """
 
+    def can_replace(self, message: Message) -> bool:
+        if (
+            isinstance(message, MouseMove)
+            and message.button == self.button
+            and message.shift == self.shift
+            and message.meta == self.meta
+            and message.ctrl == self.ctrl
+        ):
+            # The following move will be processed in place of this one, so it
+            # should include the change in position from both.
+            message._delta_x += self._delta_x
+            message._delta_y += self._delta_y
+            return True
+        return False
+
 
 @rich.repr.auto
 class MouseDown(MouseEvent, bubble=True, verbose=True):
@@ -15,14 +15,16 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from functools import lru_cache
+from typing import Sequence
 
 from rich.color import Color as RichColor
 from rich.segment import Segment
 from rich.style import Style
 from rich.terminal_theme import TerminalTheme
 
+from textual._color_pipeline import StyleCache, blend_rich_colors
 from textual.color import Color
-from textual.constants import DIM_FACTOR
+from textual.constants import COLOR_CACHE_SIZE, DIM_FACTOR
 
 
 class LineFilter(ABC):
@@ -49,7 +51,7 @@ class LineFilter(ABC):
         """
 
 
-@lru_cache(1024)
+@lru_cache(COLOR_CACHE_SIZE)
 def monochrome_style(style: Style) -> Style:
     """Convert colors in a style to monochrome.
 
@@ -125,7 +127,7 @@ NO_DIM = Style(dim=False)
 """A Style to set dim to False."""
 
 
-@lru_cache(1024)
+@lru_cache(COLOR_CACHE_SIZE)
 def dim_color(
     background: RichColor, color: RichColor, factor: float = DIM_FACTOR
 ) -> RichColor:
@@ -152,7 +154,7 @@ def dim_color(
 DEFAULT_COLOR = RichColor.default()
 
 
-@lru_cache(1024)
+@lru_cache(COLOR_CACHE_SIZE)
 def dim_style(style: Style, background: Color, factor: float) -> Style:
     """Replace dim attribute with a dim color.
 
@@ -176,6 +178,41 @@ def dim_style(style: Style, background: Color, factor: float) -> Style:
     ) + NO_DIM
 
 
+def dim_styles(
+    styles: Sequence[Style], background: Color, factor: float
+) -> list[Style]:
+    """Replace the dim attribute of a number of styles with dim colors.
+
+    This is a batched version of [dim_style][textual.filter.dim_style].
+
+    Args:
+        styles: Styles to dim.
+        background: The background color.
+        factor: Blend factor.
+
+    Returns:
+        New dimmed styles.
+    """
+    background_rich_color = background.rich_color
+    dim_colors = blend_rich_colors(
+        [
+            (
+                background_rich_color
+                if style.bgcolor is None or style.bgcolor.is_default
+                else style.bgcolor
+            )
+            for style in styles
+        ],
+        [style.color for style in styles],  # type: ignore[misc]
+        factor,
+    )
+    style_from_color = Style.from_color
+    return [
+        (style + style_from_color(color, None)) + NO_DIM
+        for style, color in zip(styles, dim_colors)
+    ]
+
+
 # Can be used as a workaround for https://github.com/xtermjs/xterm.js/issues/4161
 class DimFilter(LineFilter):
     """Replace dim attributes with modified colors."""
@@ -187,6 +224,8 @@ class DimFilter(LineFilter):
             dim_factor: The factor to dim by; 0 is 100% background (i.e. invisible), 1.0 is no change.
         """
         self.dim_factor = dim_factor
+        self.style_cache = StyleCache()
+        """Cache of dimmed styles."""
         super().__init__(enabled=enabled)
 
     def apply(self, segments: list[Segment], background: Color) -> list[Segment]:
@@ -200,15 +239,15 @@ class DimFilter(LineFilter):
             A new list of segments.
         """
         _Segment = Segment
-        _dim_style = dim_style
-        factor = self.dim_factor
+        dimmed_styles = self.style_cache.map_styles(
+            [style for _, style, _ in segments if style is not None and style.dim],
+            dim_styles,
+            background,
+            self.dim_factor,
+        )
         return [
             (
-                _Segment(
-                    segment.text,
-                    _dim_style(segment.style, background, factor),
-                    None,
-                )
+                _Segment(segment.text, dimmed_styles[segment.style], None)
                 if segment.style is not None and segment.style.dim
                 else segment
             )
@@ -226,40 +265,80 @@ class ANSIToTruecolor(LineFilter):
             terminal_theme: A rich terminal theme.
         """
         self._terminal_theme = terminal_theme
+        self.style_cache = StyleCache()
+        """Cache of truecolor styles."""
         super().__init__(enabled=enabled)
 
-    @lru_cache(1024)
+    @lru_cache(COLOR_CACHE_SIZE)
     def truecolor_style(self, style: Style, background: RichColor) -> Style:
         """Replace system colors with truecolor equivalent.
 
         Args:
             style: Style to apply truecolor filter to.
+            background: The background color.
 
         Returns:
             New style.
         """
-        terminal_theme = self._terminal_theme
+        return self.truecolor_styles([style], background)[0]
+
+    def truecolor_styles(
+        self, styles: Sequence[Style], background: RichColor
+    ) -> list[Style]:
+        """Replace system colors with truecolor equivalents in a number of styles.
 
-        changed = False
-        if (color := style.color) is not None:
-            if color.triplet is None:
-                color = RichColor.from_triplet(
-                    color.get_truecolor(terminal_theme, foreground=True)
+        Args:
+            styles: Styles to apply truecolor filter to.
+            background: The background color.
+
+        Returns:
+            New styles.
+        """
+        terminal_theme = self._terminal_theme
+        style_from_color = Style.from_color
+        new_styles: list[Style] = []
+        # Styles with dim colors, which are blended in a single batch
+        dimmed: list[tuple[int, RichColor, RichColor, RichColor | None]] = []
+
+        for style in styles:
+            changed = False
+            if (color := style.color) is not None:
+                if color.triplet is None:
+                    color = RichColor.from_triplet(
+                        color.get_truecolor(terminal_theme, foreground=True)
+                    )
+                    changed = True
+
+            if (bgcolor := style.bgcolor) is not None and bgcolor.triplet is None:
+                bgcolor = RichColor.from_triplet(
+                    bgcolor.get_truecolor(terminal_theme, foreground=False)
                 )
                 changed = True
 
-        if (bgcolor := style.bgcolor) is not None and bgcolor.triplet is None:
-            bgcolor = RichColor.from_triplet(
-                bgcolor.get_truecolor(terminal_theme, foreground=False)
-            )
-            changed = True
-
-        if style.dim and color is not None:
-            color = dim_color(background if bgcolor is None else bgcolor, color)
-            style += NO_DIM
-            changed = True
+            if style.dim and color is not None:
+                dimmed.append(
+                    (
+                        len(new_styles),
+                        background if bgcolor is None else bgcolor,
+                        color,
+                        bgcolor,
+                    )
+                )
+                new_styles.append(style + NO_DIM)
+            else:
+                new_styles.append(
+                    style + style_from_color(color, bgcolor) if changed else style
+                )
 
-        return style + Style.from_color(color, bgcolor) if changed else style
+        if dimmed:
+            dim_colors = blend_rich_colors(
+                [dim_background for _, dim_background, _, _ in dimmed],
+                [color for _, _, color, _ in dimmed],
+                DIM_FACTOR,
+            )
+            for (index, _, _, bgcolor), color in zip(dimmed, dim_colors):
+                new_styles[index] += style_from_color(color, bgcolor)
+        return new_styles
 
     def apply(self, segments: list[Segment], background: Color) -> list[Segment]:
         """Transform a list of segments.
@@ -272,17 +351,25 @@ class ANSIToTruecolor(LineFilter):
             A new list of segments.
         """
         _Segment = Segment
-        truecolor_style = self.truecolor_style
-        background_rich_color = background.rich_color
+        truecolor_styles = self.style_cache.map_styles(
+            [style for _, style, _ in segments if style is not None],
+            self.truecolor_styles,
+            background.rich_color,
+        )
         return [
-            _Segment(
-                text,
-                (
-                    None
-                    if style is None
-                    else truecolor_style(style, background_rich_color)
-                ),
-                None,
-            )
+            _Segment(text, None if style is None else truecolor_styles[style], None)
             for text, style, _ in segments
         ]
+
+
+@lru_cache(maxsize=16)
+def get_truecolor_filter(terminal_theme: TerminalTheme) -> ANSIToTruecolor:
+    """Get a (shared) filter to convert ANSI colors to truecolor.
+
+    Args:
+        terminal_theme: A rich terminal theme.
+
+    Returns:
+        A filter, which caches styles for the given theme.
+    """
+    return ANSIToTruecolor(terminal_theme)
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar, Iterable, NamedTuple
 
-from textual._spatial_map import SpatialMap
+from textual._spatial_map import SpatialIndexType, SpatialMap, VerticalSpatialMap
 from textual.canvas import Canvas, Rectangle
 from textual.geometry import Offset, Region, Size, Spacing
 from textual.strip import StripRenderable
@@ -16,6 +16,9 @@ if TYPE_CHECKING:
 
 ArrangeResult: TypeAlias = "list[WidgetPlacement]"
 
+VERTICAL_INDEX_THRESHOLD = 50
+"""Minimum number of placements before an "auto" spatial index considers a vertical index."""
+
 
 @dataclass
 class DockArrangeResult:
@@ -27,6 +30,11 @@ class DockArrangeResult:
     """A set of widgets in the arrangement."""
     scroll_spacing: Spacing
     """Spacing to reduce scrollable area."""
+    spatial_index: SpatialIndexType = "auto"
+    """The type of spatial map used to query placements."""
+    virtual_size: Size | None = None
+    """Minimum size of the arrangement, for containers which don't place all their content
+    (such as [VirtualScroll][textual.virtual.VirtualScroll]), or `None` for no minimum."""
 
     _spatial_map: SpatialMap[WidgetPlacement] | None = None
     """A Spatial map to query widget placements."""
@@ -35,8 +43,7 @@ class DockArrangeResult:
     def spatial_map(self) -> SpatialMap[WidgetPlacement]:
         """A lazy-calculated spatial map."""
         if self._spatial_map is None:
-            self._spatial_map = SpatialMap()
-            self._spatial_map.insert(
+            regions_and_values = [
                 (
                     placement.region.grow(placement.margin),
                     placement.offset,
@@ -45,7 +52,20 @@ class DockArrangeResult:
                     placement,
                 )
                 for placement in self.placements
+            ]
+            spatial_index = self.spatial_index
+            if spatial_index == "auto":
+                spatial_index = "grid"
+                if len(regions_and_values) >= VERTICAL_INDEX_THRESHOLD:
+                    bounds = Region.from_union(
+                        [region for region, *_ in regions_and_values]
+                    )
+                    if bounds.height > bounds.width:
+                        spatial_index = "vertical"
+            self._spatial_map = (
+                VerticalSpatialMap() if spatial_index == "vertical" else SpatialMap()
             )
+            self._spatial_map.insert(regions_and_values)
 
         return self._spatial_map
 
@@ -57,7 +77,10 @@ class DockArrangeResult:
             A Region.
         """
         _top, right, bottom, _left = self.scroll_spacing
-        return self.spatial_map.total_region.grow((0, right, bottom, 0))
+        total_region = self.spatial_map.total_region
+        if self.virtual_size is not None:
+            total_region = total_region.union(self.virtual_size.region)
+        return total_region.grow((0, right, bottom, 0))
 
     def get_visible_placements(self, region: Region) -> list[WidgetPlacement]:
         """Get the placements visible within the given region.
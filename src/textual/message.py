@@ -5,7 +5,7 @@ The base class for all messages (including events).
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, Hashable
 
 import rich.repr
 from typing_extensions import Self
@@ -128,6 +128,17 @@ class Message:
         """
         return False
 
+    def _get_coalesce_key(self) -> Hashable | None:
+        """Get a key which identifies the messages this message supersedes.
+
+        If a message with the same key is waiting in the queue, it will be discarded
+        in favor of this message (which is more up to date).
+
+        Returns:
+            A hashable key, or `None` if this message never replaces queued messages.
+        """
+        return None
+
     def prevent_default(self, prevent: bool = True) -> Message:
         """Suppress the default action(s). This will prevent handlers in any base classes
         from being called.
@@ -14,6 +14,7 @@ import asyncio
 import threading
 from asyncio import CancelledError, QueueEmpty, Task, create_task
 from contextlib import contextmanager
+from contextvars import Context, copy_context
 from functools import partial
 from time import perf_counter
 from typing import (
@@ -21,6 +22,7 @@ from typing import (
     Any,
     Awaitable,
     Callable,
+    ClassVar,
     Generator,
     Iterable,
     Type,
@@ -45,6 +47,7 @@ from textual.message import Message
 from textual.reactive import Reactive, TooManyComputesError
 from textual.signal import Signal
 from textual.timer import Timer, TimerCallback
+from textual.worker import active_worker
 
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
@@ -115,6 +118,13 @@ class _MessagePumpMeta(type):
 class MessagePump(metaclass=_MessagePumpMeta):
     """Base class which supplies a message pump."""
 
+    _park_when_idle: ClassVar[bool] = False
+    """Release the task which processes messages while the queue is empty?
+
+    A parked message pump has no task until a message is put in its queue, which saves the
+    memory (and scheduling) of an idle task for every widget.
+    """
+
     def __init__(self, parent: MessagePump | None = None) -> None:
         self._parent = parent
         self._running: bool = False
@@ -123,6 +133,8 @@ class MessagePump(metaclass=_MessagePumpMeta):
         self._disabled_messages: set[type[Message]] = set()
         self._pending_message: Message | None = None
         self._task: Task | None = None
+        self._parked_context: Context | None = None
+        """The context of the task which processed messages, while parked."""
         self._timers: WeakSet[Timer] = WeakSet()
         self._last_idle: float = time()
         self._max_idle: float | None = None
@@ -534,7 +546,8 @@ class MessagePump(metaclass=_MessagePumpMeta):
             await Timer._stop_all(self._timers)
             self._timers.clear()
         Reactive._reset_object(self)
-        self._message_queue.put_nowait(None)
+        # Close after any messages already in the queue (including the background lane)
+        self._message_queue.put_last_nowait(None)
         if wait and self._task is not None and asyncio.current_task() != self._task:
             try:
                 running_widget = active_message_pump.get()
@@ -561,17 +574,34 @@ class MessagePump(metaclass=_MessagePumpMeta):
 
     async def _process_messages(self) -> None:
         self._running = True
+        # This task inherits the context of its creator, which may be a worker;
+        # messages posted while processing messages don't belong to that worker.
+        active_worker.set(None)
 
         with self._context():
             if not await self._pre_process():
                 self._running = False
                 return
+            await self._run_messages()
 
-            try:
-                await self._process_messages_loop()
-            except CancelledError:
-                pass
-            finally:
+    async def _resume_messages(self) -> None:
+        """Resume processing messages, after the message pump was parked."""
+        with self._context():
+            await self._run_messages(resumed=True)
+
+    async def _run_messages(self, resumed: bool = False) -> None:
+        """Process messages, and clean up when the message pump closes.
+
+        Args:
+            resumed: Is the message pump resuming after being parked?
+        """
+        parked = False
+        try:
+            parked = await self._process_messages_loop(resumed=resumed)
+        except CancelledError:
+            pass
+        finally:
+            if not parked:
                 self._running = False
                 try:
                     if self._timers:
@@ -580,7 +610,26 @@ class MessagePump(metaclass=_MessagePumpMeta):
                     Reactive._clear_watchers(self)
                 finally:
                     await self._message_loop_exit()
-        self._task = None
+        if not parked:
+            self._task = None
+
+    def _park(self) -> None:
+        """Let the current task finish, and create a new task when a message arrives.
+
+        Must be called from the task processing messages, when the queue is empty.
+        """
+        self._parked_context = copy_context()
+        message_queue: Queue[Message | None] = self._message_queue
+        message_queue.wake_callback = self._unpark
+
+    def _unpark(self) -> None:
+        """Create a task to resume processing messages (called when a message is queued)."""
+        context = self._parked_context
+        assert context is not None
+        self._parked_context = None
+        self._task = context.run(
+            create_task, self._resume_messages(), name=f"message pump {self}"
+        )
 
     async def _message_loop_exit(self) -> None:
         """Called when the message loop has completed."""
@@ -631,11 +680,20 @@ class MessagePump(metaclass=_MessagePumpMeta):
     async def _on_close_messages(self, message: messages.CloseMessages) -> None:
         await self._close_messages()
 
-    async def _process_messages_loop(self) -> None:
-        """Process messages until the queue is closed."""
+    async def _process_messages_loop(self, resumed: bool = False) -> bool:
+        """Process messages until the queue is closed, or the message pump is parked.
+
+        Args:
+            resumed: Is the message pump resuming after being parked?
+
+        Returns:
+            `True` if the message pump was parked, or `False` if it closed.
+        """
         _rich_traceback_guard = True
         self._thread_id = threading.get_ident()
-        await asyncio.sleep(0)
+        if not resumed:
+            await asyncio.sleep(0)
+        park_when_idle = self._park_when_idle
         while not self._closed:
             try:
                 message = await self._get_message()
@@ -692,6 +750,16 @@ class MessagePump(metaclass=_MessagePumpMeta):
                                 break
                     await self._flush_next_callbacks()
 
+            if (
+                park_when_idle
+                and self._message_queue.empty()
+                and self._pending_message is None
+                and not (self._next_callbacks or self._closing or self._closed)
+            ):
+                self._park()
+                return True
+        return False
+
     async def _flush_next_callbacks(self) -> None:
         """Invoke pending callbacks in next callbacks queue."""
         callbacks = self._next_callbacks.copy()
@@ -879,12 +947,21 @@ class MessagePump(metaclass=_MessagePumpMeta):
         # Add a copy of the prevented message types to the message
         # This is so that prevented messages are honoured by the event's handler
         message._prevent.update(self._get_prevented_messages())
-        if self._thread_id != threading.get_ident() and self.app._loop is not None:
+        # Messages from workers are processed after other messages (including input),
+        # so that a busy worker doesn't make the app unresponsive.
+        background = active_worker.get(None) is not None
+        if (
+            self._thread_id != threading.get_ident()
+            and (loop := self.app._loop) is not None
+        ):
             # If we're not calling from the same thread, make it threadsafe
-            loop = self.app._loop
-            loop.call_soon_threadsafe(self._message_queue.put_nowait, message)
+            self.app._thread_messages.post(
+                loop, self, message, message._get_coalesce_key(), background
+            )
         else:
-            self._message_queue.put_nowait(message)
+            self._message_queue.put_nowait(
+                message, message._get_coalesce_key(), background
+            )
         return True
 
     async def on_callback(self, event: events.Callback) -> None:
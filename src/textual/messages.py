@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Hashable
 
 import rich.repr
 
@@ -47,6 +47,9 @@ class Update(Message, verbose=True):
         # Update messages can replace update for the same widget
         return isinstance(message, Update) and self.widget == message.widget
 
+    def _get_coalesce_key(self) -> Hashable | None:
+        return (Update, self.widget)
+
 
 @rich.repr.auto
 class Layout(Message, verbose=True):
@@ -57,7 +60,11 @@ class Layout(Message, verbose=True):
         self.widget = widget
 
     def can_replace(self, message: Message) -> bool:
-        return isinstance(message, Layout)
+        # Layout messages can replace layout for the same widget
+        return isinstance(message, Layout) and self.widget == message.widget
+
+    def _get_coalesce_key(self) -> Hashable | None:
+        return (Layout, self.widget)
 
 
 @rich.repr.auto
@@ -67,6 +74,9 @@ class UpdateScroll(Message, verbose=True):
     def can_replace(self, message: Message) -> bool:
         return isinstance(message, UpdateScroll)
 
+    def _get_coalesce_key(self) -> Hashable | None:
+        return UpdateScroll
+
 
 @rich.repr.auto
 class InvokeLater(Message, verbose=True, bubble=False):
@@ -95,6 +105,9 @@ class Prompt(Message, no_dispatch=True):
     def can_replace(self, message: Message) -> bool:
         return isinstance(message, Prompt)
 
+    def _get_coalesce_key(self) -> Hashable | None:
+        return Prompt
+
 
 class TerminalSupportsSynchronizedOutput(Message):
     """
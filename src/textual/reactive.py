@@ -5,6 +5,7 @@ This module contains the `Reactive` class which implements [reactivity](/guide/r
 
 from __future__ import annotations
 
+from contextvars import ContextVar
 from functools import partial
 from inspect import isawaitable
 from typing import (
@@ -40,6 +41,13 @@ if TYPE_CHECKING:
 ReactiveType = TypeVar("ReactiveType")
 ReactableType = TypeVar("ReactableType", bound="DOMNode")
 
+_compute_reads: ContextVar[tuple[Reactable, set[str]] | None] = ContextVar(
+    "_compute_reads", default=None
+)
+"""The object with a running compute method, and the names of the reactives it has read."""
+
+ComputeMethodType = TypeVar("ComputeMethodType", bound=Callable[..., Any])
+
 
 class _Mutated:
     """A wrapper to indicate a value was mutated."""
@@ -79,6 +87,39 @@ class Initialize(Generic[ReactiveType]):
         return self.callback(obj)
 
 
+def _invoke_compute(
+    obj: Reactable, name: str, compute_method: Callable[[], object]
+) -> object:
+    """Invoke a compute method, and record the reactives it reads as its dependencies.
+
+    Args:
+        obj: The reactable object.
+        name: Name of the computed reactive.
+        compute_method: The compute method.
+
+    Returns:
+        The computed value.
+    """
+    _rich_traceback_omit = True
+    parent_reads = _compute_reads.get()
+    reads: set[str] = set()
+    reset_token = _compute_reads.set((obj, reads))
+    try:
+        value = compute_method()
+    finally:
+        _compute_reads.reset(reset_token)
+    try:
+        dependencies = getattr(obj, "__compute_dependencies")
+    except AttributeError:
+        dependencies = {}
+        setattr(obj, "__compute_dependencies", dependencies)
+    dependencies[name] = reads
+    if parent_reads is not None and parent_reads[0] is obj:
+        # The dependencies of a nested compute are also dependencies of the outer compute
+        parent_reads[1].update(reads)
+    return value
+
+
 async def await_watcher(obj: Reactable, awaitable: Awaitable[object]) -> None:
     """Coroutine to await an awaitable returned from a watcher"""
     _rich_traceback_omit = True
@@ -87,6 +128,42 @@ async def await_watcher(obj: Reactable, awaitable: Awaitable[object]) -> None:
     obj.post_message(events.Callback(callback=partial(Reactive._compute, obj)))
 
 
+def depends_on(*names: str) -> Callable[[ComputeMethodType], ComputeMethodType]:
+    """Declare the dependencies of a compute method.
+
+    Compute methods are invoked when a reactive they read changes. If a compute method
+    also depends on something other than the reactives it reads (such as a plain attribute,
+    or a reactive on another object), use this decorator to name the reactives which should
+    also cause it to be invoked. With no names, the compute method is invoked when any
+    reactive on the object changes.
+
+    Example:
+        ```python
+        class Temperature(Widget):
+            celsius = reactive(0.0)
+            units = reactive("C")
+            label = reactive("")
+
+            @depends_on("units")
+            def compute_label(self) -> str:
+                # `self.symbol` is a plain attribute, updated along with `units`
+                return f"{self.celsius}{self.symbol}"
+        ```
+
+    Args:
+        *names: Names of reactives on the same object.
+
+    Returns:
+        A decorator for a compute method.
+    """
+
+    def decorate(method: ComputeMethodType) -> ComputeMethodType:
+        setattr(method, "_reactive_depends_on", frozenset(names))
+        return method
+
+    return decorate
+
+
 def invoke_watcher(
     watcher_object: Reactable,
     watch_function: WatchCallbackType,
@@ -209,7 +286,7 @@ class Reactive(Generic[ReactiveType]):
 
         compute_method = getattr(obj, self.compute_name, None)
         if compute_method is not None and self._init:
-            default = compute_method()
+            default = _invoke_compute(obj, name, compute_method)
         else:
             default_or_callable = self._default
             default = (
@@ -247,6 +324,7 @@ class Reactive(Generic[ReactiveType]):
         """
         getattr(obj, "__watchers", {}).clear()
         getattr(obj, "__computes", []).clear()
+        getattr(obj, "__compute_dependencies", {}).clear()
 
     def __set_name__(self, owner: Type[MessageTarget], name: str) -> None:
         # Check for compute method
@@ -270,6 +348,9 @@ class Reactive(Generic[ReactiveType]):
         # The internal name where the attribute's value is stored
         self.internal_name = f"_reactive_{name}"
         self.compute_name = compute_name
+        # Names of the validate and watch methods, private first
+        self.validate_names = (f"_validate_{name}", f"validate_{name}")
+        self.watch_names = (f"_watch_{name}", f"watch_{name}")
         default = self._default
         setattr(owner, f"_default_{name}", default)
 
@@ -300,13 +381,21 @@ class Reactive(Generic[ReactiveType]):
             raise ReactiveError(
                 f"Node is missing data; Check you are calling super().__init__(...) in the {obj.__class__.__name__}() constructor, before getting reactives."
             )
+        compute_reads = _compute_reads.get()
+        if compute_reads is not None and compute_reads[0] is obj:
+            compute_reads[1].add(self.name)
         if not hasattr(obj, internal_name := self.internal_name):
             self._initialize_reactive(obj, self.name)
 
-        if hasattr(obj, self.compute_name):
+        if (
+            compute_name := self.compute_name
+        ) in obj._reactive_methods or compute_name in obj.__dict__:
             value: ReactiveType
             old_value = getattr(obj, internal_name)
-            value = getattr(obj, self.compute_name)()
+            value = cast(
+                ReactiveType,
+                _invoke_compute(obj, self.name, getattr(obj, compute_name)),
+            )
             setattr(obj, internal_name, value)
             self._check_watchers(obj, self.name, old_value)
             return value
@@ -327,7 +416,11 @@ class Reactive(Generic[ReactiveType]):
 
         self._initialize_reactive(obj, self.name)
 
-        if hasattr(obj, self.compute_name):
+        reactive_methods = obj._reactive_methods
+        instance_attributes = obj.__dict__
+        if (
+            compute_name := self.compute_name
+        ) in reactive_methods or compute_name in instance_attributes:
             raise AttributeError(
                 f"Can't set {obj}.{self.name!r}; reactive attributes with a compute method are read-only"
             )
@@ -335,12 +428,14 @@ class Reactive(Generic[ReactiveType]):
         name = self.name
         current_value = getattr(obj, name)
         # Check for private and public validate functions.
-        private_validate_function = getattr(obj, f"_validate_{name}", None)
-        if callable(private_validate_function):
-            value = private_validate_function(value)
-        public_validate_function = getattr(obj, f"validate_{name}", None)
-        if callable(public_validate_function):
-            value = public_validate_function(value)
+        for validate_name in self.validate_names:
+            if (
+                validate_name in reactive_methods
+                or validate_name in instance_attributes
+            ):
+                validate_function = getattr(obj, validate_name)
+                if callable(validate_function):
+                    value = validate_function(value)
 
         # Toggle the classes using the value's truthiness
         if (toggle_class := self._toggle_class) is not None:
@@ -355,7 +450,7 @@ class Reactive(Generic[ReactiveType]):
             self._check_watchers(obj, name, current_value)
 
             if self._run_compute:
-                self._compute(obj)
+                self._compute(obj, name)
 
             if self._bindings:
                 obj.refresh_bindings()
@@ -387,13 +482,13 @@ class Reactive(Generic[ReactiveType]):
         internal_name = f"_reactive_{name}"
         value = getattr(obj, internal_name)
 
-        private_watch_function = getattr(obj, f"_watch_{name}", None)
-        if callable(private_watch_function):
-            invoke_watcher(obj, private_watch_function, old_value, value)
-
-        public_watch_function = getattr(obj, f"watch_{name}", None)
-        if callable(public_watch_function):
-            invoke_watcher(obj, public_watch_function, old_value, value)
+        reactive_methods = obj._reactive_methods
+        instance_attributes = obj.__dict__
+        for watch_name in obj._reactives[name].watch_names:
+            if watch_name in reactive_methods or watch_name in instance_attributes:
+                watch_function = getattr(obj, watch_name)
+                if callable(watch_function):
+                    invoke_watcher(obj, watch_function, old_value, value)
 
         # Process "global" watchers
         watchers: list[tuple[Reactable, WatchCallbackType]]
@@ -410,25 +505,34 @@ class Reactive(Generic[ReactiveType]):
                     invoke_watcher(reactable, callback, old_value, value)
 
     @classmethod
-    def _compute(cls, obj: Reactable) -> None:
-        """Invoke all computes.
+    def _compute(cls, obj: Reactable, name: str | None = None) -> None:
+        """Invoke computes.
+
+        Compute methods record the reactives they read when they run. If a reactive name
+        is given, only computes which read that reactive, which declare it with
+        [`depends_on`][textual.reactive.depends_on], or which have yet to record their
+        dependencies, are invoked.
 
         Args:
             obj: Reactable object.
+            name: Name of the reactive which changed, or `None` to invoke all computes.
         """
         _rich_traceback_guard = True
-        for compute in obj._reactives.keys() & obj._computes:
-            try:
-                compute_method = getattr(obj, f"compute_{compute}")
-            except AttributeError:
-                try:
-                    compute_method = getattr(obj, f"_compute_{compute}")
-                except AttributeError:
+        dependencies: dict[str, set[str]] = getattr(obj, "__compute_dependencies", {})
+        for compute, compute_name, declared in obj._reactive_computes:
+            if name is not None and (
+                declared is None or (declared and name not in declared)
+            ):
+                compute_dependencies = dependencies.get(compute)
+                if compute_dependencies and name not in compute_dependencies:
                     continue
+            compute_method = getattr(obj, compute_name, None)
+            if compute_method is None:
+                continue
             current_value = getattr(
                 obj, f"_reactive_{compute}", getattr(obj, f"_default_{compute}", None)
             )
-            value = compute_method()
+            value = _invoke_compute(obj, compute, compute_method)
             setattr(obj, f"_reactive_{compute}", value)
             if value != current_value:
                 cls._check_watchers(obj, compute, current_value)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 from rich.color import Color
 
+from textual._color_pipeline import blend_rich_colors
+
 
 def blend_colors(color1: Color, color2: Color, ratio: float) -> Color:
     """Given two RGB colors, return a color that sits some distance between
@@ -25,3 +29,24 @@ def blend_colors(color1: Color, color2: Color, ratio: float) -> Color:
         g1 + (g2 - g1) * ratio,
         b1 + (b2 - b1) * ratio,
     )
+
+
+def blend_colors_batch(
+    color1: Color, color2: Color, ratios: Sequence[float]
+) -> list[Color]:
+    """Blend two RGB colors by a number of ratios at once.
+
+    Equivalent to calling [blend_colors][textual.renderables._blend_colors.blend_colors]
+    for each ratio.
+
+    Args:
+        color1: The first color.
+        color2: The second color.
+        ratios: The ratios of color1 to color2.
+
+    Returns:
+        A Color for each ratio.
+    """
+    if color1.triplet is None or color2.triplet is None:
+        return [color2] * len(ratios)
+    return blend_rich_colors([color1] * len(ratios), [color2] * len(ratios), ratios)
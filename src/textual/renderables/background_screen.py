@@ -1,35 +1,61 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable
+from itertools import islice
+from typing import TYPE_CHECKING, Hashable, Iterable
 
 from rich.console import Console, ConsoleOptions, RenderResult
 from rich.segment import Segment
 from rich.style import Style
 
+from textual._color_pipeline import StyleCache, tint_styles
+from textual._context import active_app
 from textual.color import Color
+from textual.strip import Strip
+from textual.style import Style as VisualStyle
+from textual.visual import RenderOptions, Visual
 
 if TYPE_CHECKING:
+    from textual.css.styles import RulesMap
     from textual.screen import Screen
 
+BACKGROUND_CACHE = StyleCache()
+"""Cache of tinted background styles."""
 
-class BackgroundScreen:
-    """Tints a renderable and removes links / meta."""
+
+class BackgroundCache:
+    """The most recent tinted render of a background screen."""
+
+    def __init__(self) -> None:
+        self.key: Hashable = None
+        """The screen, composition version, size, tint, and style of the cached render."""
+        self.strips: list[Strip] = []
+        """Tinted strips."""
+        self.recompositions = 0
+        """Number of times the background screen was rendered (i.e. cache misses)."""
+
+
+class BackgroundScreen(Visual):
+    """Tints a screen and removes links / meta."""
 
     def __init__(
         self,
         screen: Screen,
         color: Color,
+        cache: BackgroundCache | None = None,
     ) -> None:
         """Initialize a BackgroundScreen instance.
 
         Args:
             screen: A Screen instance.
             color: A color (presumably with alpha).
+            cache: A cache for the tinted render, which is reused until the screen changes.
         """
         self.screen = screen
         """Screen to process."""
         self.color = color
         """Color to apply (should have alpha)."""
+        self.cache = cache
+        """Cache for the tinted render, or `None` to render every time."""
 
     @classmethod
     def process_segments(
@@ -44,8 +70,6 @@ class BackgroundScreen:
         Returns:
             Segments with applied tint.
         """
-        from_rich_color = Color.from_rich_color
-        style_from_color = Style.from_color
         _Segment = Segment
 
         NULL_STYLE = Style()
@@ -64,31 +88,23 @@ class BackgroundScreen:
                     )
             return
 
-        for segment in segments:
-            text, style, control = segment
-            if control:
+        segments = list(segments)
+        styles = [
+            (
+                None
+                if control
+                else NULL_STYLE if style is None else style.clear_meta_and_links()
+            )
+            for _, style, control in segments
+        ]
+        tinted_styles = BACKGROUND_CACHE.map_styles(
+            [style for style in styles if style is not None], tint_styles, color
+        )
+        for segment, style in zip(segments, styles):
+            if style is None:
                 yield segment
             else:
-                style = NULL_STYLE if style is None else style.clear_meta_and_links()
-                yield _Segment(
-                    text,
-                    (
-                        style
-                        + style_from_color(
-                            (
-                                (from_rich_color(style.color) + color).rich_color
-                                if style.color is not None
-                                else None
-                            ),
-                            (
-                                (from_rich_color(style.bgcolor) + color).rich_color
-                                if style.bgcolor is not None
-                                else None
-                            ),
-                        )
-                    ),
-                    control,
-                )
+                yield _Segment(segment.text, tinted_styles[style], segment.control)
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
@@ -96,3 +112,55 @@ class BackgroundScreen:
         segments = console.render(self.screen._compositor, options)
         color = self.color
         return self.process_segments(segments, color)
+
+    def render_strips(
+        self, width: int, height: int | None, style: VisualStyle, options: RenderOptions
+    ) -> list[Strip]:
+        """Render the tinted screen in to strips.
+
+        If there is a cache, and the screen hasn't changed since it was last rendered, the
+        cached strips are returned.
+
+        Args:
+            width: Width of desired render.
+            height: Height of desired render or `None` for any height.
+            style: The base style to render on top of.
+            options: Additional render options.
+
+        Returns:
+            A list of strips.
+        """
+        screen = self.screen
+        cache = self.cache
+        key = (screen, screen._compositor.version, width, height, self.color, style)
+        if cache is not None and cache.key == key:
+            return cache.strips
+        app = active_app.get()
+        console_options = app.console_options.update(
+            highlight=False, width=width, height=height
+        )
+        segments = self.process_segments(
+            app.console.render(screen._compositor, console_options), self.color
+        )
+        rich_style = style.rich_style
+        strips = [
+            Strip(line).apply_style(rich_style)
+            for line in islice(
+                Segment.split_and_crop_lines(
+                    segments, width, include_new_lines=False, pad=False
+                ),
+                None,
+                height,
+            )
+        ]
+        if cache is not None:
+            cache.key = key
+            cache.strips = strips
+            cache.recompositions += 1
+        return strips
+
+    def get_optimal_width(self, rules: RulesMap, container_width: int) -> int:
+        return container_width
+
+    def get_height(self, rules: RulesMap, width: int) -> int:
+        return self.screen.size.height
@@ -10,7 +10,7 @@ from rich.measure import Measurement
 from rich.segment import Segment
 from rich.style import Style
 
-from textual.renderables._blend_colors import blend_colors
+from textual.renderables._blend_colors import blend_colors_batch
 
 T = TypeVar("T", int, float)
 
@@ -99,38 +99,34 @@ class Sparkline(Generic[T]):
 
         buckets = tuple(self._buckets(list(self.data), num_buckets=width))
 
+        # The height of each bar, which is the same for every line
+        height_ratios: list[float] = []
+        bucket_index = 0.0
+        step = len(buckets) / width
+        for _ in range(width):
+            partition = buckets[int(bucket_index)]
+            partition_summary = summary_function(partition)
+            height_ratios.append((partition_summary - minimum) / extent)
+            bucket_index += step
+        bar_indexes = [
+            int(height_ratio * bar_segments) for height_ratio in height_ratios
+        ]
+        bar_styles = [
+            Style.from_color(bar_color)
+            for bar_color in blend_colors_batch(min_color, max_color, height_ratios)
+        ]
+
         for i in reversed(range(height)):
             current_bar_part_low = i * bar_line_segments
             current_bar_part_high = (i + 1) * bar_line_segments
 
-            bucket_index = 0.0
-            bars_rendered = 0
-            step = len(buckets) / width
-            while bars_rendered < width:
-                partition = buckets[int(bucket_index)]
-                partition_summary = summary_function(partition)
-                height_ratio = (partition_summary - minimum) / extent
-                bar_index = int(height_ratio * bar_segments)
-
+            for bar_index, style in zip(bar_indexes, bar_styles):
                 if bar_index < current_bar_part_low:
-                    bar = " "
-                    with_color = False
+                    yield Segment(" ", None)
                 elif bar_index >= current_bar_part_high:
-                    bar = "█"
-                    with_color = True
+                    yield Segment("█", style)
                 else:
-                    bar = self.BARS[bar_index % bar_line_segments]
-                    with_color = True
-
-                if with_color:
-                    bar_color = blend_colors(min_color, max_color, height_ratio)
-                    style = Style.from_color(bar_color)
-                else:
-                    style = None
-
-                bars_rendered += 1
-                bucket_index += step
-                yield Segment(bar, style)
+                    yield Segment(self.BARS[bar_index % bar_line_segments], style)
 
             if i > 0:
                 yield Segment.line()
@@ -11,7 +11,7 @@ from rich.terminal_theme import TerminalTheme
 from textual._ansi_theme import DEFAULT_TERMINAL_THEME
 from textual._context import active_app
 from textual.color import TRANSPARENT
-from textual.filter import ANSIToTruecolor
+from textual.filter import get_truecolor_filter
 from textual.renderables._blend_colors import blend_colors
 
 
@@ -88,7 +88,7 @@ class TextOpacity:
                 # Special case for native ANSI
                 # Without RGB we can't accurately calculate the foreground color
                 DIM = Style(dim=True)
-                filter = ANSIToTruecolor(ansi_theme)
+                filter = get_truecolor_filter(ansi_theme)
                 segments_ = list(segments)
                 for original_segment, segment in zip(
                     segments_, filter.apply(segments_, TRANSPARENT)
@@ -125,7 +125,7 @@ class TextOpacity:
                     else:
                         yield segment
             else:
-                filter = ANSIToTruecolor(ansi_theme)
+                filter = get_truecolor_filter(ansi_theme)
                 for segment in filter.apply(list(segments), TRANSPARENT):
                     # use Tuple rather than tuple so Python 3.7 doesn't complain
                     text, style, control = segment
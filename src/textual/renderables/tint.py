@@ -2,13 +2,41 @@ from __future__ import annotations
 
 from typing import Iterable
 
+from rich.color import Color as RichColor
 from rich.console import RenderableType
 from rich.segment import Segment
 from rich.style import Style
 from rich.terminal_theme import TerminalTheme
 
+from textual._color_pipeline import StyleCache, tint_styles
 from textual.color import TRANSPARENT, Color
-from textual.filter import ANSIToTruecolor
+from textual.filter import get_truecolor_filter
+
+TINT_CACHE = StyleCache()
+"""Cache of tinted styles."""
+
+
+def _tint_styles(
+    styles: list[Style],
+    color: Color,
+    ansi_theme: TerminalTheme,
+    background: RichColor,
+) -> list[Style]:
+    """Convert styles to truecolor, then tint them.
+
+    Args:
+        styles: Styles to tint.
+        color: Color of tint.
+        ansi_theme: The TerminalTheme defining how to map ansi colors to hex.
+        background: Background color.
+
+    Returns:
+        Tinted styles.
+    """
+    truecolor_styles = get_truecolor_filter(ansi_theme).truecolor_styles(
+        styles, background
+    )
+    return tint_styles(truecolor_styles, color)
 
 
 class Tint:
@@ -47,40 +75,30 @@ class Tint:
         Returns:
             Segments with applied tint.
         """
-        from_rich_color = Color.from_rich_color
-        style_from_color = Style.from_color
-        _Segment = Segment
-
-        truecolor_style = ANSIToTruecolor(ansi_theme).truecolor_style
-        background_rich_color = background.rich_color
-
+        segments = list(segments)
         NULL_STYLE = Style()
-        for segment in segments:
-            text, style, control = segment
-            if control:
-                yield segment
-            else:
-                style = (
-                    truecolor_style(style, background_rich_color)
-                    if style is not None
-                    else NULL_STYLE
-                )
-                yield _Segment(
-                    text,
-                    (
-                        style
-                        + style_from_color(
-                            (
-                                (from_rich_color(style.color) + color).rich_color
-                                if style.color is not None
-                                else None
-                            ),
-                            (
-                                (from_rich_color(style.bgcolor) + color).rich_color
-                                if style.bgcolor is not None
-                                else None
-                            ),
-                        )
-                    ),
-                    control,
+        tinted_styles = TINT_CACHE.map_styles(
+            [
+                NULL_STYLE if style is None else style
+                for _, style, control in segments
+                if not control
+            ],
+            _tint_styles,
+            color,
+            ansi_theme,
+            background.rich_color,
+        )
+        _Segment = Segment
+        return [
+            (
+                segment
+                if segment.control
+                else _Segment(
+                    segment.text,
+                    tinted_styles[
+                        NULL_STYLE if segment.style is None else segment.style
+                    ],
                 )
+            )
+            for segment in segments
+        ]
@@ -10,7 +10,6 @@ from __future__ import annotations
 
 import asyncio
 from functools import partial
-from operator import attrgetter
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -19,7 +18,6 @@ from typing import (
     ClassVar,
     Generic,
     Iterable,
-    Iterator,
     Literal,
     NamedTuple,
     Optional,
@@ -37,6 +35,7 @@ from textual._auto_scroll import get_auto_scroll_regions
 from textual._callback import invoke
 from textual._compositor import Compositor, MapGeometry
 from textual._context import active_message_pump, visible_screen_stack
+from textual._focus_order import FocusOrder
 from textual._path import (
     CSSPathType,
     _css_path_type_as_list,
@@ -56,7 +55,7 @@ from textual.geometry import Offset, Region, Shape, Size
 from textual.keys import key_to_character
 from textual.layout import DockArrangeResult
 from textual.reactive import Reactive, var
-from textual.renderables.background_screen import BackgroundScreen
+from textual.renderables.background_screen import BackgroundCache, BackgroundScreen
 from textual.renderables.blank import Blank
 from textual.selection import SELECT_ALL, SelectEnd, Selection, SelectStart, SelectState
 from textual.signal import Signal
@@ -67,16 +66,13 @@ from textual.widgets import Tooltip
 from textual.widgets._toast import ToastRack
 
 if TYPE_CHECKING:
-    from typing_extensions import Final
+    from typing_extensions import Self
 
     from textual.command import Provider
 
     # Unused & ignored imports are needed for the docs to link to these objects:
     from textual.message_pump import MessagePump
 
-# Screen updates will be batched so that they don't happen more often than 60 times per second:
-UPDATE_PERIOD: Final[float] = 1 / constants.MAX_FPS
-
 ScreenResultType = TypeVar("ScreenResultType")
 """The result type of a screen."""
 
@@ -254,6 +250,9 @@ class Screen(Generic[ScreenResultType], Widget):
     selections: var[dict[Widget, Selection]] = var(dict)
     """Map of widgets and selected ranges."""
 
+    # Screens are busy (layout and repaints), so keep their tasks running
+    _park_when_idle: ClassVar[bool] = False
+
     _selecting = var(False)
     """Indicates mouse selection is in progress."""
 
@@ -287,10 +286,11 @@ class Screen(Generic[ScreenResultType], Widget):
             classes: The CSS classes for the screen.
         """
         self._modal = False
+        self._layout_widgets: dict[DOMNode, set[Widget]] = {}
+        """Widgets whose layout may have changed."""
         super().__init__(name=name, id=id, classes=classes)
         self._compositor = Compositor()
         self._dirty_widgets: set[Widget] = set()
-        self.__update_timer: Timer | None = None
         self._callbacks: list[tuple[CallbackType, MessagePump]] = []
         self._result_callbacks: list[ResultCallback[ScreenResultType | None]] = []
 
@@ -318,6 +318,14 @@ class Screen(Generic[ScreenResultType], Widget):
         self.bindings_updated_signal: Signal[Screen] = Signal(self, "bindings_updated")
         """A signal published when the bindings have been updated"""
 
+        self._binding_chain_cache: (
+            tuple[tuple[object, ...], list[tuple[DOMNode, BindingsMap]]] | None
+        ) = None
+        """Cache key and binding chain."""
+
+        self._focus_order: FocusOrder | None = None
+        """Cached focus order, or `None` if the layout changed."""
+
         self.text_selection_started_signal: Signal[Screen] = Signal(
             self, "selection_started"
         )
@@ -326,17 +334,26 @@ class Screen(Generic[ScreenResultType], Widget):
         self._css_update_count = -1
         """Track updates to CSS."""
 
-        self._layout_widgets: dict[DOMNode, set[Widget]] = {}
-        """Widgets whose layout may have changed."""
-
         self._auto_select_scroll_timer: Timer | None = None
         """A timer to auto scroll a container."""
 
+        self._background_cache = BackgroundCache()
+        """The tinted render of the screen below (if the background is translucent)."""
+
     @property
     def is_modal(self) -> bool:
         """Is the screen modal?"""
         return self._modal
 
+    @property
+    def background_recompositions(self) -> int:
+        """The number of times the screen below was rendered as this screen's background.
+
+        If the screen has a translucent background, the screen below is rendered and tinted.
+        The result is reused until the screen below changes.
+        """
+        return self._background_cache.recompositions
+
     @property
     def is_current(self) -> bool:
         """Is the screen current (i.e. visible to user)?"""
@@ -347,15 +364,6 @@ class Screen(Generic[ScreenResultType], Widget):
         except ScreenStackError:
             return False
 
-    @property
-    def _update_timer(self) -> Timer:
-        """Timer used to perform updates."""
-        if self.__update_timer is None:
-            self.__update_timer = self.set_interval(
-                UPDATE_PERIOD, self._on_timer_update, name="screen_update", pause=True
-            )
-        return self.__update_timer
-
     @property
     def layers(self) -> tuple[str, ...]:
         """Layers from parent.
@@ -391,6 +399,7 @@ class Screen(Generic[ScreenResultType], Widget):
 
     def refresh_bindings(self) -> None:
         """Call to request a refresh of bindings."""
+        self.app._bindings_updates += 1
         self.bindings_updated_signal.publish(self)
 
     def _watch_maximized(
@@ -412,16 +421,21 @@ class Screen(Generic[ScreenResultType], Widget):
         if focused is not None and focused.loading:
             focused = None
 
-        namespace_bindings: list[tuple[DOMNode, BindingsMap]]
-        if focused is None:
-            namespace_bindings = [
-                (self, self._bindings.copy()),
-                (self.app, self.app._bindings.copy()),
-            ]
-        else:
-            namespace_bindings = [
-                (node, node._bindings.copy()) for node in focused.ancestors_with_self
-            ]
+        app = self.app
+        namespaces: list[DOMNode] = (
+            [self, app] if focused is None else focused.ancestors_with_self
+        )
+        # The chain is cached until focus, the DOM, bindings, or the keymap change
+        cache_key = (app._bindings_updates, *namespaces)
+        if (
+            self._binding_chain_cache is not None
+            and self._binding_chain_cache[0] == cache_key
+        ):
+            return self._binding_chain_cache[1]
+
+        namespace_bindings: list[tuple[DOMNode, BindingsMap]] = [
+            (node, node._bindings.copy()) for node in namespaces
+        ]
 
         # Filter out bindings that could be captures by widgets (such as Input, TextArea)
         filter_namespaces: list[DOMNode] = []
@@ -443,6 +457,7 @@ class Screen(Generic[ScreenResultType], Widget):
                 if result.clashed_bindings:
                     self.app.handle_bindings_clash(result.clashed_bindings, namespace)
 
+        self._binding_chain_cache = (cache_key, namespace_bindings)
         return namespace_bindings
 
     @property
@@ -508,7 +523,14 @@ class Screen(Generic[ScreenResultType], Widget):
             Widget locations.
         """
         # This is customized over the base class to allow for a widget to be maximized
-        cache_key = (size, self._nodes._updates, self.maximized)
+        cache_key = (
+            size,
+            self.size,
+            self._nodes._updates,
+            self._layout_updates,
+            sum([child.styles._cache_key for child in self._nodes]),
+            self.maximized,
+        )
         cached_result = self._arrangement_cache.get(cache_key)
         if cached_result is not None:
             return cached_result
@@ -611,7 +633,7 @@ class Screen(Generic[ScreenResultType], Widget):
 
         if base_screen is not None and base_screen is not self and background.a < 1:
             # If background is translucent, render a background screen
-            return BackgroundScreen(base_screen, background)
+            return BackgroundScreen(base_screen, background, self._background_cache)
 
         if background.is_transparent:
             # If the background is transparent, defer to App.render
@@ -768,62 +790,33 @@ class Screen(Generic[ScreenResultType], Widget):
             **{child: select_all for child in widget.query("*")},
         }
 
-    @property
-    def focus_chain(self) -> list[Widget]:
-        """A list of widgets that may receive focus, in focus order."""
-        # TODO: Calculating a focus chain is moderately expensive.
-        # Suspect we can move focus without calculating the entire thing again.
+    def _get_focus_order(self) -> FocusOrder:
+        """Get the focus order, building it if the DOM or layout changed.
 
-        widgets: list[Widget] = []
-        add_widget = widgets.append
-        focus_sorter = attrgetter("_focus_sort_key")
-        # We traverse the DOM and keep track of where we are at with a node stack.
-        # Additionally, we manually keep track of the visibility of the DOM
-        # instead of relying on the property `.visible` to save on DOM traversals.
-        # node_stack: list[tuple[iterator over node children, node visibility]]
+        Returns:
+            Focus order for the screen.
+        """
+        focus_order = self._focus_order
+        if focus_order is None or focus_order.updates != self._nodes._updates:
+            focus_order = self._focus_order = FocusOrder(self, self._nodes._updates)
+        return focus_order
 
-        root_node = self.screen
+    def _get_focus_root(self) -> DOMNode:
+        """Get the root of the focus chain (the screen, or a widget which traps focus).
 
+        Returns:
+            Root node.
+        """
         if (focused := self.focused) is not None:
             for node in focused.ancestors_with_self:
                 if node._trap_focus:
-                    root_node = node
-                    break
+                    return node
+        return self
 
-        node_stack: list[tuple[Iterator[Widget], bool]] = [
-            (
-                iter(sorted(root_node.displayed_children, key=focus_sorter)),
-                self.visible,
-            )
-        ]
-        pop = node_stack.pop
-        push = node_stack.append
-
-        while node_stack:
-            children_iterator, parent_visibility = node_stack[-1]
-            node = next(children_iterator, None)
-            if node is None:
-                pop()
-            else:
-                if node._check_disabled():
-                    continue
-                node_styles_visibility = node.styles.get_rule("visibility")
-                node_is_visible = (
-                    node_styles_visibility != "hidden"
-                    if node_styles_visibility
-                    else parent_visibility  # Inherit visibility if the style is unset.
-                )
-                if node.is_container and node.allow_focus_children():
-                    sorted_displayed_children = sorted(
-                        node.displayed_children, key=focus_sorter
-                    )
-                    push((iter(sorted_displayed_children), node_is_visible))
-                # Same check as `if node.focusable`, but we cached inherited visibility
-                # and we also skipped disabled nodes altogether.
-                if node_is_visible and node.allow_focus():
-                    add_widget(node)
-
-        return widgets
+    @property
+    def focus_chain(self) -> list[Widget]:
+        """A list of widgets that may receive focus, in focus order."""
+        return self._get_focus_order().get_chain(self._get_focus_root(), self.visible)
 
     def _move_focus(
         self, direction: int = 0, selector: str | type[QueryType] = "*"
@@ -848,49 +841,65 @@ class Screen(Generic[ScreenResultType], Widget):
         if not isinstance(selector, str):
             selector = selector.__name__
         selector_set = parse_selectors(selector)
-        focus_chain = self.focus_chain
+        focus_order = self._get_focus_order()
+        focus_root = self._get_focus_root()
+        visible = self.visible
+        index_range = focus_order.get_range(focus_root)
 
         # If a widget is maximized we want to limit the focus chain to the visible widgets
-        if self.maximized is not None:
-            focusable = set(self.maximized.walk_children(with_self=True))
-            focus_chain = [widget for widget in focus_chain if widget in focusable]
+        if (maximized := self.maximized) is not None:
+            maximized_index = focus_order.indexes.get(maximized)
+            if maximized_index is None:
+                index_range = range(0)
+            else:
+                index_range = range(
+                    max(index_range.start, maximized_index),
+                    min(index_range.stop, focus_order.ends[maximized_index]),
+                )
 
-        filtered_focus_chain = (
-            node for node in focus_chain if match(selector_set, node)
-        )
+        matches_selector = partial(match, selector_set)
+        first_index = index_range.start - 1
 
-        if not focus_chain:
+        if focus_order.find(focus_root, visible, index_range, first_index) is None:
             # Nothing focusable, so nothing to do
             return self.focused
         if self.focused is None:
             # Nothing currently focused, so focus the first one.
-            to_focus = next(filtered_focus_chain, None)
-            self.set_focus(to_focus)
+            self.set_focus(
+                focus_order.find(
+                    focus_root, visible, index_range, first_index, 1, matches_selector
+                )
+            )
             return self.focused
 
         # Ensure focus will be in a node that matches the selectors.
         if not direction and not match(selector_set, self.focused):
             direction = 1
 
-        try:
-            # Find the index of the currently focused widget
-            current_index = focus_chain.index(self.focused)
-        except ValueError:
+        # Find the index of the currently focused widget
+        current_index = focus_order.indexes.get(self.focused, -1)
+        if current_index not in index_range or not focus_order.is_focusable(
+            current_index, focus_root, visible
+        ):
             # Focused widget was removed in the interim, start again
-            self.set_focus(next(filtered_focus_chain, None))
+            self.set_focus(
+                focus_order.find(
+                    focus_root, visible, index_range, first_index, 1, matches_selector
+                )
+            )
         else:
             # Only move the focus if we are currently showing the focus
             if direction:
-                to_focus = None
-                chain_length = len(focus_chain)
-                for step in range(1, len(focus_chain) + 1):
-                    node = focus_chain[
-                        (current_index + direction * step) % chain_length
-                    ]
-                    if match(selector_set, node):
-                        to_focus = node
-                        break
-                self.set_focus(to_focus)
+                self.set_focus(
+                    focus_order.find(
+                        focus_root,
+                        visible,
+                        index_range,
+                        current_index,
+                        direction,
+                        matches_selector,
+                    )
+                )
 
         return self.focused
 
@@ -1180,7 +1189,7 @@ class Screen(Generic[ScreenResultType], Widget):
                 or self._recompose_required
                 or self._dirty_widgets
             ):
-                self._update_timer.resume()
+                self.app._frame_clock.request_update(self)
                 return
 
         await self._invoke_and_clear_callbacks()
@@ -1197,14 +1206,17 @@ class Screen(Generic[ScreenResultType], Widget):
                     app._previous_inline_height is not None
                     and inline_height < app._previous_inline_height
                 )
-                app._display(
-                    self,
-                    self._compositor.render_inline(
-                        app.size.with_height(inline_height),
-                        screen_stack=app._background_screens,
-                        clear=clear,
-                    ),
+                inline_update = self._compositor.render_inline(
+                    app.size.with_height(inline_height),
+                    screen_stack=app._background_screens,
+                    clear=clear,
+                    previous_update=app._previous_inline_update,
                 )
+                if inline_update is None:
+                    # No lines changed, but the cursor may have moved
+                    app._update_inline_cursor()
+                else:
+                    app._display(self, inline_update)
                 app._previous_inline_height = inline_height
                 self._dirty_widgets.clear()
                 self._compositor._dirty_regions.clear()
@@ -1234,8 +1246,8 @@ class Screen(Generic[ScreenResultType], Widget):
         app._update_mouse_over(self)
 
     def _on_timer_update(self) -> None:
-        """Called by the _update_timer."""
-        self._update_timer.pause()
+        """Called by the app's frame clock to update the screen."""
+        self.app._frame_clock.discard_update(self)
         if self.is_current and not self.app._batch_count:
             if self._layout_required:
                 self._refresh_layout(scroll=self._scroll_required)
@@ -1315,13 +1327,17 @@ class Screen(Generic[ScreenResultType], Widget):
 
     def _refresh_layout(self, size: Size | None = None, scroll: bool = False) -> None:
         """Refresh the layout (can change size and positions of widgets)."""
+        # If the size is given, then the screen was resized and everything needs a layout
+        layout_roots: set[Widget] | None = None if size is None else set()
         size = self.outer_size if size is None else size
         if self.app.is_inline:
             size = size.with_height(self.app._get_inline_height())
         if not size:
             return
         self._compositor.update_widgets(self._dirty_widgets)
-        self._update_timer.pause()
+        self.app._frame_clock.discard_update(self)
+        # Focus order depends on the position of widgets
+        self._focus_order = None
         ResizeEvent = events.Resize
 
         try:
@@ -1349,7 +1365,11 @@ class Screen(Generic[ScreenResultType], Widget):
                                 )
 
             else:
-                hidden, shown, resized = self._compositor.reflow(self, size)
+                if layout_roots is None:
+                    layout_roots = self._get_layout_roots()
+                hidden, shown, resized, arranged = self._compositor.reflow(
+                    self, size, layout_roots or None
+                )
                 self._layout_widgets.clear()
                 Hide = events.Hide
                 Show = events.Show
@@ -1360,7 +1380,7 @@ class Screen(Generic[ScreenResultType], Widget):
                 # We want to send a resize event to widgets that were just added or change since last layout
                 send_resize = shown | resized
 
-                layers = self._compositor.layers
+                layers = self._compositor.layers if arranged is None else arranged
                 for widget, (
                     region,
                     _order,
@@ -1395,6 +1415,50 @@ class Screen(Generic[ScreenResultType], Widget):
             self.app.post_message(events.Ready())
             self.app._dom_ready = True
 
+    def _get_layout_roots(self) -> set[Widget]:
+        """Get the containers which need to be arranged, after widgets requested a layout.
+
+        These are the first ancestors of widgets that requested a layout, that don't have
+        auto dimensions (and so won't change size as a result of the layout).
+
+        Returns:
+            A set of containers, or an empty set if the whole screen needs a layout.
+        """
+        if self in self._layout_widgets:
+            return set()
+        return {
+            node
+            for node in self._layout_widgets
+            if isinstance(node, Widget) and not node.styles.auto_dimensions
+        }
+
+    def refresh(
+        self,
+        *regions: Region,
+        repaint: bool = True,
+        layout: bool = False,
+        recompose: bool = False,
+    ) -> Self:
+        """Initiate a refresh of the screen.
+
+        See [Widget.refresh][textual.widget.Widget.refresh] for details.
+
+        Args:
+            *regions: Additional screen regions to mark as dirty.
+            repaint: Repaint the widget (will call render() again).
+            layout: Also layout widgets in the view.
+            recompose: Re-compose the widget (will remove and re-mount children).
+
+        Returns:
+            The `Screen` instance.
+        """
+        if layout:
+            # A layout of the screen requires that every widget be arranged
+            self._layout_widgets.setdefault(self, set())
+        return super().refresh(
+            *regions, repaint=repaint, layout=layout, recompose=recompose
+        )
+
     async def _on_update(self, message: messages.Update) -> None:
         message.stop()
         message.prevent_default()
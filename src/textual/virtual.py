@@ -0,0 +1,389 @@
+"""
+A container which mounts only the children that are visible.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import Callable
+
+from textual import events
+from textual._prefix_sum import PrefixSum
+from textual.containers import ScrollableContainer
+from textual.geometry import NULL_OFFSET, NULL_SPACING, Region, Size
+from textual.layout import DockArrangeResult, WidgetPlacement
+from textual.scrollbar import ScrollBar
+from textual.widget import AwaitMount, Widget
+
+
+class VirtualScroll(ScrollableContainer):
+    """A vertically scrolling container for a very large number of items.
+
+    Rather than mounting a widget for every item, widgets are created on demand (with a
+    factory callable), for the items which are visible plus an "overscan" margin
+    above and below. As the user scrolls, widgets for items which leave the window are
+    *recycled* for items entering the window, if an `update_item` callable is supplied,
+    otherwise they are removed.
+
+    Items may have a fixed height (the default), or `item_height` may be an *estimate*.
+    With estimated heights, items are measured when they are mounted, and the scrollable
+    area is adjusted accordingly.
+
+    Example:
+        ```python
+        def compose(self) -> ComposeResult:
+            yield VirtualScroll(
+                100_000,
+                lambda index: Label(f"Item {index}"),
+                update_item=lambda label, index: label.update(f"Item {index}"),
+            )
+        ```
+    """
+
+    DEFAULT_CSS = """
+    VirtualScroll {
+        overflow-x: hidden;
+        overflow-y: auto;
+    }
+    """
+
+    def __init__(
+        self,
+        item_count: int,
+        create_item: Callable[[int], Widget],
+        *,
+        update_item: Callable[[Widget, int], object] | None = None,
+        item_height: int = 1,
+        estimate_height: bool = False,
+        overscan: int = 10,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+        can_focus: bool | None = None,
+        can_focus_children: bool | None = None,
+        can_maximize: bool | None = None,
+    ) -> None:
+        """
+        Construct a virtual scroll container.
+
+        Args:
+            item_count: Number of items.
+            create_item: Callable which takes the index of an item, and returns a new widget.
+            update_item: Callable which takes a widget (previously returned from `create_item`)
+                and an index, and updates the widget to display the item. If `None`, widgets
+                won't be recycled.
+            item_height: Height of items, in lines.
+            estimate_height: If `True`, then `item_height` is an estimate, and items will be
+                measured once mounted. If `False`, all items are exactly `item_height` lines.
+            overscan: Number of additional items to mount above and below the visible items.
+            name: The name of the widget.
+            id: The ID of the widget in the DOM.
+            classes: The CSS classes for the widget.
+            disabled: Whether the widget is disabled or not.
+            can_focus: Can this container be focused?
+            can_focus_children: Can this container's children be focused?
+            can_maximize: Allow this container to maximize? `None` to use default logic.
+        """
+        super().__init__(
+            name=name,
+            id=id,
+            classes=classes,
+            disabled=disabled,
+            can_focus=can_focus,
+            can_focus_children=can_focus_children,
+            can_maximize=can_maximize,
+        )
+        self._create_item = create_item
+        self._update_item = update_item
+        self._item_height = max(1, item_height)
+        self._estimate_height = estimate_height
+        self.overscan = overscan
+        """Number of additional items to mount above and below the visible items."""
+        self._heights = PrefixSum([self._item_height] * item_count)
+        """Height of each item (measured or estimated)."""
+        self._items: dict[int, Widget] = {}
+        """Mounted widgets, keyed by item index."""
+        self._item_indexes: dict[Widget, int] = {}
+        """Maps widgets on to the index of the item they display."""
+        self._spare_widgets: list[Widget] = []
+        """Mounted but hidden widgets, available for recycling."""
+
+    @property
+    def item_count(self) -> int:
+        """The number of items."""
+        return len(self._heights)
+
+    @property
+    def window(self) -> range:
+        """The range of item indexes which currently have a widget."""
+        if not self._items:
+            return range(0)
+        return range(min(self._items), max(self._items) + 1)
+
+    def get_item_widget(self, index: int) -> Widget | None:
+        """Get the widget displaying an item.
+
+        Args:
+            index: Index of the item.
+
+        Returns:
+            A widget, or `None` if the item is outside of the window.
+        """
+        return self._items.get(index)
+
+    def get_item_index(self, widget: Widget) -> int | None:
+        """Get the index of the item a widget is displaying.
+
+        Args:
+            widget: A child widget.
+
+        Returns:
+            Index of the item, or `None` if the widget isn't displaying an item.
+        """
+        return self._item_indexes.get(widget)
+
+    def get_item_offset(self, index: int) -> int:
+        """Get the line on which an item starts.
+
+        Args:
+            index: Index of the item.
+
+        Returns:
+            Offset (in lines) from the top of the scrollable area.
+        """
+        return self._heights.offset(index)
+
+    def scroll_to_item(self, index: int, *, animate: bool = False) -> None:
+        """Scroll so that an item is at the top of the container.
+
+        Args:
+            index: Index of the item.
+            animate: Animate the scroll.
+        """
+        self.scroll_to(y=self._heights.offset(index), animate=animate, immediate=True)
+
+    def refresh_items(self, item_count: int | None = None) -> None:
+        """Refresh the items in the window, optionally changing the number of items.
+
+        Call this when the data the items are created from has changed.
+
+        Args:
+            item_count: New number of items, or `None` for no change.
+        """
+        if item_count is not None and item_count != self.item_count:
+            heights = self._heights
+            if item_count > len(heights):
+                heights.extend([self._item_height] * (item_count - len(heights)))
+            else:
+                self._heights = PrefixSum(heights[index] for index in range(item_count))
+        # Release all the items, so that the window is rebuilt
+        recycled = list(self._items.values())
+        self._items.clear()
+        self._item_indexes.clear()
+        self._refresh_window(recycled)
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if round(old_value) != round(new_value):
+            self._refresh_window()
+
+    def _on_resize(self) -> None:
+        self._refresh_window()
+
+    def _on_mount(self, event: events.Mount) -> None:
+        self._refresh_window()
+
+    def _measure_items(self) -> None:
+        """Measure the mounted items, if the item height is an estimate.
+
+        If any items changed height, the heights are updated and the layout is refreshed.
+        """
+        if not self._estimate_height:
+            return
+        size = self.scrollable_content_region.size
+        if not size.width:
+            return
+        viewport = self.screen.size
+        heights = self._heights
+        scroll_index = heights.find(round(self.scroll_y))
+        scroll_shift = 0
+        resized = False
+        for widget, index in self._item_indexes.items():
+            if not widget.is_mounted:
+                continue
+            box_model = widget._get_box_model(
+                size,
+                viewport,
+                Fraction(size.width),
+                Fraction(size.height),
+                greedy=False,
+            )
+            height = int(box_model.height) + box_model.margin.height
+            if height != heights[index]:
+                resized = True
+                if index < scroll_index:
+                    scroll_shift += height - heights[index]
+                heights[index] = height
+        if scroll_shift:
+            # Measured items above the scroll position changed size;
+            # keep the visible items where they were.
+            scroll_y = max(0, round(self.scroll_y) + scroll_shift)
+            self.set_reactive(VirtualScroll.scroll_y, scroll_y)
+            self.set_reactive(VirtualScroll.scroll_target_y, scroll_y)
+            self.vertical_scrollbar.set_reactive(ScrollBar.position, scroll_y)
+        if resized:
+            self._layout_updates += 1
+            self.refresh(layout=True)
+
+    async def _refresh_mounted(self, await_mount: AwaitMount) -> None:
+        """Measure newly mounted items, and refresh the window, which they may change.
+
+        Args:
+            await_mount: An awaitable for the mount of the new items.
+        """
+        await await_mount
+        self._refresh_window()
+
+    def _get_window_indexes(self) -> range:
+        """Get the indexes of items which should have a widget.
+
+        Returns:
+            A range of item indexes.
+        """
+        heights = self._heights
+        height = self.container_size.height or self.screen.size.height
+        scroll_y = round(self.scroll_y)
+        overscan = self.overscan
+        first = max(0, heights.find(scroll_y) - overscan)
+        last = min(len(heights), heights.find(scroll_y + height) + 1 + overscan)
+        return range(first, last)
+
+    def _refresh_window(self, recycled: list[Widget] | None = None) -> None:
+        """Create, recycle, or remove widgets, so that the window contains the visible items.
+
+        Args:
+            recycled: Widgets which are no longer displaying an item.
+        """
+        if not self.is_attached:
+            return
+        self._measure_items()
+        window = self._get_window_indexes()
+        items = self._items
+        item_indexes = self._item_indexes
+        if recycled is None:
+            recycled = []
+        for index in [index for index in items if index not in window]:
+            widget = items.pop(index)
+            del item_indexes[widget]
+            recycled.append(widget)
+
+        new_indexes = [index for index in window if index not in items]
+        if not new_indexes and not recycled:
+            return
+
+        new_widgets: list[Widget] = []
+        update_item = self._update_item
+        if update_item is not None:
+            recycled.extend(self._spare_widgets)
+            self._spare_widgets.clear()
+        for index in new_indexes:
+            if update_item is not None and recycled:
+                widget = recycled.pop()
+                update_item(widget, index)
+                widget.display = True
+            else:
+                widget = self._create_item(index)
+                new_widgets.append(widget)
+            items[index] = widget
+            item_indexes[widget] = index
+
+        if recycled:
+            if update_item is None:
+                self.remove_children(recycled)
+            else:
+                for widget in recycled:
+                    widget.display = False
+                self._spare_widgets.extend(recycled)
+        if new_widgets:
+            await_mount = self.mount_all(new_widgets)
+            if self._estimate_height:
+                self.call_later(self._refresh_mounted, await_mount)
+        # Keep the children in the order of their items (followed by spare widgets),
+        # so that the focus chain follows the items.
+        spare_index = len(self._heights)
+        get_index = item_indexes.get
+        indexes = [get_index(child, spare_index) for child in self._nodes]
+        if indexes != sorted(indexes):
+            self.sort_children(key=lambda child: get_index(child, spare_index))
+        # Items may have moved without changing the children, which would otherwise
+        # allow a cached arrangement to be reused.
+        self._layout_updates += 1
+        self.refresh(layout=True)
+
+    def arrange(self, size: Size, optimal: bool = False) -> DockArrangeResult:
+        """Arrange the widgets in the window at the offset of their items.
+
+        Args:
+            size: Size of container.
+            optimal: Ignored.
+
+        Returns:
+            Widget locations.
+        """
+        viewport = self.screen.size
+        cache_key = (size, viewport, self._nodes._updates, self._layout_updates)
+        cached_result = self._arrangement_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
+        heights = self._heights
+        width = size.width
+        items = sorted(
+            (index, widget)
+            for widget, index in self._item_indexes.items()
+            if widget.is_mounted
+        )
+
+        if self._estimate_height:
+            # Items are measured (and the heights updated) when the window is refreshed
+            box_models = [
+                widget._get_box_model(
+                    size, viewport, Fraction(width), Fraction(size.height), greedy=False
+                )
+                for _, widget in items
+            ]
+            placements = [
+                WidgetPlacement(
+                    Region(
+                        box_model.margin.left,
+                        heights.offset(index) + box_model.margin.top,
+                        int(box_model.width),
+                        int(box_model.height),
+                    ),
+                    NULL_OFFSET,
+                    box_model.margin,
+                    widget,
+                )
+                for (index, widget), box_model in zip(items, box_models)
+            ]
+        else:
+            item_height = self._item_height
+            placements = [
+                WidgetPlacement(
+                    Region(0, index * item_height, width, item_height),
+                    NULL_OFFSET,
+                    NULL_SPACING,
+                    widget,
+                )
+                for index, widget in items
+            ]
+
+        arrangement = self._arrangement_cache[cache_key] = DockArrangeResult(
+            placements,
+            {widget for _, widget in items},
+            NULL_SPACING,
+            "vertical",
+            Size(width, heights.total),
+        )
+        return arrangement
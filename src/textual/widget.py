@@ -5,10 +5,19 @@ This module contains the `Widget` class, the base class for all widgets.
 
 from __future__ import annotations
 
-from asyncio import create_task, gather, wait
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    create_task,
+    gather,
+    get_running_loop,
+    wait,
+)
 from collections import Counter
 from contextlib import asynccontextmanager
+from contextvars import copy_context
 from fractions import Fraction
+from functools import partial
 from time import monotonic
 from types import TracebackType
 from typing import (
@@ -55,6 +64,7 @@ from textual._debug import get_caller_file_and_line
 from textual._dispatch_key import dispatch_key
 from textual._easing import DEFAULT_SCROLL_EASING
 from textual._extrema import Extrema
+from textual._spatial_map import SpatialIndexType
 from textual._styles_cache import StylesCache
 from textual._types import AnimationLevel
 from textual.actions import SkipAction
@@ -334,6 +344,32 @@ class Widget(DOMNode):
     BLANK: ClassVar[bool] = False
     """Is this widget blank (no border, no content)? Enable for very large scrolling containers."""
 
+    SPATIAL_INDEX: ClassVar[SpatialIndexType] = "auto"
+    """The spatial index used to find visible children when scrolling.
+
+    - `"auto"` Pick an index based on the arrangement of children (default).
+    - `"grid"` Use a grid, suitable for most containers.
+    - `"vertical"` Index children by their vertical position, for very tall containers.
+    """
+
+    THREADED_RENDER: ClassVar[bool] = False
+    """Render content in a thread? Enable for widgets with an expensive `render()`.
+
+    The renderable returned from `render()` is rendered to lines in a thread, and the
+    previous render is displayed until it is ready. The renderable should not be
+    modified after it is returned. Only applies to widgets which don't override
+    `render_line` or `render_lines`.
+    """
+
+    PARALLEL_RENDER: ClassVar[bool] = False
+    """Render in parallel with other widgets? Enable only if `render()` is thread-safe.
+
+    If `TEXTUAL_RENDER_THREADS` is more than 1, widgets which enable this are rendered
+    in a pool of threads, while other widgets render on the event loop's thread. `render()`
+    must not modify state shared with other widgets or the app. Only applies to widgets
+    which don't override `render_line` or `render_lines`.
+    """
+
     can_focus: bool = False
     """Widget may receive focus."""
     can_focus_children: bool = True
@@ -389,6 +425,9 @@ class Widget(DOMNode):
     # Default sort order, incremented by constructor
     _sort_order: ClassVar[int] = 0
 
+    # Most widgets are idle most of the time, so don't keep a task while idle
+    _park_when_idle: ClassVar[bool] = True
+
     _PSEUDO_CLASSES: ClassVar[dict[str, Callable[[Widget], bool]]] = {
         "hover": lambda widget: widget.mouse_hover,
         "focus": lambda widget: widget.has_focus,
@@ -462,6 +501,10 @@ class Widget(DOMNode):
         """Cache busting integer."""
 
         self._render_cache = _RenderCache(_null_size, [])
+        self._render_future: Future[list[Strip]] | None = None
+        """A render in progress, if `THREADED_RENDER` is enabled."""
+        self._render_again = False
+        """Render again when the render in progress completes?"""
         # Regions which need to be updated (in Widget)
         self._dirty_regions: set[Region] = set()
         # Regions which need to be transferred from cache to screen
@@ -473,9 +516,10 @@ class Widget(DOMNode):
         self._content_width_cache: tuple[object, int] = (None, 0)
         self._content_height_cache: tuple[object, int] = (None, 0)
 
-        self._arrangement_cache: FIFOCache[
-            tuple[Size, int, bool], DockArrangeResult
-        ] = FIFOCache(4)
+        # Keyed on a tuple of the arrange inputs, which subclasses may extend
+        self._arrangement_cache: FIFOCache[tuple[object, ...], DockArrangeResult] = (
+            FIFOCache(4)
+        )
 
         self._styles_cache = StylesCache()
         self._rich_style_cache: dict[tuple[str, ...], tuple[Style, Style]] = {}
@@ -1344,21 +1388,28 @@ class Widget(DOMNode):
         Returns:
             Widget locations.
         """
-        cache_key = (size, self._nodes._updates, optimal)
+        viewport = self.screen.size
+        # The layout updates count is incremented when any child requests a layout,
+        # and style versions only increase, so their sum changes when any child's
+        # styles change. Arrangements may be reused until a child (or the children) change.
+        cache_key = (
+            size,
+            viewport,
+            self._nodes._updates,
+            self._layout_updates,
+            sum([child.styles._cache_key for child in self._nodes]),
+            optimal,
+        )
         cached_result = self._arrangement_cache.get(cache_key)
         if cached_result is not None:
             return cached_result
 
         arrangement = self._arrangement_cache[cache_key] = arrange(
-            self, self._nodes, size, self.screen.size, optimal=optimal
+            self, self._nodes, size, viewport, optimal=optimal
         )
 
         return arrangement
 
-    def _clear_arrangement_cache(self) -> None:
-        """Clear arrangement cache, forcing a new arrange operation."""
-        self._arrangement_cache.clear()
-
     def _get_virtual_dom(self) -> Iterable[Widget]:
         """Get widgets not part of the DOM.
 
@@ -4242,11 +4293,76 @@ class Widget(DOMNode):
     def _render_content(self) -> None:
         """Render all lines."""
         width, height = self.size
+        if self.THREADED_RENDER and self._is_mounted:
+            self._dirty_regions.clear()
+            if self._render_future is not None:
+                self._render_again = True
+                return
+            try:
+                loop = get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                self._render_content_in_thread(loop, width, height)
+                return
         visual = self._render()
         strips = Visual.to_strips(self, visual, width, height, self.visual_style)
         self._render_cache = _RenderCache(self.size, strips)
         self._dirty_regions.clear()
 
+    def _render_content_in_thread(
+        self, loop: AbstractEventLoop, width: int, height: int
+    ) -> None:
+        """Render all lines in a thread (used when `THREADED_RENDER` is enabled).
+
+        Args:
+            loop: The running event loop.
+            width: Width of the render.
+            height: Height of the render.
+        """
+        # The visual is created here, so the thread renders a snapshot of the widget
+        visual = self._render()
+        render_strips = partial(
+            copy_context().run,
+            Visual.to_strips,
+            self,
+            visual,
+            width,
+            height,
+            self.visual_style,
+        )
+        self._render_future = future = loop.run_in_executor(None, render_strips)
+        future.add_done_callback(partial(self._on_threaded_render, Size(width, height)))
+
+    def _on_threaded_render(self, size: Size, future: Future[list[Strip]]) -> None:
+        """Display the result of a render in a thread.
+
+        Args:
+            size: Size of the render.
+            future: The future for the render.
+        """
+        self._render_future = None
+        if future.cancelled() or self._closing or self._closed:
+            return
+        try:
+            strips = future.result()
+        except Exception as error:
+            self.app._handle_exception(error)
+            return
+        self._render_cache = _RenderCache(size, strips)
+        # Repaint the new render, without rendering the content again
+        self._styles_cache.clear()
+        self._styles_cache.set_dirty(self.size.region)
+        outer_size = self.outer_size
+        if outer_size:
+            self._repaint_regions.add(outer_size.region)
+        self._repaint_required = True
+        self.check_idle()
+        if self._render_again:
+            # The widget was refreshed while rendering
+            self._render_again = False
+            self.refresh()
+
     def render_line(self, y: int) -> Strip:
         """Render a line of content.
 
@@ -4570,7 +4686,7 @@ class Widget(DOMNode):
                     for ancestor in self.ancestors:
                         if not isinstance(ancestor, Widget):
                             break
-                        ancestor._clear_arrangement_cache()
+                        # Invalidates the ancestor's arrangement
                         ancestor._layout_updates += 1
                         if not ancestor.styles.auto_dimensions:
                             break
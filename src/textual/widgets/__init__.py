@@ -48,6 +48,7 @@ if typing.TYPE_CHECKING:
     from textual.widgets._text_area import TextArea
     from textual.widgets._tooltip import Tooltip
     from textual.widgets._tree import Tree
+    from textual.widgets._virtual_list_view import VirtualListView
     from textual.widgets._welcome import Welcome
 
 __all__ = [
@@ -92,6 +93,7 @@ __all__ = [
     "TextArea",
     "Tooltip",
     "Tree",
+    "VirtualListView",
     "Welcome",
 ]
 
@@ -40,4 +40,5 @@ from ._tabs import Tabs as Tabs
 from ._text_area import TextArea as TextArea
 from ._tooltip import Tooltip as Tooltip
 from ._tree import Tree as Tree
+from ._virtual_list_view import VirtualListView as VirtualListView
 from ._welcome import Welcome as Welcome
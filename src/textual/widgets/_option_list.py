@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, ClassVar, Iterable, Sequence, cast
+from typing import TYPE_CHECKING, ClassVar, Iterable, Sequence, overload
 
 import rich.repr
 from rich.segment import Segment
+from rich.text import Text
 
 from textual import _widget_navigation, events
-from textual._loop import loop_last
+from textual._prefix_sum import PrefixSum
+from textual._search_index import SearchIndex
 from textual.binding import Binding, BindingType
 from textual.cache import LRUCache
-from textual.css.styles import RulesMap
+from textual.content import Content
 from textual.geometry import Region, Size, Spacing, clamp
 from textual.message import Message
 from textual.reactive import reactive
@@ -23,6 +26,9 @@ if TYPE_CHECKING:
     from typing_extensions import Self, TypeAlias
 
 
+_MEASURE_ALL_LIMIT = 1000
+"""Option lists with up to this many options are measured in full, so the scrollbar is exact."""
+
 OptionListContent: TypeAlias = "Option | VisualType | None"
 """Types accepted in OptionList constructor and [add_options()][textual.widgets.OptionList.ads_options]."""
 
@@ -92,17 +98,65 @@ class Option:
 
 @dataclass
 class _LineCache:
-    """Cached line information."""
+    """Cached line information.
+
+    Options are measured lazily, as they are displayed. The height of an option which
+    hasn't been measured is estimated from the number of lines it would occupy if the
+    prompt fits on a single line.
+    """
 
-    lines: list[tuple[int, int]] = field(default_factory=list)
-    heights: dict[int, int] = field(default_factory=dict)
-    index_to_line: dict[int, int] = field(default_factory=dict)
+    heights: PrefixSum = field(default_factory=PrefixSum)
+    """Displayed height of each option (zero if the option is hidden by a filter)."""
+    option_heights: list[int] = field(default_factory=list)
+    """Height of each option (measured or estimated), including any divider."""
+    measured: bytearray = field(default_factory=bytearray)
+    """Non-zero for each option which has been measured."""
+    width: int = 0
+    """Width used to measure the options."""
 
     def clear(self) -> None:
         """Reset all caches."""
-        self.lines.clear()
-        self.heights.clear()
-        self.index_to_line.clear()
+        self.heights = PrefixSum()
+        self.option_heights.clear()
+        self.measured.clear()
+
+
+class _HiddenOption:
+    """Stands in for an option hidden by a filter, when navigating."""
+
+    disabled = True
+
+
+_HIDDEN_OPTION = _HiddenOption()
+
+
+class _FilteredOptions(Sequence["Option | _HiddenOption"]):
+    """A view of the options where hidden options are replaced with a disabled placeholder."""
+
+    def __init__(self, options: list[Option], hidden: bytearray) -> None:
+        """
+        Args:
+            options: All options.
+            hidden: Non-zero for each hidden option.
+        """
+        self._options = options
+        self._hidden = hidden
+
+    def __len__(self) -> int:
+        return len(self._options)
+
+    @overload
+    def __getitem__(self, index: int) -> Option | _HiddenOption: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Option | _HiddenOption]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> Option | _HiddenOption | list[Option | _HiddenOption]:
+        if isinstance(index, slice):
+            return [self[item] for item in range(len(self._options))[index]]
+        return _HIDDEN_OPTION if self._hidden[index] else self._options[index]
 
 
 class OptionList(ScrollView, can_focus=True):
@@ -292,6 +346,13 @@ class OptionList(ScrollView, can_focus=True):
         self._line_cache = _LineCache()
         """Used to cache additional information that can be recomputed."""
 
+        self._search_index: SearchIndex | None = None
+        """Index of the prompts, built when first searched."""
+        self._filter_query = ""
+        """The query used to filter options."""
+        self._hidden: bytearray | None = None
+        """Non-zero for each option hidden by the filter, or `None` if not filtered."""
+
         self.add_options(content)
         if self._options:
             # TODO: Inherited from previous version. Do we always want this?
@@ -334,6 +395,9 @@ class OptionList(ScrollView, can_focus=True):
         self._option_render_cache.clear()
         self._id_to_option.clear()
         self._option_to_index.clear()
+        self._search_index = None
+        if self._hidden is not None:
+            self._hidden.clear()
         self.highlighted = None
         self.refresh()
         self.scroll_y = 0
@@ -354,6 +418,9 @@ class OptionList(ScrollView, can_focus=True):
         self._option_render_cache.clear()
         self._id_to_option.clear()
         self._option_to_index.clear()
+        self._search_index = None
+        if self._hidden is not None:
+            self._hidden.clear()
         self.highlighted = None
         self.scroll_y = 0
         self.add_options(options)
@@ -406,6 +473,7 @@ class OptionList(ScrollView, can_focus=True):
                     raise DuplicateID(f"Unable to add {option!r} due to duplicate ID")
                 self._id_to_option[option._id] = option
             add_option(option)
+        self._update_hidden()
         if self.is_mounted:
             self.refresh(layout=self.styles.auto_dimensions)
             self._update_lines()
@@ -492,7 +560,7 @@ class OptionList(ScrollView, can_focus=True):
         self._options[index].disabled = disabled
         if index == self.highlighted:
             self.highlighted = _widget_navigation.find_next_enabled(
-                self._options, anchor=index, direction=1
+                self._navigation_options, anchor=index, direction=1
             )
         # TODO: Refresh only if the affected option is visible.
         self.refresh()
@@ -583,6 +651,8 @@ class OptionList(ScrollView, can_focus=True):
         if option._id is not None:
             del self._id_to_option[option._id]
         del self._option_to_index[option]
+        self._search_index = None
+        self._apply_filter()
         self.highlighted = self.highlighted
         self._clear_caches()
         return self
@@ -642,6 +712,8 @@ class OptionList(ScrollView, can_focus=True):
             OptionDoesNotExist: If there is no option with the given index.
         """
         self.get_option_at_index(index)._set_prompt(prompt)
+        self._search_index = None
+        self._apply_filter()
         self._clear_caches()
 
     def replace_option_prompt(self, option_id: str, prompt: VisualType) -> Self:
@@ -677,28 +749,152 @@ class OptionList(ScrollView, can_focus=True):
         return self
 
     @property
-    def _lines(self) -> Sequence[tuple[int, int]]:
-        """A sequence of pairs of ints for each line, used internally.
+    def filter_query(self) -> str:
+        """The query used to filter options, or an empty string if options aren't filtered."""
+        return self._filter_query
 
-        The first int is the index of the option, and second is the line offset.
+    def filter_options(self, query: str) -> Self:
+        """Hide the options which don't contain the query in their prompt.
 
-        !!! note "This is read-only"
+        The search is case-insensitive. Hidden options remain in
+        [options][textual.widgets.OptionList.options] (with the same indices), but aren't
+        displayed, and are skipped when moving the highlight.
+
+        Args:
+            query: Text to search for, or an empty string to show all options.
 
         Returns:
-            A sequence of tuples.
+            The `OptionList` instance.
         """
-        self._update_lines()
-        return self._line_cache.lines
+        self._filter_query = query
+        self._apply_filter()
+        highlighted = self.highlighted
+        if self._hidden is not None and (
+            highlighted is None or self._hidden[highlighted]
+        ):
+            self.highlighted = _widget_navigation.find_first_enabled(
+                self._navigation_options
+            )
+        if self.is_mounted:
+            self.refresh(layout=self.styles.auto_dimensions)
+            self._update_lines()
+            self.scroll_to_highlight()
+        return self
+
+    def _get_search_text(self, option: Option) -> str | None:
+        """Get the text to search for an option.
+
+        Args:
+            option: An option.
+
+        Returns:
+            Text to search, or `None` if the option's prompt can't be searched.
+        """
+        prompt = option.prompt
+        if isinstance(prompt, str):
+            return prompt
+        if isinstance(prompt, (Text, Content)):
+            return prompt.plain
+        return None
+
+    def _get_search_index(self) -> SearchIndex:
+        """Get the search index, indexing any new options.
+
+        Returns:
+            The search index.
+        """
+        if (search_index := self._search_index) is None:
+            search_index = self._search_index = SearchIndex()
+        options = self._options
+        if len(search_index) < len(options):
+            get_search_text = self._get_search_text
+            search_index.extend(
+                [get_search_text(option) for option in options[len(search_index) :]]
+            )
+        return search_index
+
+    def _search_options(self, query: str) -> list[int]:
+        """Find the options whose prompt contains a query (case-insensitive).
+
+        Args:
+            query: Text to search for.
+
+        Returns:
+            Indices of matching options, in ascending order.
+        """
+        return self._get_search_index().search(query)
+
+    def _apply_filter(self) -> None:
+        """Update the hidden options, and their heights, from the filter query."""
+        if not self._filter_query:
+            self._hidden = None
+        else:
+            hidden = bytearray(b"\x01") * len(self._options)
+            for index in self._search_options(self._filter_query):
+                hidden[index] = 0
+            self._hidden = hidden
+        line_cache = self._line_cache
+        if line_cache.option_heights:
+            hidden_options = self._hidden
+            line_cache.heights = PrefixSum(
+                line_cache.option_heights
+                if hidden_options is None
+                else [
+                    0 if is_hidden else height
+                    for height, is_hidden in zip(
+                        line_cache.option_heights, hidden_options
+                    )
+                ]
+            )
+
+    def _update_hidden(self) -> None:
+        """Apply the filter to options which were added since it was last applied."""
+        hidden = self._hidden
+        if hidden is None or len(hidden) >= len(self._options):
+            return
+        texts = self._get_search_index().texts
+        query = self._filter_query.lower()
+        hidden.extend(
+            [text is None or query not in text for text in texts[len(hidden) :]]
+        )
 
     @property
-    def _heights(self) -> dict[int, int]:
+    def _navigation_options(self) -> Sequence[Option | _HiddenOption]:
+        """The options to navigate, where hidden options appear disabled."""
+        if self._hidden is None:
+            return self._options
+        return _FilteredOptions(self._options, self._hidden)
+
+    def _get_line_option(self, y: int) -> tuple[int, int]:
+        """Get the option displayed on a line.
+
+        Args:
+            y: A line number.
+
+        Raises:
+            IndexError: If there is no option on the line.
+
+        Returns:
+            A tuple of the index of the option, and the offset of the line within the option.
+        """
         self._update_lines()
-        return self._line_cache.heights
+        heights = self._line_cache.heights
+        if y < 0 or y >= heights.total:
+            raise IndexError(y)
+        index = heights.find(y)
+        return index, y - heights.offset(index)
 
-    @property
-    def _index_to_line(self) -> dict[int, int]:
+    def _get_option_line(self, index: int) -> int:
+        """Get the line on which an option starts.
+
+        Args:
+            index: Index of an option.
+
+        Returns:
+            A line number.
+        """
         self._update_lines()
-        return self._line_cache.index_to_line
+        return self._line_cache.heights.offset(index)
 
     def _clear_caches(self) -> None:
         self._option_render_cache.clear()
@@ -710,7 +906,9 @@ class OptionList(ScrollView, can_focus=True):
         super().notify_style_update()
 
     def _on_resize(self):
-        self._clear_caches()
+        # The line cache is discarded if the width has changed
+        self._option_render_cache.clear()
+        self.refresh()
 
     def on_show(self) -> None:
         self.scroll_to_highlight()
@@ -807,32 +1005,136 @@ class OptionList(ScrollView, can_focus=True):
             self._option_render_cache[cache_key] = strips
         return strips
 
-    def _update_lines(self) -> None:
-        """Update internal structures when new lines are added."""
-        if not self.scrollable_content_region:
-            return
+    def _get_line_cache(self, width: int) -> _LineCache:
+        """Get the line cache, with an entry for every option.
 
+        Args:
+            width: Width available to the prompts.
+
+        Returns:
+            The line cache.
+        """
         line_cache = self._line_cache
-        lines = line_cache.lines
-        next_index = lines[-1][0] + 1 if lines else 0
-        get_visual = self._get_visual
-        width = self.scrollable_content_region.width - self._get_left_gutter_width()
+        if line_cache.width != width:
+            line_cache.clear()
+            line_cache.width = width
+        heights = line_cache.heights
+        options = self._options
+        if len(heights) < len(options):
+            # Estimate the height of new options; they will be measured when displayed
+            start = len(heights)
+            new_heights = [1 + option._divider for option in options[start:]]
+            line_cache.option_heights.extend(new_heights)
+            if (hidden := self._hidden) is not None:
+                new_heights = [
+                    0 if hidden[index] else height
+                    for index, height in enumerate(new_heights, start)
+                ]
+            if len(new_heights) > len(heights):
+                line_cache.heights = PrefixSum([*heights, *new_heights])
+            else:
+                heights.extend(new_heights)
+            line_cache.measured.extend(bytes(len(new_heights)))
+        if len(options) <= _MEASURE_ALL_LIMIT and b"\x00" in line_cache.measured:
+            self._measure_options(line_cache, 0, sys.maxsize)
+        return line_cache
 
-        if next_index < len(self.options):
-            padding = self.get_component_styles("option-list--option").padding
-            for index, option in enumerate(self.options[next_index:], next_index):
-                line_cache.index_to_line[index] = len(line_cache.lines)
+    def _measure_options(
+        self, line_cache: _LineCache, index: int, height: int, direction: int = 1
+    ) -> bool:
+        """Measure consecutive options, until they cover a number of lines.
+
+        Args:
+            line_cache: The line cache.
+            index: Index of the first option to measure.
+            height: Number of lines to cover.
+            direction: `1` to measure subsequent options, or `-1` to measure prior options.
+
+        Returns:
+            `True` if the heights of any options changed, otherwise `False`.
+        """
+        heights = line_cache.heights
+        option_heights = line_cache.option_heights
+        measured = line_cache.measured
+        hidden = self._hidden
+        options = self._options
+        option_count = len(options)
+        get_visual = self._get_visual
+        styles = self.styles
+        width = line_cache.width
+        changed = False
+        while 0 <= index < option_count and height > 0:
+            if hidden is not None and hidden[index]:
+                index += direction
+                continue
+            if not measured[index]:
+                option = options[index]
                 line_count = (
-                    get_visual(option).get_height(self.styles, width - padding.width)
-                    + option._divider
-                )
-                line_cache.heights[index] = line_count
-                line_cache.lines.extend(
-                    [(index, line_no) for line_no in range(0, line_count)]
+                    get_visual(option).get_height(styles, width) + option._divider
                 )
+                measured[index] = 1
+                if option_heights[index] != line_count:
+                    option_heights[index] = line_count
+                    heights[index] = line_count
+                    changed = True
+            height -= heights[index]
+            index += direction
+        return changed
+
+    def _measure_lines(self, line_cache: _LineCache, y: int, height: int) -> bool:
+        """Measure the options displayed on a range of lines.
+
+        Args:
+            line_cache: The line cache.
+            y: First line.
+            height: Number of lines.
+
+        Returns:
+            `True` if the heights of any options changed, otherwise `False`.
+        """
+        heights = line_cache.heights
+        index = heights.find(y)
+        return self._measure_options(
+            line_cache, index, y + height - heights.offset(index)
+        )
+
+    def _get_measure_width(self, width: int) -> int:
+        """Get the width available to prompts.
 
-        last_divider = self.options and self.options[-1]._divider
-        virtual_size = Size(width, len(lines) - (1 if last_divider else 0))
+        Args:
+            width: Width of the content region.
+
+        Returns:
+            Width used to measure prompts.
+        """
+        padding = self.get_component_styles("option-list--option").padding
+        return width - self._get_left_gutter_width() - padding.width
+
+    def _update_lines(self, measure: bool = False) -> None:
+        """Update internal structures when options are added, or lines are displayed.
+
+        Args:
+            measure: Measure the options which are currently visible.
+        """
+        if not self.scrollable_content_region:
+            return
+
+        width = self.scrollable_content_region.width - self._get_left_gutter_width()
+        line_cache = self._get_line_cache(
+            self._get_measure_width(self.scrollable_content_region.width)
+        )
+        if measure and self._measure_lines(
+            line_cache, self.scroll_offset.y, self.scrollable_content_region.height
+        ):
+            if self.styles.auto_dimensions:
+                self.refresh(layout=True)
+
+        last_divider = (
+            self.options and self.options[-1]._divider and line_cache.heights[-1]
+        )
+        virtual_size = Size(
+            width, line_cache.heights.total - (1 if last_divider else 0)
+        )
         if virtual_size != self.virtual_size:
             self.virtual_size = virtual_size
             self._scroll_update(virtual_size)
@@ -857,34 +1159,32 @@ class OptionList(ScrollView, can_focus=True):
         return width
 
     def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
-        """Get height for the given width."""
-        styles = self.styles
-        rules = cast(RulesMap, styles)
-        padding_width = self.get_component_styles("option-list--option").padding.width
-        get_visual = self._get_visual
-        height = sum(
-            (
-                get_visual(option).get_height(rules, width - padding_width)
-                + (1 if option._divider and not last else 0)
-            )
-            for last, option in loop_last(self.options)
-        )
-        return height
+        """Get height for the given width.
+
+        Only the options which fit within the container (or viewport) are measured; the
+        height of any remaining options is estimated.
+        """
+        if not self.options:
+            return 0
+        line_cache = self._get_line_cache(self._get_measure_width(width))
+        self._measure_lines(line_cache, 0, max(container.height, viewport.height))
+        last_divider = self.options[-1]._divider and line_cache.heights[-1]
+        return line_cache.heights.total - (1 if last_divider else 0)
 
     def _get_line(self, style: Style, y: int) -> Strip:
-        index, line_offset = self._lines[y]
+        index, line_offset = self._get_line_option(y)
         option = self.get_option_at_index(index)
         strips = self._get_option_render(option, style)
         return strips[line_offset]
 
     def render_lines(self, crop: Region) -> list[Strip]:
-        self._update_lines()
+        self._update_lines(measure=True)
         return super().render_lines(crop)
 
     def render_line(self, y: int) -> Strip:
         line_number = self.scroll_offset.y + y
         try:
-            option_index, line_offset = self._lines[line_number]
+            option_index, line_offset = self._get_line_option(line_number)
             option = self.options[option_index]
         except IndexError:
             return Strip.blank(
@@ -947,12 +1247,22 @@ class OptionList(ScrollView, can_focus=True):
             return
 
         self._update_lines()
-
-        try:
-            y = self._index_to_line[highlighted]
-        except KeyError:
+        line_cache = self._line_cache
+        if highlighted >= len(line_cache.heights):
             return
-        height = self._heights[highlighted]
+        # Measure the options which may be visible after scrolling, so that the
+        # position of the highlighted option doesn't change when they are displayed
+        viewport_height = self.scrollable_content_region.height
+        measured_after = self._measure_options(line_cache, highlighted, viewport_height)
+        measured_before = self._measure_options(
+            line_cache, highlighted - 1, viewport_height, -1
+        )
+        if measured_after or measured_before:
+            self._update_lines()
+            if self.styles.auto_dimensions:
+                self.refresh(layout=True)
+        y = line_cache.heights.offset(highlighted)
+        height = line_cache.heights[highlighted]
 
         self.scroll_to_region(
             Region(0, y, self.scrollable_content_region.width, height),
@@ -965,7 +1275,7 @@ class OptionList(ScrollView, can_focus=True):
     def action_cursor_up(self) -> None:
         """Move the highlight up to the previous enabled option."""
         self.highlighted = _widget_navigation.find_next_enabled(
-            self.options,
+            self._navigation_options,
             anchor=self.highlighted,
             direction=-1,
         )
@@ -973,18 +1283,22 @@ class OptionList(ScrollView, can_focus=True):
     def action_cursor_down(self) -> None:
         """Move the highlight down to the next enabled option."""
         self.highlighted = _widget_navigation.find_next_enabled(
-            self.options,
+            self._navigation_options,
             anchor=self.highlighted,
             direction=1,
         )
 
     def action_first(self) -> None:
         """Move the highlight to the first enabled option."""
-        self.highlighted = _widget_navigation.find_first_enabled(self.options)
+        self.highlighted = _widget_navigation.find_first_enabled(
+            self._navigation_options
+        )
 
     def action_last(self) -> None:
         """Move the highlight to the last enabled option."""
-        self.highlighted = _widget_navigation.find_last_enabled(self.options)
+        self.highlighted = _widget_navigation.find_last_enabled(
+            self._navigation_options
+        )
 
     def _move_page(self, direction: _widget_navigation.Direction) -> None:
         """Move the height roughly by one page in the given direction.
@@ -998,14 +1312,16 @@ class OptionList(ScrollView, can_focus=True):
             return
 
         height = self.scrollable_content_region.height
+        self._update_lines()
+        heights = self._line_cache.heights
         y = clamp(
-            self._index_to_line[self.highlighted or 0] + direction * height,
+            heights.offset(self.highlighted or 0) + direction * height,
             0,
-            len(self._lines) - 1,
+            heights.total - 1,
         )
-        option_index = self._lines[y][0]
+        option_index = heights.find(y)
         self.highlighted = _widget_navigation.find_next_enabled_no_wrap(
-            candidates=self._options,
+            candidates=self._navigation_options,
             anchor=option_index,
             direction=direction,
             with_anchor=True,
@@ -140,21 +140,14 @@ class SelectOverlay(OptionList):
         minimum_index: int | None = None
 
         query = query.lower()
-        for index, option in enumerate(self._options):
-            prompt = option.prompt
-            if isinstance(prompt, Text):
-                lower_prompt = prompt.plain.lower()
-            elif isinstance(prompt, str):
-                lower_prompt = prompt.lower()
-            else:
-                continue
-
-            match_index = lower_prompt.find(query)
-            if match_index != -1 and (
-                minimum_index is None or match_index < minimum_index
-            ):
+        texts = self._get_search_index().texts
+        for index in self._search_options(query):
+            match_index = texts[index].find(query)  # type: ignore[union-attr]
+            if minimum_index is None or match_index < minimum_index:
                 best_match = index
                 minimum_index = match_index
+                if not match_index:
+                    break
 
         return best_match
 
@@ -522,10 +522,10 @@ class SelectionList(Generic[SelectionType], OptionList):
         # is place a CheckBox-a-like button next to it. So to start with
         # let's pull out the actual Selection we're looking at right now.
         _, scroll_y = self.scroll_offset
-        selection_index = scroll_y + y
         try:
+            selection_index, _ = self._get_line_option(scroll_y + y)
             selection = self.get_option_at_index(selection_index)
-        except OptionDoesNotExist:
+        except (IndexError, OptionDoesNotExist):
             return line
 
         # Figure out which component style is relevant for a checkbox on
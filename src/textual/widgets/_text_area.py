@@ -906,6 +906,8 @@ TextArea {
     def _watch_read_only(self, read_only: bool) -> None:
         self.set_class(read_only, "-read-only")
         self._set_theme(self._theme.name)
+        # Keys consumed by the TextArea depend on read_only
+        self.refresh_bindings()
 
     def _recompute_cursor_offset(self):
         """Recompute the (x, y) coordinate of the cursor in the wrapped document."""
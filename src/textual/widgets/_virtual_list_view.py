@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+from typing import Callable, ClassVar, Optional
+
+from textual import events
+from textual.binding import Binding, BindingType
+from textual.geometry import Region
+from textual.message import Message
+from textual.reactive import reactive
+from textual.virtual import VirtualScroll
+from textual.widget import Widget
+from textual.widgets._list_item import ListItem
+
+
+class VirtualListView(VirtualScroll, can_focus=True, can_focus_children=False):
+    """A list view for a very large number of items.
+
+    Rather than mounting a `ListItem` for every item, a `VirtualListView` creates
+    `ListItem`s only for the visible items, and *rebinds* them to other items as the list
+    scrolls. Items are identified by their index; the `create_item` callable creates a
+    `ListItem` for an index, and `update_item` updates an existing `ListItem` to display
+    a different index.
+
+    The `index` attribute, and the [Highlighted][textual.widgets.VirtualListView.Highlighted]
+    and [Selected][textual.widgets.VirtualListView.Selected] messages, work as they do for
+    [ListView][textual.widgets.ListView]. Note that the `item` in these messages is the
+    `ListItem` which displayed the item when the message was sent, which may later
+    be rebound to another item.
+
+    Example:
+        ```python
+        def compose(self) -> ComposeResult:
+            yield VirtualListView(
+                len(self.names),
+                lambda index: ListItem(Label(self.names[index])),
+                lambda item, index: item.query_one(Label).update(self.names[index]),
+            )
+        ```
+    """
+
+    DEFAULT_CSS = """
+    VirtualListView {
+        background: $surface;
+        & > ListItem {
+            color: $foreground;
+            height: auto;
+            overflow: hidden hidden;
+            width: 1fr;
+
+            &.-hovered {
+                background: $block-hover-background;
+            }
+
+            &.-highlight {
+                color: $block-cursor-blurred-foreground;
+                background: $block-cursor-blurred-background;
+                text-style: $block-cursor-blurred-text-style;
+            }
+        }
+
+        &:focus {
+            background-tint: $foreground 5%;
+            & > ListItem.-highlight {
+                color: $block-cursor-foreground;
+                background: $block-cursor-background;
+                text-style: $block-cursor-text-style;
+            }
+        }
+    }
+    """
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("enter", "select_cursor", "Select", show=False),
+        Binding("up", "cursor_up", "Cursor up", show=False),
+        Binding("down", "cursor_down", "Cursor down", show=False),
+    ]
+    """
+    | Key(s) | Description |
+    | :- | :- |
+    | enter | Select the current item. |
+    | up | Move the cursor up. |
+    | down | Move the cursor down. |
+    """
+
+    index = reactive[Optional[int]](None, init=False)
+    """The index of the currently highlighted item."""
+
+    class Highlighted(Message):
+        """Posted when the highlighted item changes.
+
+        Highlighted item is controlled using up/down keys.
+        Can be handled using `on_virtual_list_view_highlighted` in a subclass of
+        `VirtualListView` or in a parent widget in the DOM.
+        """
+
+        ALLOW_SELECTOR_MATCH = {"item"}
+        """Additional message attributes that can be used with the [`on` decorator][textual.on]."""
+
+        def __init__(self, list_view: VirtualListView, item: ListItem | None) -> None:
+            super().__init__()
+            self.list_view: VirtualListView = list_view
+            """The view that contains the item highlighted."""
+            self.item: ListItem | None = item
+            """The list item displaying the highlighted item, if there is one highlighted."""
+
+        @property
+        def control(self) -> VirtualListView:
+            """The view that contains the item highlighted.
+
+            This is an alias for [`Highlighted.list_view`][textual.widgets.VirtualListView.Highlighted.list_view]
+            and is used by the [`on`][textual.on] decorator.
+            """
+            return self.list_view
+
+    class Selected(Message):
+        """Posted when an item is selected, e.g. when you press the enter key on it.
+
+        Can be handled using `on_virtual_list_view_selected` in a subclass of
+        `VirtualListView` or in a parent widget in the DOM.
+        """
+
+        ALLOW_SELECTOR_MATCH = {"item"}
+        """Additional message attributes that can be used with the [`on` decorator][textual.on]."""
+
+        def __init__(
+            self, list_view: VirtualListView, item: ListItem, index: int
+        ) -> None:
+            super().__init__()
+            self.list_view: VirtualListView = list_view
+            """The view that contains the item selected."""
+            self.item: ListItem = item
+            """The list item displaying the selected item."""
+            self.index = index
+            """Index of the selected item."""
+
+        @property
+        def control(self) -> VirtualListView:
+            """The view that contains the item selected.
+
+            This is an alias for [`Selected.list_view`][textual.widgets.VirtualListView.Selected.list_view]
+            and is used by the [`on`][textual.on] decorator.
+            """
+            return self.list_view
+
+    def __init__(
+        self,
+        item_count: int,
+        create_item: Callable[[int], ListItem],
+        update_item: Callable[[ListItem, int], object],
+        *,
+        initial_index: int | None = 0,
+        item_height: int = 1,
+        estimate_height: bool = False,
+        overscan: int = 10,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """
+        Initialize a VirtualListView.
+
+        Args:
+            item_count: Number of items.
+            create_item: Callable which takes the index of an item, and returns a new `ListItem`.
+            update_item: Callable which takes a `ListItem` (previously returned from
+                `create_item`) and an index, and updates the `ListItem` to display the item.
+            initial_index: The index that should be highlighted when the list is first mounted.
+            item_height: Height of items, in lines.
+            estimate_height: If `True`, then `item_height` is an estimate, and items will be
+                measured once mounted. If `False`, all items are exactly `item_height` lines.
+            overscan: Number of additional items to mount above and below the visible items.
+            name: The name of the widget.
+            id: The unique ID of the widget used in CSS/query selection.
+            classes: The CSS classes of the widget.
+            disabled: Whether the VirtualListView is disabled or not.
+        """
+        super().__init__(
+            item_count,
+            self._create_list_item,
+            update_item=self._update_list_item,
+            item_height=item_height,
+            estimate_height=estimate_height,
+            overscan=overscan,
+            name=name,
+            id=id,
+            classes=classes,
+            disabled=disabled,
+        )
+        self._create_list_item_callback = create_item
+        self._update_list_item_callback = update_item
+        self._initial_index = initial_index
+
+    def _create_list_item(self, index: int) -> Widget:
+        """Create a list item, and highlight it if required.
+
+        Args:
+            index: Index of the item.
+
+        Returns:
+            A new list item.
+        """
+        list_item = self._create_list_item_callback(index)
+        list_item.highlighted = index == self.index
+        return list_item
+
+    def _update_list_item(self, list_item: Widget, index: int) -> None:
+        """Rebind a list item to another index, and highlight it if required.
+
+        Args:
+            list_item: A list item which was previously created.
+            index: Index of the item.
+        """
+        assert isinstance(list_item, ListItem)
+        self._update_list_item_callback(list_item, index)
+        list_item.highlighted = index == self.index
+
+    def _on_mount(self, event: events.Mount) -> None:
+        """Highlight the initial index."""
+        if self._initial_index is not None and self.item_count:
+            index = self._initial_index
+            if index >= self.item_count:
+                index = 0
+            self.index = index
+
+    @property
+    def highlighted_child(self) -> ListItem | None:
+        """The ListItem displaying the highlighted item, or None if nothing is highlighted."""
+        if self.index is None:
+            return None
+        list_item = self.get_item_widget(self.index)
+        assert list_item is None or isinstance(list_item, ListItem)
+        return list_item
+
+    def validate_index(self, index: int | None) -> int | None:
+        """Clamp the index to the valid range, or set to None if there's nothing to highlight.
+
+        Args:
+            index: The index to clamp.
+
+        Returns:
+            The clamped index.
+        """
+        if index is None or not self.item_count:
+            return None
+        return max(0, min(index, self.item_count - 1))
+
+    def watch_index(self, old_index: int | None, new_index: int | None) -> None:
+        """Updates the highlighting when the index changes."""
+        if old_index is not None:
+            old_child = self.get_item_widget(old_index)
+            if isinstance(old_child, ListItem):
+                old_child.highlighted = False
+
+        new_child: ListItem | None = None
+        if new_index is not None:
+            if self.region:
+                self._scroll_to_index(new_index)
+            else:
+                # Call after refresh to permit a refresh operation
+                self.call_after_refresh(self._scroll_to_index, new_index)
+            # Ensure there is a list item for the new index
+            self._refresh_window()
+            new_child = self.highlighted_child
+            if new_child is not None:
+                new_child.highlighted = True
+        self.post_message(self.Highlighted(self, new_child))
+
+    def _scroll_to_index(self, index: int) -> None:
+        """Scroll so that an item is visible.
+
+        Args:
+            index: Index of the item.
+        """
+        if index >= self.item_count:
+            return
+        heights = self._heights
+        self.scroll_to_region(
+            Region(0, heights.offset(index), self.size.width, heights[index]),
+            animate=False,
+            force=True,
+            immediate=True,
+        )
+
+    def refresh_items(self, item_count: int | None = None) -> None:
+        """Refresh the items in the window, optionally changing the number of items.
+
+        Call this when the data the items are created from has changed.
+
+        Args:
+            item_count: New number of items, or `None` for no change.
+        """
+        super().refresh_items(item_count)
+        # Clamp the index to the new number of items
+        self.index = self.index
+
+    def action_select_cursor(self) -> None:
+        """Select the current item in the list."""
+        selected_child = self.highlighted_child
+        if selected_child is None or self.index is None:
+            return
+        self.post_message(self.Selected(self, selected_child, self.index))
+
+    def action_cursor_down(self) -> None:
+        """Highlight the next item in the list."""
+        if self.index is None:
+            if self.item_count:
+                self.index = 0
+        elif self.index < self.item_count - 1:
+            self.index += 1
+
+    def action_cursor_up(self) -> None:
+        """Highlight the previous item in the list."""
+        if self.index is None:
+            if self.item_count:
+                self.index = self.item_count - 1
+        elif self.index > 0:
+            self.index -= 1
+
+    def _on_list_item__child_clicked(self, event: ListItem._ChildClicked) -> None:
+        event.stop()
+        index = self.get_item_index(event.item)
+        if index is None:
+            return
+        self.focus()
+        self.index = index
+        self.post_message(self.Selected(self, event.item, index))
+
+    def __len__(self) -> int:
+        """The number of items in the list view."""
+        return self.item_count
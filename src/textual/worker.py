@@ -34,8 +34,8 @@ if TYPE_CHECKING:
     from textual.dom import DOMNode
 
 
-active_worker: ContextVar[Worker] = ContextVar("active_worker")
-"""Currently active worker context var."""
+active_worker: ContextVar[Worker | None] = ContextVar("active_worker")
+"""Currently active worker context var (`None` in tasks which aren't part of a worker)."""
 
 
 class NoActiveWorker(Exception):
@@ -71,12 +71,9 @@ def get_current_worker() -> Worker:
     Returns:
         A Worker instance.
     """
-    try:
-        return active_worker.get()
-    except LookupError:
-        raise NoActiveWorker(
-            "There is no active worker in this task or thread."
-        ) from None
+    if (worker := active_worker.get(None)) is None:
+        raise NoActiveWorker("There is no active worker in this task or thread.")
+    return worker
 
 
 class WorkerState(enum.Enum):
@@ -1,6 +1,7 @@
 from contextlib import nullcontext as does_not_raise
 
 import pytest
+from rich.style import Style
 
 from textual.color import Color
 from textual.css.stylesheet import CssSource, Stylesheet, StylesheetParseError
@@ -123,6 +124,27 @@ def test_stylesheet_apply_user_css_over_widget_css():
     assert node.styles.tint == Color(255, 255, 0)
 
 
+def test_stylesheet_apply_shared_cache():
+    """Nodes styled from a shared cache should get the same rules as the first node."""
+    css = ".a {color: red; link-style: bold underline; display: none;}"
+    stylesheet = _make_user_stylesheet(css)
+    parent = DOMNode()
+    nodes = [DOMNode(classes="a") for _ in range(3)]
+    for node in nodes:
+        node._attach(parent)
+    cache = {}
+    styled_rules_cache = {}
+    for node in nodes:
+        stylesheet.apply(node, cache=cache, styled_rules_cache=styled_rules_cache)
+    assert len(styled_rules_cache) == 1
+
+    for node in nodes:
+        assert node.styles.base._rules == nodes[0].styles.base._rules
+        assert node.styles.color == Color(255, 0, 0)
+        assert node.styles.link_style == Style(bold=True, underline=True)
+        assert not node.display
+
+
 @pytest.mark.parametrize(
     "css_value,expectation,expected_color",
     [
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from textual.app import App, ComposeResult
+from textual.widgets import Label, ListItem, VirtualListView
+
+ITEM_COUNT = 10_000
+
+
+class VirtualListViewApp(App[None]):
+    def __init__(self) -> None:
+        self.created = 0
+        self.highlighted: list[str | None] = []
+        self.selected: list[tuple[int, str]] = []
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        yield VirtualListView(ITEM_COUNT, self.create_item, self.update_item)
+
+    def create_item(self, index: int) -> ListItem:
+        self.created += 1
+        return ListItem(Label(f"Item {index}"))
+
+    def update_item(self, item: ListItem, index: int) -> None:
+        item.query_one(Label).update(f"Item {index}")
+
+    def _on_virtual_list_view_highlighted(
+        self, message: VirtualListView.Highlighted
+    ) -> None:
+        if message.item is None:
+            self.highlighted.append(None)
+        else:
+            self.highlighted.append(str(message.item.query_one(Label).content))
+
+    def _on_virtual_list_view_selected(self, message: VirtualListView.Selected) -> None:
+        self.selected.append(
+            (message.index, str(message.item.query_one(Label).content))
+        )
+
+
+async def test_virtual_list_view_window() -> None:
+    """Only the visible items should have a ListItem."""
+    app = VirtualListViewApp()
+    async with app.run_test(size=(40, 20)) as pilot:
+        list_view = app.query_one(VirtualListView)
+        await pilot.pause()
+        assert len(list_view) == ITEM_COUNT
+        assert list_view.index == 0
+        assert len(list_view.children) < 40
+        assert app.highlighted == ["Item 0"]
+
+        list_view.index = 5_000
+        await pilot.pause()
+        assert len(list_view.children) < 50
+        highlighted_child = list_view.highlighted_child
+        assert highlighted_child is not None
+        assert highlighted_child.highlighted
+        assert str(highlighted_child.query_one(Label).content) == "Item 5000"
+        assert highlighted_child.region in list_view.region
+        # Items are recycled rather than created
+        assert app.created < 60
+        # Only the highlighted item should have the highlight
+        assert [
+            child for child in list_view.children if child.has_class("-highlight")
+        ] == [highlighted_child]
+
+
+async def test_virtual_list_view_navigation() -> None:
+    """Moving the cursor and selecting should work as they do for ListView."""
+    app = VirtualListViewApp()
+    async with app.run_test(size=(40, 20)) as pilot:
+        list_view = app.query_one(VirtualListView)
+        list_view.focus()
+        await pilot.press("up", "down", "down", "enter")
+        await pilot.pause()
+        assert list_view.index == 2
+        assert app.highlighted == ["Item 0", "Item 1", "Item 2"]
+        assert app.selected == [(2, "Item 2")]
+
+        list_view.index = ITEM_COUNT - 1
+        await pilot.press("down")
+        await pilot.pause()
+        assert list_view.index == ITEM_COUNT - 1
+        assert app.highlighted[-1] == f"Item {ITEM_COUNT - 1}"
+
+
+async def test_virtual_list_view_click() -> None:
+    """Clicking an item should highlight and select it."""
+    app = VirtualListViewApp()
+    async with app.run_test(size=(40, 20)) as pilot:
+        list_view = app.query_one(VirtualListView)
+        await pilot.pause()
+        await pilot.click(VirtualListView, offset=(2, 3))
+        await pilot.pause()
+        assert list_view.index == 3
+        assert app.selected == [(3, "Item 3")]
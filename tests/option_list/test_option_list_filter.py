@@ -0,0 +1,63 @@
+"""Test filtering the options in an option list."""
+
+from __future__ import annotations
+
+from textual.app import App, ComposeResult
+from textual.widgets import OptionList
+from textual.widgets.option_list import Option
+
+
+class FilterApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield OptionList(
+            "Apple",
+            "Banana",
+            Option("Cherry", disabled=True),
+            "Grape",
+            "Pineapple",
+        )
+
+
+async def test_filter_options() -> None:
+    """Filtered options should be hidden, but remain in the option list."""
+    async with FilterApp().run_test() as pilot:
+        option_list = pilot.app.query_one(OptionList)
+        option_list.filter_options("APP")
+        assert option_list.filter_query == "APP"
+        assert option_list.option_count == 5
+        assert option_list.highlighted == 0
+        assert option_list.virtual_size.height == 2
+        assert option_list._get_line_option(1) == (4, 0)
+        await pilot.press("down")
+        assert option_list.highlighted == 4
+        await pilot.press("down")
+        assert option_list.highlighted == 0
+
+        option_list.filter_options("")
+        assert option_list.virtual_size.height == 5
+        await pilot.press("down")
+        assert option_list.highlighted == 1
+
+
+async def test_filter_moves_highlight() -> None:
+    """If the highlighted option is hidden, the first visible option is highlighted."""
+    async with FilterApp().run_test() as pilot:
+        option_list = pilot.app.query_one(OptionList)
+        option_list.filter_options("grape")
+        assert option_list.highlighted == 3
+        option_list.filter_options("nothing matches")
+        assert option_list.highlighted is None
+        assert option_list.virtual_size.height == 0
+
+
+async def test_filter_applies_to_new_options() -> None:
+    """Options added while filtered should be hidden if they don't match."""
+    async with FilterApp().run_test() as pilot:
+        option_list = pilot.app.query_one(OptionList)
+        option_list.filter_options("an")
+        option_list.add_options(["Mango", "Kiwi"])
+        assert option_list.virtual_size.height == 2
+        option_list.remove_option_at_index(1)
+        await pilot.pause()
+        assert option_list.virtual_size.height == 1
+        assert option_list._get_line_option(0) == (4, 0)
@@ -0,0 +1,42 @@
+"""Test that options are measured only as they are displayed."""
+
+from __future__ import annotations
+
+from textual.app import App, ComposeResult
+from textual.widgets import OptionList
+
+
+class LazyOptionListApp(App[None]):
+    CSS = "OptionList { height: 10; }"
+
+    def compose(self) -> ComposeResult:
+        yield OptionList(*[f"{index}\nsecond line" for index in range(2000)])
+
+
+async def test_only_visible_options_measured() -> None:
+    """Only the options in view should be measured."""
+    async with LazyOptionListApp().run_test() as pilot:
+        option_list = pilot.app.query_one(OptionList)
+        await pilot.pause()
+        line_cache = option_list._line_cache
+        assert len(line_cache.measured) == 2000
+        measured = sum(line_cache.measured)
+        assert measured == option_list.scrollable_content_region.height // 2
+        # Measured options are 2 lines, the remainder are estimated as 1 line
+        assert option_list._get_option_line(100) == 100 + measured
+        assert option_list._get_line_option(1) == (0, 1)
+        assert option_list._get_line_option(100 + measured) == (100, 0)
+
+
+async def test_highlight_measures_option() -> None:
+    """Moving the highlight should measure the option and scroll it in to view."""
+    async with LazyOptionListApp().run_test() as pilot:
+        option_list = pilot.app.query_one(OptionList)
+        await pilot.press("end")
+        await pilot.pause()
+        assert option_list.highlighted == 1999
+        assert option_list._line_cache.heights[1999] == 2
+        y = option_list._get_option_line(1999)
+        assert option_list.scroll_y + option_list.scrollable_content_region.height >= (
+            y + 2
+        )
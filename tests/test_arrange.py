@@ -3,9 +3,12 @@ import pytest
 from textual._arrange import TOP_Z, arrange
 from textual._context import active_app
 from textual.app import App
+from textual.containers import Container
+from textual.css.scalar import Scalar
 from textual.geometry import NULL_OFFSET, Region, Size, Spacing
 from textual.layout import WidgetPlacement
 from textual.widget import Widget
+from textual.widgets import Label, Static
 
 
 async def test_arrange_empty():
@@ -125,3 +128,69 @@ async def test_arrange_dock_badly():
     child.styles.dock = "nowhere"
     with pytest.raises(AssertionError):
         _ = arrange(Widget(), [child], Size(80, 24), Size(80, 24))
+
+
+async def test_arrange_cache_viewport() -> None:
+    """Regression test for viewport units within a container that doesn't change size."""
+
+    class ViewportApp(App):
+        CSS = """
+        Container { width: 60; height: 10; }
+        Static { width: 50vw; }
+        """
+
+        def compose(self):
+            with Container():
+                yield Static("Hello")
+
+    app = ViewportApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        await pilot.pause()
+        static = app.query_one(Static)
+        assert static.size.width == 40
+        await pilot.resize_terminal(100, 24)
+        await pilot.pause()
+        assert static.size.width == 50
+
+
+async def test_arrange_cache_reused() -> None:
+    """Arrangements should be reused until a child requests a layout."""
+
+    class CacheApp(App):
+        def compose(self):
+            with Container():
+                yield Label("Hello")
+                yield Label("World")
+
+    app = CacheApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        container = app.query_one(Container)
+        size = container.size
+        arrangement = container.arrange(size)
+        assert container.arrange(size) is arrangement
+        container.query(Label).first().update("Hello, World")
+        await pilot.pause()
+        assert container.arrange(size) is not arrangement
+
+
+async def test_arrange_cache_child_styles() -> None:
+    """Arrangements should not be reused after a child's styles change."""
+
+    class CacheApp(App):
+        def compose(self):
+            with Container():
+                yield Label("Hello")
+                yield Label("World")
+
+    app = CacheApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        container = app.query_one(Container)
+        size = container.size
+        arrangement = container.arrange(size)
+        label = container.query(Label).first()
+        label.styles.set_rule("height", Scalar.parse("3"))
+        new_arrangement = container.arrange(size)
+        assert new_arrangement is not arrangement
+        assert new_arrangement.placements[1].region.y == 3
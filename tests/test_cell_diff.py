@@ -0,0 +1,126 @@
+import pytest
+from rich.color import ColorSystem
+from rich.control import Control
+from rich.segment import Segment
+from rich.style import Style
+
+from textual.app import App, ComposeResult
+from textual.drivers import _cell_diff
+from textual.drivers._cell_diff import Cell, CellDiffDecoder, CellDiffEncoder
+from textual.strip import Strip
+from textual.widgets import Label
+
+
+def get_cells(strips: list[Strip]) -> list[list[Cell]]:
+    """Get the cells expected in the terminal, from the compositor's strips."""
+    decoder = CellDiffDecoder()
+    encoder = CellDiffEncoder()
+    segments: list[Segment] = []
+    for y, strip in enumerate(strips):
+        segments.append(Control.move_to(0, y).segment)
+        segments.extend(strip)
+    packet = encoder.encode(segments, strips[0].cell_length, len(strips))
+    assert packet is not None
+    decoder.decode(packet)
+    return decoder.cells
+
+
+def test_cell_diff_encode_decode() -> None:
+    red = Style(color="red")
+    encoder = CellDiffEncoder(ColorSystem.TRUECOLOR)
+    decoder = CellDiffDecoder()
+    segments = [
+        Control.move_to(0, 0).segment,
+        Segment("Hello", red),
+        Segment(" 中文"),
+        Control.move_to(2, 1).segment,
+        Segment("é", Style(link="https://textual.textualize.io")),
+    ]
+    packet = encoder.encode(segments, 10, 2, (3, 1))
+    assert packet is not None
+    decoder.decode(packet)
+    assert decoder.get_line_text(0) == "Hello 中文"
+    assert decoder.get_line_text(1) == "  é       "
+    assert decoder.cells[0][0] == Cell("H", "31", "")
+    assert decoder.cells[0][7] == Cell("", "", "")
+    assert decoder.cells[1][2].link == "https://textual.textualize.io"
+    assert decoder.cursor == (3, 1)
+
+    # Nothing changed
+    assert encoder.encode(segments, 10, 2, (3, 1)) is None
+
+    # Only the changed cells are sent
+    packet = encoder.encode(
+        [Control.move_to(0, 0).segment, Segment("Hallo", red)], 10, 2, (3, 1)
+    )
+    assert packet is not None
+    assert b"Hallo" not in packet
+    decoder.decode(packet)
+    assert decoder.get_line_text(0) == "Hallo 中文"
+    assert decoder.cells[0][1] == Cell("a", "31", "")
+
+
+def test_cell_diff_style_table_reset(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Clearing the style table should never leave stale cells in the client."""
+    monkeypatch.setattr(_cell_diff, "MAX_STYLES", 3)
+    encoder = CellDiffEncoder()
+    decoder = CellDiffDecoder()
+
+    def encode_colors(*colors: str) -> None:
+        segments = [Control.move_to(0, 0).segment]
+        segments.extend(Segment("X", Style(color=color)) for color in colors)
+        packet = encoder.encode(segments, 3, 1)
+        assert packet is not None
+        decoder.decode(packet)
+        assert [cell.sgr for cell in decoder.cells[0]] == [
+            Strip.render_ansi(Style(color=color), ColorSystem.TRUECOLOR)
+            for color in colors
+        ]
+
+    encode_colors("red", "green", "blue")
+    encode_colors("yellow", "green", "blue")
+    encode_colors("yellow", "magenta", "cyan")
+    encode_colors("red", "green", "blue")
+
+
+async def test_cell_diff_compositor_updates() -> None:
+    """Decoded updates should reproduce the screen."""
+
+    class CellApp(App[None]):
+        def compose(self) -> ComposeResult:
+            for index in range(10):
+                yield Label(f"[b]Label[/b] [red]{index}[/red]", id=f"label{index}")
+
+    app = CellApp()
+    async with app.run_test(size=(40, 12)) as pilot:
+        await pilot.pause()
+        console = app.console
+        compositor = app.screen._compositor
+        width, height = app.size
+        for compress in (False, True):
+            encoder = CellDiffEncoder(compress=compress)
+            decoder = CellDiffDecoder(compress=compress)
+            update = compositor.render_full_update()
+            packet = encoder.encode(
+                update.__rich_console__(console, console.options), width, height
+            )
+            assert packet is not None
+            decoder.decode(packet)
+            assert decoder.cells == get_cells(compositor.render_strips())
+            full_size = len(packet)
+
+            app.query_one("#label3", Label).update("Changed")
+            await pilot.pause()
+            compositor._dirty_regions.add(app.query_one("#label3").region)
+            update = compositor.render_update()
+            assert update is not None
+            packet = encoder.encode(
+                update.__rich_console__(console, console.options), width, height
+            )
+            assert packet is not None
+            assert len(packet) < full_size
+            decoder.decode(packet)
+            assert decoder.get_line_text(3).startswith("Changed")
+            assert decoder.cells == get_cells(compositor.render_strips())
+            app.query_one("#label3", Label).update("[b]Label[/b] [red]3[/red]")
+            await pilot.pause()
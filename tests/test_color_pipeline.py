@@ -0,0 +1,91 @@
+import pytest
+from rich.color import Color as RichColor
+from rich.style import Style
+
+from textual import _color_pipeline
+from textual._color_pipeline import StyleCache, blend_rgb, tint_styles
+from textual.color import Color
+
+
+@pytest.mark.parametrize("numpy", [False, True])
+def test_blend_rgb(monkeypatch: pytest.MonkeyPatch, numpy: bool) -> None:
+    """Blended colors should match Color.blend, with or without NumPy."""
+    if numpy:
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(_color_pipeline, "NUMPY_MIN_COLORS", 1)
+    else:
+        monkeypatch.setattr(_color_pipeline, "numpy", None)
+    colors = [(0, 0, 0), (255, 128, 3), (10, 200, 100)]
+    destinations = [(255, 255, 255), (0, 3, 250), (10, 20, 30)]
+    for factor in (0.0, 0.33, 0.5, 1.0):
+        assert blend_rgb(colors, destinations, factor) == [
+            Color(*color).blend(Color(*destination), factor).rgb
+            for color, destination in zip(colors, destinations)
+        ]
+    factors = [0.1, 0.5, 0.9]
+    assert blend_rgb(colors, destinations, factors) == [
+        Color(*color).blend(Color(*destination), factor).rgb
+        for color, destination, factor in zip(colors, destinations, factors)
+    ]
+
+
+def test_tint_styles() -> None:
+    """Tinting styles should be equivalent to adding the tint to each color."""
+    from_rich_color = Color.from_rich_color
+    styles = [
+        Style(color="#aabbcc", bgcolor="#112233"),
+        Style(color="red", bold=True),
+        Style(bgcolor="default"),
+        Style(),
+    ]
+    for tint in (Color(0, 100, 0, 0.5), Color(0, 100, 0, 0), Color(0, 100, 0)):
+        assert tint_styles(styles, tint) == [
+            style
+            + Style.from_color(
+                (
+                    None
+                    if style.color is None
+                    else (from_rich_color(style.color) + tint).rich_color
+                ),
+                (
+                    None
+                    if style.bgcolor is None
+                    else (from_rich_color(style.bgcolor) + tint).rich_color
+                ),
+            )
+            for style in styles
+        ]
+
+
+def test_style_cache() -> None:
+    """Missing styles should be transformed in a batch, and cached."""
+    batches: list[list[Style]] = []
+
+    def bold(styles: list[Style], color: RichColor) -> list[Style]:
+        batches.append(styles)
+        return [style + Style(bold=True, color=color) for style in styles]
+
+    red = Style(color="red")
+    green = Style(color="green")
+    blue = RichColor.parse("blue")
+    cache = StyleCache(maxsize=3)
+    assert cache.hit_rate == 0
+    assert cache.map_styles([red, green, red], bold, blue) == {
+        red: Style(color="blue", bold=True),
+        green: Style(color="blue", bold=True),
+    }
+    assert batches == [[red, green]]
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    cache.map_styles([green, red], bold, blue)
+    assert len(batches) == 1
+    assert cache.hit_rate == 0.5
+
+    # Arguments are part of the key
+    cache.map_styles([red], bold, RichColor.parse("yellow"))
+    assert batches[-1] == [red]
+    assert len(cache) == 3
+
+    # The cache is cleared when full
+    cache.map_styles([Style(italic=True)], bold, blue)
+    assert len(cache) == 1
@@ -1,6 +1,12 @@
+import asyncio
+
+from rich.control import Control
+
 from textual.app import App, ComposeResult
 from textual.containers import Container
-from textual.widgets import Static
+from textual.css.scalar import Scalar
+from textual.geometry import Offset
+from textual.widgets import Label, Static
 
 
 async def test_compositor_scroll_placements():
@@ -40,3 +46,278 @@ async def test_compositor_scroll_placements():
         # The static wasn't scrolled out of view, and should be visible
         # This wasn't the case <= v0.86.1
         assert static in widgets
+
+
+async def test_compositor_reflow_subtree():
+    """A layout that doesn't change the size of a container should only arrange that container,
+    and produce the same map as a full reflow."""
+
+    class PanesApp(App):
+        CSS = """
+        Container {
+            height: 1fr;
+        }
+        Static {
+            width: auto;
+        }
+        """
+
+        def compose(self) -> ComposeResult:
+            for pane in range(3):
+                with Container(id=f"pane{pane}"):
+                    for index in range(5):
+                        yield Static(f"Pane {pane} static {index}")
+
+    app = PanesApp()
+    async with app.run_test() as pilot:
+        compositor = app.screen._compositor
+        arranged: list[set] = []
+        reflow_subtrees = compositor._reflow_subtrees
+
+        def _reflow_subtrees(*args, **kwargs):
+            result = reflow_subtrees(*args, **kwargs)
+            if result is not None:
+                arranged.append({widget for widget, _ in result.arranged})
+            return result
+
+        compositor._reflow_subtrees = _reflow_subtrees
+        static = app.query_one("#pane1").query(Static).first()
+        static.update("Updated and much wider")
+        await pilot.pause()
+
+        assert len(arranged) == 1
+        assert static in arranged[0]
+        assert app.query_one("#pane1") in arranged[0]
+        assert app.query_one("#pane0") not in arranged[0]
+        assert static.size.width == len("Updated and much wider")
+
+        partial_map = compositor._full_map.copy()
+        compositor.reflow(app.screen, compositor.size)
+        assert compositor._full_map == partial_map
+
+        await static.remove()
+        await app.query_one("#pane2").mount(Static("New"))
+        await pilot.pause()
+        assert static not in compositor._full_map
+        partial_map = compositor._full_map.copy()
+        compositor.reflow(app.screen, compositor.size)
+        assert compositor._full_map == partial_map
+
+
+async def test_compositor_reflow_subtrees_in_separate_containers():
+    """Layouts requested by widgets in different containers should arrange both containers."""
+
+    class ContainersApp(App):
+        CSS = """
+        Container {
+            height: 10;
+        }
+        """
+
+        def compose(self) -> ComposeResult:
+            with Container(id="a"):
+                yield Label("a1", id="a1")
+                yield Label("a2", id="a2")
+            with Container(id="b"):
+                yield Label("b1", id="b1")
+                yield Label("b2", id="b2")
+
+    app = ContainersApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        a1 = app.query_one("#a1")
+        b1 = app.query_one("#b1")
+
+        async def change_heights() -> None:
+            # Runs on the screen, so that both Layout messages are queued together
+            for label in (a1, b1):
+                label.styles.set_rule("height", Scalar.parse("3"))
+                label.refresh(layout=True, repaint=False)
+            while a1._layout_required or b1._layout_required:
+                await asyncio.sleep(0)
+
+        app.screen.call_later(change_heights)
+        await pilot.pause()
+        await pilot.pause()
+        assert app.query_one("#a2").region.y == 3
+        assert app.query_one("#b2").region.y == 13
+
+
+async def test_compositor_inline_partial_update():
+    """Inline updates should only write changed lines, if the size is unchanged."""
+
+    class InlineApp(App):
+        CSS = """
+        Static {
+            height: 1;
+        }
+        """
+
+        def compose(self) -> ComposeResult:
+            for index in range(3):
+                yield Static(f"Line {index}", id=f"line{index}")
+
+    app = InlineApp()
+    async with app.run_test(size=(20, 3)) as pilot:
+        await pilot.pause()
+        compositor = app.screen._compositor
+        size = app.size
+        console = app.console
+        update = compositor.render_inline(size)
+        assert update is not None
+        assert update.lines is None
+        assert "\x1b[6n" in update.render_segments(console)
+
+        # Nothing changed
+        assert compositor.render_inline(size, previous_update=update) is None
+
+        app.query_one("#line2", Static).update("Changed")
+        await pilot.pause()
+        partial_update = compositor.render_inline(size, previous_update=update)
+        assert partial_update is not None
+        assert partial_update.lines == [2]
+        segments = partial_update.render_segments(console)
+        assert "Changed" in segments
+        assert "Line 0" not in segments
+        assert "\x1b[6n" not in segments
+        assert segments.startswith("\x1b[2B\r")
+        assert segments.endswith("\x1b[2A\r")
+
+        # Different size writes every line
+        full_update = compositor.render_inline(
+            size.with_height(2), previous_update=partial_update
+        )
+        assert full_update is not None
+        assert full_update.lines is None
+
+
+async def test_compositor_inline_update_reset(monkeypatch):
+    """Resuming or refreshing the app should write every line of the next inline update,
+    and cursor moves should be written when no lines changed."""
+
+    class InlineApp(App):
+        CSS = """
+        Static {
+            height: 1;
+        }
+        """
+
+        def compose(self) -> ComposeResult:
+            for index in range(3):
+                yield Static(f"Line {index}", id=f"line{index}")
+
+    app = InlineApp()
+    async with app.run_test(size=(20, 3)) as pilot:
+        await pilot.pause()
+        screen = app.screen
+        driver = app._driver
+        written: list[str] = []
+        with monkeypatch.context() as patch:
+            patch.setattr(type(driver), "is_inline", property(lambda self: True))
+            patch.setattr(type(driver), "is_headless", property(lambda self: False))
+            patch.setattr(driver, "write", written.append)
+
+            screen._compositor_refresh()
+            assert "Line 0" in "".join(written)
+            written.clear()
+
+            # Nothing changed
+            screen._compositor_refresh()
+            assert written == []
+
+            # Only the cursor moved
+            app.cursor_position = Offset(3, 1)
+            screen._compositor_refresh()
+            assert written == [Control.move(3, 1).segment.text]
+            written.clear()
+
+            for reset in (app._resume_signal, app.refresh):
+                reset()
+                screen._compositor_refresh()
+                output = "".join(written)
+                assert "Line 0" in output
+                assert "\x1b[6n" in output
+                written.clear()
+
+
+async def test_compositor_get_style_at_cached():
+    """get_style_at should only render a line once, until the widget is updated."""
+
+    class LinkApp(App):
+        def compose(self) -> ComposeResult:
+            yield Static("[@click=app.bell]Click[/] me")
+
+    app = LinkApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        static = app.query_one(Static)
+        compositor = app.screen._compositor
+        render_lines = static.render_lines
+        rendered: list[int] = []
+
+        def record_render_lines(crop):
+            rendered.append(crop.y)
+            return render_lines(crop)
+
+        static.render_lines = record_render_lines
+        assert compositor.get_style_at(0, 0).meta["@click"] == "app.bell"
+        assert compositor.get_style_at(4, 0).meta["@click"] == "app.bell"
+        assert "@click" not in compositor.get_style_at(6, 0).meta
+        assert compositor.get_style_at(100, 0) == compositor.get_style_at(100, 0)
+        assert rendered == [0]
+
+        static.update("Updated")
+        await pilot.pause()
+        assert "@click" not in compositor.get_style_at(0, 0).meta
+        assert len(rendered) > 1
+
+
+async def test_compositor_render_in_parallel(monkeypatch):
+    """Rendering widgets in a thread pool should produce the same output."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from textual import _compositor
+    from textual.widgets import OptionList
+
+    class Pane(Static):
+        PARALLEL_RENDER = True
+
+    class PanesApp(App):
+        CSS = "Static { border: solid red; height: 4; }"
+
+        def compose(self) -> ComposeResult:
+            for pane in range(8):
+                yield Pane(f"Pane {pane}")
+            yield Static("Not thread-safe")
+            yield OptionList(*[f"Option {index}" for index in range(10)])
+
+    async def render_screen() -> list[str]:
+        async with PanesApp().run_test(size=(40, 50)) as pilot:
+            await pilot.pause()
+            return [
+                strip.text for strip in pilot.app.screen._compositor.render_strips()
+            ]
+
+    expected = await render_screen()
+    render_pool = ThreadPoolExecutor(4)
+    submitted = []
+
+    def submit(*args, **kwargs):
+        submitted.append(args)
+        return ThreadPoolExecutor.submit(render_pool, *args, **kwargs)
+
+    monkeypatch.setattr(render_pool, "submit", submit)
+    monkeypatch.setattr(_compositor, "get_render_pool", lambda: render_pool)
+    try:
+        assert await render_screen() == expected
+    finally:
+        render_pool.shutdown()
+    assert submitted
+    assert all(
+        isinstance(render_lines.__self__, Pane) for _, render_lines, _ in submitted
+    )
+    # Widgets must opt in to rendering in a thread
+    assert _compositor._can_render_in_thread(Pane)
+    assert not _compositor._can_render_in_thread(Static)
+    # OptionList overrides render_line, so must be rendered on the event loop's thread
+    assert not _compositor._can_render_in_thread(OptionList)
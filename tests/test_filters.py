@@ -5,7 +5,7 @@ from rich.style import Style
 from rich.terminal_theme import MONOKAI
 
 from textual.color import Color
-from textual.filter import ANSIToTruecolor
+from textual.filter import ANSIToTruecolor, DimFilter, dim_style
 
 
 def test_ansi_to_truecolor_8_bit_dim():
@@ -27,3 +27,34 @@ def test_ansi_to_truecolor_8_bit_dim():
 
     # Then
     assert new_segments is not None
+
+
+def test_filters_match_single_style_transforms():
+    """Batched filters should match the per-style functions."""
+    background = Color(10, 20, 30)
+    styles = [
+        Style(color="red", bgcolor="#102030", dim=True),
+        Style(color="#ff0000", bgcolor="default", dim=True),
+        Style(color="color(200)", bgcolor="blue"),
+        Style(color="#aabbcc", dim=True),
+        Style(bold=True),
+    ]
+    segments = [Segment(str(index), style) for index, style in enumerate(styles)]
+
+    ansi_filter = ANSIToTruecolor(MONOKAI)
+    truecolor_segments = ansi_filter.apply(segments, background)
+    assert [segment.style for segment in truecolor_segments] == [
+        ansi_filter.truecolor_style(style, background.rich_color) for style in styles
+    ]
+    assert ansi_filter.style_cache.misses == len(styles)
+    ansi_filter.apply(segments, background)
+    assert ansi_filter.style_cache.hits == len(styles)
+
+    dim_segments = [
+        Segment(text, style + Style(dim=True))
+        for text, style, _ in truecolor_segments
+        if style.color is not None and style.bgcolor is not None
+    ]
+    assert [
+        segment.style for segment in DimFilter().apply(dim_segments, background)
+    ] == [dim_style(segment.style, background, 0.5) for segment in dim_segments]
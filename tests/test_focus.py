@@ -548,3 +548,41 @@ async def test_trap_focus():
         app.screen.query_one("#left").trap_focus(False)
         focus_ids = [node.id for node in app.screen.focus_chain]
         assert focus_ids == ["one", "two", "a", "b"]
+
+
+async def test_focus_order_cached():
+    """The focus order should be reused until the DOM or layout changes."""
+
+    class CachedApp(App):
+        AUTO_FOCUS = None
+
+        def compose(self) -> ComposeResult:
+            yield Button("1", id="one")
+            yield Button("2", id="two")
+            yield Button("3", id="three")
+
+    app = CachedApp()
+    async with app.run_test() as pilot:
+        screen = app.screen
+        assert [node.id for node in screen.focus_chain] == ["one", "two", "three"]
+        focus_order = screen._get_focus_order()
+        screen.focus_next()
+        screen.focus_next()
+        assert screen.focused.id == "two"
+        assert screen._get_focus_order() is focus_order
+
+        # Disabled widgets don't invalidate the order, but are skipped
+        app.query_one("#three").disabled = True
+        assert [node.id for node in screen.focus_chain] == ["one", "two"]
+        assert screen.focus_next().id == "one"
+
+        # Mounting a widget rebuilds the order
+        await screen.mount(Button("0", id="zero"), before=0)
+        await pilot.pause()
+        assert screen._get_focus_order() is not focus_order
+        assert [node.id for node in screen.focus_chain] == ["zero", "one", "two"]
+
+        # Hiding a widget rebuilds the order
+        app.query_one("#zero").display = False
+        assert [node.id for node in screen.focus_chain] == ["one", "two"]
+        assert screen.focus_previous().id == "two"
@@ -0,0 +1,77 @@
+import asyncio
+from unittest.mock import MagicMock, Mock
+
+from textual._frame_clock import MAX_FRAME_SKIP, MAX_OUTPUT_BACKLOG, FrameClock
+from textual.app import App, ComposeResult
+from textual.widgets import Label
+
+
+class AnimateApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield Label("Hello")
+
+
+async def test_frame_clock_idle() -> None:
+    """No frames should run when nothing is animating or dirty."""
+    app = AnimateApp()
+    async with app.run_test() as pilot:
+        await pilot.pause(0.1)
+        frame_count = app._frame_clock.frame_count
+        await asyncio.sleep(0.2)
+        assert app._frame_clock.frame_count == frame_count
+
+
+async def test_frame_clock_animation() -> None:
+    """Animations and screen updates should run on the same frames."""
+    app = AnimateApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        screen = app.screen
+        updates: list[int] = []
+        on_timer_update = screen._on_timer_update
+
+        def record_update() -> None:
+            updates.append(app._frame_clock.frame_count)
+            on_timer_update()
+
+        screen._on_timer_update = record_update
+        label = app.query_one(Label)
+        frame_count = app._frame_clock.frame_count
+        label.styles.animate("opacity", 0.0, duration=0.2)
+        await app.animator.wait_for_idle()
+        await pilot.pause()
+        frames = app._frame_clock.frame_count - frame_count
+        assert label.styles.opacity == 0.0
+        # One update per frame at most
+        assert len(updates) == len(set(updates))
+        assert len(updates) <= frames
+
+
+def test_frame_clock_backlog() -> None:
+    """The frame period should increase when output is backlogged."""
+    app = Mock()
+    app._driver.output_backlog = 0
+    frame_clock = FrameClock(app, frames_per_second=50)
+    assert frame_clock.get_frame_period() == 0.02
+    app._driver.output_backlog = 2
+    assert frame_clock.get_frame_period() == 0.02 * 3
+    app._driver.output_backlog = 100
+    assert frame_clock.get_frame_period() == 0.02 * (1 + MAX_FRAME_SKIP)
+    app._driver = None
+    assert frame_clock.get_frame_period() == 0.02
+
+
+def test_frame_clock_defers_updates_when_backlogged() -> None:
+    """Screen updates should be deferred while the output is backlogged."""
+    app = Mock()
+    app._driver.output_backlog = MAX_OUTPUT_BACKLOG
+    frame_clock = FrameClock(app)
+    screen = MagicMock()
+    frame_clock._screens[screen] = None
+    frame_clock._run_frame()
+    screen._on_timer_update.assert_not_called()
+    assert screen in frame_clock._screens
+    app._driver.output_backlog = 0
+    frame_clock._run_frame()
+    screen._on_timer_update.assert_called_once()
+    assert not frame_clock._screens
@@ -217,3 +217,18 @@ async def test_set_keymap_before_app_mount():
     async with MyApp().run_test() as pilot:
         await pilot.press("y")
         assert worked is True
+
+
+async def test_binding_chain_cached():
+    """The binding chain should be cached until bindings or the keymap change."""
+    app = Counter({"app.increment": "right,k"})
+    async with app.run_test() as pilot:
+        screen = app.screen
+        binding_chain = screen._binding_chain
+        assert screen._binding_chain is binding_chain
+
+        app.update_keymap({"app.decrement": "j"})
+        assert screen._binding_chain is not binding_chain
+        assert "j" in screen._binding_chain[-1][1].key_to_bindings
+        await pilot.press("j")
+        assert app.count == -1
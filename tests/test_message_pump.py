@@ -1,14 +1,17 @@
 import threading
+from contextvars import Context
 
 import pytest
 
 from textual._dispatch_key import dispatch_key
+from textual._queue import BACKGROUND_INTERVAL, Queue
 from textual.app import App, ComposeResult
 from textual.errors import DuplicateKeyHandlers
 from textual.events import Key
 from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Button, Input, Label
+from textual.worker import active_worker
 
 
 class ValidWidget(Widget):
@@ -190,3 +193,224 @@ async def test_thread_safe_post_message():
 
     async with app.run_test() as pilot:
         await pilot.pause()
+
+
+def test_queue_coalesce_and_background() -> None:
+    """Values with the same key should coalesce in place, and the background lane is read last."""
+    queue: Queue[str] = Queue()
+    queue.put_nowait("worker", background=True)
+    queue.put_nowait("resize 1", "resize")
+    queue.put_nowait("key")
+    queue.put_nowait("resize 2", "resize")
+    assert queue.qsize() == 3
+    assert queue.get_nowait() == "resize 2"
+    assert queue.get_nowait() == "key"
+    assert queue.get_nowait() == "worker"
+    assert queue.empty()
+    assert not queue.ready_event.is_set()
+
+
+def test_queue_background_not_starved() -> None:
+    """The background lane should be read after at most BACKGROUND_INTERVAL main lane values."""
+    queue: Queue[str] = Queue()
+    queue.put_nowait("worker", background=True)
+    for index in range(BACKGROUND_INTERVAL * 2):
+        queue.put_nowait(f"key {index}")
+    values = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert values.index("worker") == BACKGROUND_INTERVAL
+    assert values[BACKGROUND_INTERVAL + 1 :] == [
+        f"key {index}" for index in range(BACKGROUND_INTERVAL, BACKGROUND_INTERVAL * 2)
+    ]
+
+
+def test_queue_put_last() -> None:
+    """A value put last should follow every queued value, and precede later values."""
+    queue: Queue[str] = Queue()
+    queue.put_nowait("worker", background=True)
+    queue.put_nowait("key")
+    queue.put_last_nowait("close")
+    queue.put_nowait("late")
+    queue.put_nowait("late worker", background=True)
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == [
+        "key",
+        "worker",
+        "close",
+        "late",
+        "late worker",
+    ]
+
+
+async def test_worker_messages_in_background() -> None:
+    """Messages from workers should be processed after other messages."""
+
+    class WorkerMessage(Message):
+        pass
+
+    class OtherMessage(Message):
+        pass
+
+    class WorkerApp(App):
+        def __init__(self) -> None:
+            self.received: list[str] = []
+            super().__init__()
+
+        async def post_from_worker(self) -> None:
+            for _ in range(100):
+                self.post_message(WorkerMessage())
+            # Post a message from outside of the worker, while the worker messages are queued
+            Context().run(self.post_message, OtherMessage())
+
+        def on_worker_message(self) -> None:
+            self.received.append("worker")
+
+        def on_other_message(self) -> None:
+            self.received.append("other")
+
+    app = WorkerApp()
+    async with app.run_test() as pilot:
+        await app.run_worker(app.post_from_worker).wait()
+        await pilot.pause()
+        assert app.received == ["other", *["worker"] * 100]
+
+
+async def test_widget_mounted_from_worker_not_in_worker() -> None:
+    """Widgets mounted from a worker shouldn't process messages as part of the worker."""
+
+    class Ping(Message):
+        pass
+
+    class PingLabel(Label):
+        def __init__(self) -> None:
+            self.active_workers: list[object] = []
+            super().__init__()
+
+        def on_ping(self) -> None:
+            self.active_workers.append(active_worker.get(None))
+
+    class MountApp(App):
+        async def mount_label(self) -> None:
+            await self.mount(PingLabel())
+
+    app = MountApp()
+    async with app.run_test() as pilot:
+        await app.run_worker(app.mount_label).wait()
+        label = app.query_one(PingLabel)
+        label.post_message(Ping())
+        await pilot.pause()
+        assert label.active_workers == [None]
+
+
+async def test_thread_messages_batched() -> None:
+    """Messages posted from a thread should be delivered in order, in batches."""
+
+    class NumberMessage(Message):
+        def __init__(self, number: int) -> None:
+            self.number = number
+            super().__init__()
+
+    class ThreadApp(App):
+        def __init__(self) -> None:
+            self.numbers: list[int] = []
+            super().__init__()
+
+        def on_number_message(self, message: NumberMessage) -> None:
+            self.numbers.append(message.number)
+
+    app = ThreadApp()
+    async with app.run_test() as pilot:
+        thread_messages = app._thread_messages
+        # Small buffer, so the thread will block while the loop catches up
+        thread_messages.max_pending = 10
+        drain_count = 0
+        drain = thread_messages._drain
+
+        def count_drain() -> None:
+            nonlocal drain_count
+            drain_count += 1
+            drain()
+
+        thread_messages._drain = count_drain
+
+        def post_messages() -> None:
+            for number in range(1000):
+                app.post_message(NumberMessage(number))
+
+        thread = threading.Thread(target=post_messages)
+        thread.start()
+        while thread.is_alive():
+            await pilot.pause(0.01)
+        await pilot.pause()
+        assert app.numbers == list(range(1000))
+        assert drain_count < 1000
+
+
+async def test_thread_messages_call_from_thread_order() -> None:
+    """Callbacks from a thread should run after messages previously posted from that thread."""
+
+    class NumberMessage(Message):
+        def __init__(self, number: int) -> None:
+            self.number = number
+            super().__init__()
+
+    class ThreadApp(App):
+        def __init__(self) -> None:
+            self.numbers: list[int] = []
+            super().__init__()
+
+        def on_number_message(self, message: NumberMessage) -> None:
+            self.numbers.append(message.number)
+
+    app = ThreadApp()
+    async with app.run_test() as pilot:
+
+        def post_messages() -> None:
+            for number in range(0, 100, 2):
+                app.post_message(NumberMessage(number))
+                # Posted from the app's thread, so queued after the previous message
+                app.call_from_thread(app.post_message, NumberMessage(number + 1))
+
+        thread = threading.Thread(target=post_messages)
+        thread.start()
+        while thread.is_alive():
+            await pilot.pause(0.01)
+        await pilot.pause()
+        assert app.numbers == list(range(100))
+
+
+async def test_idle_widgets_park() -> None:
+    """Idle widgets should release their task, and resume when they get a message."""
+
+    class PingMessage(Message):
+        pass
+
+    class PingLabel(Label):
+        def __init__(self) -> None:
+            self.pings = 0
+            super().__init__("ping")
+
+        def on_ping_message(self) -> None:
+            self.pings += 1
+
+    class ParkApp(App):
+        def compose(self) -> ComposeResult:
+            for _ in range(10):
+                yield PingLabel()
+
+    app = ParkApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        labels = list(app.query(PingLabel))
+        assert all(label._task is None or label._task.done() for label in labels)
+        assert all(label._parked_context is not None for label in labels)
+        assert not app.screen._task.done()
+
+        labels[0].post_message(PingMessage())
+        labels[0].post_message(PingMessage())
+        assert not labels[0]._task.done()
+        await pilot.pause()
+        assert labels[0].pings == 2
+        assert labels[0]._task.done()
+
+        await labels[1].remove()
+        assert not labels[1].is_attached
+        assert labels[1]._closed
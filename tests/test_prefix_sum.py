@@ -0,0 +1,39 @@
+import pytest
+
+from textual._prefix_sum import PrefixSum
+
+
+def test_prefix_sum() -> None:
+    prefix_sum = PrefixSum([3, 1, 4, 1, 5])
+    assert len(prefix_sum) == 5
+    assert prefix_sum.total == 14
+    assert [prefix_sum.offset(index) for index in range(6)] == [0, 3, 4, 8, 9, 14]
+    assert [prefix_sum.find(offset) for offset in range(15)] == [
+        0, 0, 0, 1, 2, 2, 2, 2, 3, 4, 4, 4, 4, 4, 5,
+    ]  # fmt: skip
+    assert prefix_sum.find(-1) == 0
+
+
+def test_prefix_sum_update() -> None:
+    prefix_sum = PrefixSum([1] * 10)
+    prefix_sum[4] = 3
+    assert prefix_sum[4] == 3
+    assert prefix_sum.total == 12
+    assert prefix_sum.offset(5) == 7
+    assert prefix_sum.find(6) == 4
+    assert prefix_sum.find(7) == 5
+    prefix_sum[-1] = 0
+    assert prefix_sum.total == 11
+    assert prefix_sum.find(11) == 10
+
+
+@pytest.mark.parametrize("count", [0, 1, 7, 8, 9, 100])
+def test_prefix_sum_append(count: int) -> None:
+    values = [index % 4 for index in range(count)]
+    prefix_sum = PrefixSum()
+    prefix_sum.extend(values)
+    expected = PrefixSum(values)
+    assert [prefix_sum.offset(index) for index in range(count + 1)] == [
+        expected.offset(index) for index in range(count + 1)
+    ]
+    assert prefix_sum.total == sum(values)
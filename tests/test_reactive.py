@@ -7,7 +7,14 @@ import pytest
 from textual.app import App, ComposeResult
 from textual.message import Message
 from textual.message_pump import MessagePump
-from textual.reactive import Initialize, Reactive, TooManyComputesError, reactive, var
+from textual.reactive import (
+    Initialize,
+    Reactive,
+    TooManyComputesError,
+    depends_on,
+    reactive,
+    var,
+)
 from textual.widget import Widget
 
 OLD_VALUE = 5_000
@@ -409,6 +416,82 @@ async def test_watch_compute():
     assert watch_called == [True, True, False, False, True, True, False, False]
 
 
+async def test_compute_dependencies():
+    """Check computes are only invoked when a reactive they depend on changes."""
+
+    calls: list[str] = []
+
+    class ComputeApp(App):
+        count = var(0)
+        other = var(0)
+        count_double = var(0)
+        count_quadruple = var(0)
+        other_double = var(0)
+
+        def compute_count_double(self) -> int:
+            calls.append("count_double")
+            return self.count * 2
+
+        def compute_count_quadruple(self) -> int:
+            calls.append("count_quadruple")
+            return self.count_double * 2
+
+        def compute_other_double(self) -> int:
+            calls.append("other_double")
+            return self.other * 2
+
+    app = ComputeApp()
+    async with app.run_test():
+        calls.clear()
+        app.other = 1
+        assert "count_double" not in calls
+        assert "count_quadruple" not in calls
+        assert "other_double" in calls
+
+        calls.clear()
+        app.count = 2
+        assert "other_double" not in calls
+        # Depends on count via count_double
+        assert "count_quadruple" in calls
+        assert app.count_quadruple == 8
+        assert app.other_double == 2
+
+
+async def test_compute_depends_on():
+    """Check computes are invoked when a declared dependency changes."""
+
+    class ComputeApp(App):
+        celsius = var(10)
+        units = var("C")
+        other = var(0)
+        label = var("")
+        summary = var("")
+
+        def __init__(self) -> None:
+            self.symbol = "°C"
+            self.notes: list[str] = []
+            super().__init__()
+
+        @depends_on("units")
+        def compute_label(self) -> str:
+            return f"{self.celsius}{self.symbol}"
+
+        @depends_on()
+        def compute_summary(self) -> str:
+            return f"{self.celsius} ({len(self.notes)} notes)"
+
+    app = ComputeApp()
+    async with app.run_test():
+        assert app._reactive_label == "10°C"
+        app.symbol = "K"
+        app.units = "K"
+        assert app._reactive_label == "10K"
+
+        app.notes.append("Warm")
+        app.other = 1
+        assert app._reactive_summary == "10 (1 notes)"
+
+
 async def test_public_and_private_watch() -> None:
     """If a reactive/var has public and private watches both should get called."""
 
@@ -10,7 +10,7 @@ from textual import work
 from textual.app import App, ComposeResult, ScreenStackError
 from textual.events import MouseMove
 from textual.geometry import Offset
-from textual.screen import Screen
+from textual.screen import ModalScreen, Screen
 from textual.widgets import Button, Input, Label
 from textual.worker import NoActiveWorker
 
@@ -623,3 +623,37 @@ async def test_get_screen_with_expected_type():
         # TypeError because my_screen is not a BadScreen
         with pytest.raises(TypeError):
             screen = app.get_screen("my_screen", BadScreen)
+
+
+async def test_background_screen_recomposed_when_changed():
+    """The tinted background of a modal screen should only be rendered when the screen below changes."""
+
+    class Dialog(ModalScreen[None]):
+        def compose(self):
+            yield Label("Dialog")
+
+    class ModalApp(App[None]):
+        def compose(self):
+            yield Label("Background", id="background")
+
+    app = ModalApp()
+    async with app.run_test() as pilot:
+        dialog = Dialog()
+        await app.push_screen(dialog)
+        await pilot.pause()
+        recompositions = dialog.background_recompositions
+        assert recompositions
+
+        # Changing the modal screen reuses the background
+        for index in range(3):
+            await dialog.mount(Label(f"Step {index}"))
+            await pilot.pause()
+        assert dialog.background_recompositions == recompositions
+
+        # Changing the screen below recomposes the background
+        app.query_one("#background", Label).update("Changed")
+        await pilot.pause()
+        assert dialog.background_recompositions > recompositions
+        assert "Changed" in "".join(
+            strip.text for strip in dialog._background_cache.strips
+        )
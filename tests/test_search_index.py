@@ -0,0 +1,28 @@
+from textual._search_index import SearchIndex
+
+
+def test_search() -> None:
+    search_index = SearchIndex(["Foo", "bar", None, "FOOBAR", "baz"])
+    assert search_index.search("") == [0, 1, 3, 4]
+    assert search_index.search("foo") == [0, 3]
+    assert search_index.search("BA") == [1, 3, 4]
+    assert search_index.search("nothing") == []
+
+
+def test_search_narrowing() -> None:
+    search_index = SearchIndex(["apple", "apricot", "banana", "grape"])
+    assert search_index.search("a") == [0, 1, 2, 3]
+    assert search_index.search("ap") == [0, 1, 3]
+    assert search_index.search("apr") == [1]
+    # Removing characters from the query widens the search again
+    assert search_index.search("ap") == [0, 1, 3]
+    assert search_index.search("an") == [2]
+
+
+def test_search_extend() -> None:
+    search_index = SearchIndex(["one", "two"])
+    assert search_index.search("o") == [0, 1]
+    search_index.extend(["three", "four"])
+    assert len(search_index) == 4
+    assert search_index.search("o") == [0, 1, 3]
+    assert search_index.search("ou") == [3]
@@ -0,0 +1,119 @@
+import re
+
+import pytest
+from rich.console import Console
+from rich.segment import Segment
+from rich.style import Style
+
+from textual._sgr import SGREncoder, get_sgr_delta, parse_sgr
+from textual.strip import Strip
+
+ESCAPE_RE = re.compile(r"\x1b\[([0-9;]*)m|\x1b\]8;(?:id=[^;]*)?;([^\x1b]*)\x1b\\")
+
+
+def emulate(output: str) -> list[tuple[str, tuple, str]]:
+    """Get each character in the output, with the SGR state and link in effect."""
+    attributes: dict[str, str] = {}
+    link = ""
+    characters = []
+    position = 0
+    for match in ESCAPE_RE.finditer(output + "\x1b[m"):
+        for character in output[position : match.start()]:
+            characters.append((character, tuple(sorted(attributes.items())), link))
+        position = match.end()
+        sgr, url = match.groups()
+        if sgr is None:
+            link = url
+            continue
+        codes = sgr.split(";") if sgr else ["0"]
+        while codes:
+            code = codes.pop(0)
+            if code == "0":
+                attributes.clear()
+            elif code in ("38", "48"):
+                length = 2 if codes[0] == "5" else 4
+                color = ";".join(codes[:length])
+                del codes[:length]
+                attributes["fg" if code == "38" else "bg"] = color
+            elif code in ("39", "49"):
+                attributes.pop("fg" if code == "39" else "bg", None)
+            elif 30 <= int(code) <= 37 or 90 <= int(code) <= 97:
+                attributes["fg"] = code
+            elif 40 <= int(code) <= 47 or 100 <= int(code) <= 107:
+                attributes["bg"] = code
+            else:
+                attributes[code] = code
+    return characters
+
+
+def test_parse_sgr() -> None:
+    assert parse_sgr("") == ((), "", "")
+    assert parse_sgr("1;3;38;2;10;20;30;48;5;16") == (
+        ("1", "3"),
+        "38;2;10;20;30",
+        "48;5;16",
+    )
+    assert parse_sgr("4;31;102") == (("4",), "31", "102")
+
+
+@pytest.mark.parametrize(
+    "previous,ansi,expected",
+    [
+        ("", "", ""),
+        ("1", "1", ""),
+        ("", "1;31", "\x1b[1;31m"),
+        ("1;31", "", "\x1b[0m"),
+        ("1;31", "1;32", "\x1b[32m"),
+        ("1;31", "1;3;31", "\x1b[3m"),
+        ("1;31;44", "1", "\x1b[39;49m"),
+        ("1;3;31", "3;31", "\x1b[0;3;31m"),
+        ("38;2;1;2;3;48;2;4;5;6", "38;2;1;2;3;48;2;7;8;9", "\x1b[48;2;7;8;9m"),
+    ],
+)
+def test_get_sgr_delta(previous: str, ansi: str, expected: str) -> None:
+    assert get_sgr_delta(previous, ansi) == expected
+
+
+def test_sgr_encoder() -> None:
+    """The encoder should produce the same styles as rendering each segment."""
+    console = Console(color_system="truecolor")
+    link = Style(link="https://textual.textualize.io")
+    strips = [
+        Strip(
+            [
+                Segment("foo", Style(color="red", bgcolor="blue")),
+                Segment("bar", Style(color="green", bgcolor="blue")),
+                Segment("baz", Style(bold=True, color="green", bgcolor="blue")),
+                Segment("qux"),
+                Segment("link", link + Style(italic=True)),
+                Segment("link", link + Style(bold=True)),
+                Segment("egg", Style(dim=True, color="#ff0000")),
+            ]
+        ),
+        Strip(
+            [
+                Segment("foo", Style(color="#ff0000", dim=True)),
+                Segment("bar", link),
+                Segment("baz", Style(underline=True, bgcolor="#102030")),
+            ]
+        ),
+    ]
+    expected = "".join(strip.render(console) for strip in strips)
+    encoder = SGREncoder(console)
+    output = "".join(
+        [*encoder.encode(strips[0]), *encoder.encode(strips[1]), encoder.finish()]
+    )
+    assert emulate(output) == emulate(expected)
+    assert len(output) < len(expected)
+    # Links are opened once for each run of segments, and the style is reset at the end
+    assert output.count("\x1b]8;id=") == 2
+    assert output.endswith("baz\x1b[0m")
+    assert encoder.finish() == ""
+
+
+def test_sgr_encoder_finish_link() -> None:
+    console = Console(color_system="truecolor")
+    encoder = SGREncoder(console)
+    strip = Strip([Segment("link", Style(link="https://textual.textualize.io"))])
+    encoder.encode(strip)
+    assert encoder.finish() == "\x1b]8;;\x1b\\"
@@ -1,7 +1,9 @@
 import pytest
 
-from textual._spatial_map import SpatialMap
-from textual.geometry import Offset, Region
+from textual._spatial_map import SpatialMap, VerticalSpatialMap
+from textual.geometry import NULL_OFFSET, NULL_SPACING, Offset, Region, Spacing
+from textual.layout import DockArrangeResult, WidgetPlacement
+from textual.widget import Widget
 
 
 @pytest.mark.parametrize(
@@ -62,3 +64,66 @@ def test_get_values_in_region() -> None:
         "foo",
         "bar",
     ]
+
+
+def test_vertical_get_values_in_region() -> None:
+    spatial_map: VerticalSpatialMap[str] = VerticalSpatialMap()
+
+    spatial_map.insert(
+        [
+            (Region(10, 5, 5, 5), Offset(), False, False, "foo"),
+            (Region(5, 20, 5, 5), Offset(), False, False, "bar"),
+            (Region(0, 0, 40, 1), Offset(), True, False, "title"),
+        ]
+    )
+
+    assert spatial_map.get_values_in_region(Region(0, 0, 10, 5)) == ["title"]
+    assert spatial_map.get_values_in_region(Region(0, 1, 10, 5)) == ["title", "foo"]
+    assert spatial_map.get_values_in_region(Region(0, 10, 10, 5)) == ["title"]
+    assert spatial_map.get_values_in_region(Region(0, 20, 10, 5)) == ["title", "bar"]
+    assert spatial_map.get_values_in_region(Region(5, 5, 50, 50)) == [
+        "title",
+        "foo",
+        "bar",
+    ]
+    assert spatial_map.total_region == Region(0, 0, 15, 25)
+
+
+def test_vertical_insert_order() -> None:
+    """Values should be returned in the order they were inserted, regardless of position."""
+    spatial_map: VerticalSpatialMap[str] = VerticalSpatialMap()
+    spatial_map.insert(
+        [
+            (Region(0, 10, 10, 10), Offset(), False, False, "below"),
+            (Region(0, 0, 10, 30), Offset(), False, False, "tall"),
+            (Region(0, 5, 10, 10), Offset(0, -5), False, False, "offset"),
+        ]
+    )
+    assert spatial_map.get_values_in_region(Region(0, 0, 10, 5)) == [
+        "tall",
+        "offset",
+    ]
+    assert spatial_map.get_values_in_region(Region(0, 25, 10, 5)) == ["tall"]
+    assert spatial_map.get_values_in_region(Region(0, 12, 10, 1)) == [
+        "below",
+        "tall",
+    ]
+
+
+@pytest.mark.parametrize(
+    "spatial_index,count,expected",
+    [
+        ("auto", 10, SpatialMap),
+        ("auto", 100, VerticalSpatialMap),
+        ("grid", 100, SpatialMap),
+        ("vertical", 10, VerticalSpatialMap),
+    ],
+)
+def test_spatial_index(spatial_index, count, expected) -> None:
+    widget = Widget()
+    placements = [
+        WidgetPlacement(Region(0, index, 10, 1), NULL_OFFSET, NULL_SPACING, widget)
+        for index in range(count)
+    ]
+    arrange_result = DockArrangeResult(placements, set(), Spacing(), spatial_index)
+    assert type(arrange_result.spatial_map) is expected
@@ -0,0 +1,137 @@
+from textual.app import App, ComposeResult
+from textual.geometry import Size
+from textual.virtual import VirtualScroll
+from textual.widget import Widget
+from textual.widgets import Label, Static
+
+
+class VirtualApp(App[None]):
+    def __init__(self, virtual_scroll: VirtualScroll) -> None:
+        self.virtual_scroll = virtual_scroll
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        yield self.virtual_scroll
+
+
+async def test_virtual_scroll_window() -> None:
+    """Only the visible items (plus overscan) should be mounted."""
+    created: list[int] = []
+
+    def create_item(index: int) -> Widget:
+        created.append(index)
+        return Label(f"Item {index}")
+
+    virtual_scroll = VirtualScroll(100_000, create_item, overscan=5)
+    app = VirtualApp(virtual_scroll)
+    async with app.run_test(size=(40, 20)) as pilot:
+        await pilot.pause()
+        assert virtual_scroll.virtual_size == Size(38, 100_000)
+        assert virtual_scroll.window == range(0, 26)
+        assert len(virtual_scroll.children) == 26
+        assert virtual_scroll.get_item_widget(25) is not None
+        assert virtual_scroll.get_item_widget(26) is None
+
+        virtual_scroll.scroll_to_item(50_000)
+        await pilot.pause()
+        assert virtual_scroll.scroll_y == 50_000
+        assert virtual_scroll.window == range(49_995, 50_026)
+        assert len(virtual_scroll.children) == 31
+        label = virtual_scroll.get_item_widget(50_000)
+        assert label is not None
+        assert label.region.y == 0
+        assert str(label.render()) == "Item 50000"
+        # Without an update_item callable, widgets are created for each item
+        assert len(created) == 26 + 31
+
+
+async def test_virtual_scroll_recycle() -> None:
+    """Widgets should be recycled if there is an update_item callable."""
+    created: list[int] = []
+
+    def create_item(index: int) -> Widget:
+        created.append(index)
+        return Label(f"Item {index}")
+
+    def update_item(label: Widget, index: int) -> None:
+        assert isinstance(label, Label)
+        label.update(f"Item {index}")
+
+    virtual_scroll = VirtualScroll(
+        1000, create_item, update_item=update_item, overscan=5
+    )
+    app = VirtualApp(virtual_scroll)
+    async with app.run_test(size=(40, 20)) as pilot:
+        await pilot.pause()
+        children = set(virtual_scroll.children)
+        for _ in range(5):
+            await pilot.press("pagedown")
+        await pilot.pause()
+        # Window is at the maximum size once scrolled, so 5 more widgets are created
+        assert len(created) == 31
+        assert children < set(virtual_scroll.children)
+        first = virtual_scroll.window.start
+        label = virtual_scroll.get_item_widget(first + 5)
+        assert isinstance(label, Label)
+        assert str(label.render()) == f"Item {first + 5}"
+        assert virtual_scroll.get_item_index(label) == first + 5
+
+        virtual_scroll.refresh_items(10)
+        await pilot.pause()
+        assert virtual_scroll.scroll_y == 0
+        assert virtual_scroll.window == range(0, 10)
+        assert virtual_scroll.max_scroll_y == 0
+        assert len(created) == 31
+
+
+async def test_virtual_scroll_children_in_item_order() -> None:
+    """Children should be in the order of their items, after scrolling in either direction."""
+
+    def create_item(index: int) -> Widget:
+        return Label(f"Item {index}")
+
+    def update_item(label: Widget, index: int) -> None:
+        assert isinstance(label, Label)
+        label.update(f"Item {index}")
+
+    for update in (None, update_item):
+        virtual_scroll = VirtualScroll(
+            1000, create_item, update_item=update, overscan=5
+        )
+        app = VirtualApp(virtual_scroll)
+        async with app.run_test(size=(40, 20)) as pilot:
+            await pilot.pause()
+            for scroll_y in (500, 490, 200, 203, 0):
+                virtual_scroll.scroll_to(y=scroll_y, animate=False)
+                await pilot.pause()
+                indexes = [
+                    virtual_scroll.get_item_index(child)
+                    for child in virtual_scroll.children
+                    if child.display and child.is_attached
+                ]
+                assert indexes == list(virtual_scroll.window)
+
+
+async def test_virtual_scroll_estimated_height() -> None:
+    """Items should be measured when the height is an estimate."""
+    virtual_scroll = VirtualScroll(
+        1000,
+        lambda index: Static("\n".join([f"Item {index}"] * (1 + index % 2))),
+        item_height=1,
+        estimate_height=True,
+        overscan=0,
+    )
+    app = VirtualApp(virtual_scroll)
+    async with app.run_test(size=(40, 20)) as pilot:
+        await pilot.pause()
+        # 20 lines fit 14 items when every other item is 2 lines high
+        window = virtual_scroll.window
+        assert window == range(0, 14)
+        for index in window:
+            widget = virtual_scroll.get_item_widget(index)
+            assert widget is not None
+            assert widget.region.height == 1 + index % 2
+            assert virtual_scroll.get_item_offset(index) == index + index // 2
+        # The initial (estimated) window was 21 items, which remain measured;
+        # the rest use the estimate
+        assert virtual_scroll.virtual_size.height == 1000 + 10
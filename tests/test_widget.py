@@ -1,3 +1,4 @@
+import threading
 from operator import attrgetter
 
 import pytest
@@ -766,3 +767,51 @@ async def test_select_remove():
         expected = ", World Hello, World Hello, World Hello, World Hello, World Hello, World Hello, World Hello, World "
         print(repr(selected_text))
         assert selected_text == expected
+
+
+async def test_threaded_render():
+    """A widget with THREADED_RENDER should render in a thread, and show the previous
+    render until the new render is ready."""
+
+    class ThreadedStatic(Static):
+        THREADED_RENDER = True
+
+    class ThreadedApp(App):
+        # A fixed size, so the layout doesn't measure the content
+        CSS = "ThreadedStatic { width: 1fr; height: 1; }"
+
+        def compose(self) -> ComposeResult:
+            yield ThreadedStatic("Hello")
+
+    def screen_text(app: App) -> str:
+        return "\n".join(
+            strip.text for strip in app.screen._compositor.render_strips()
+        ).strip()
+
+    async def wait_for_render(widget: Widget) -> None:
+        while widget._render_future is not None:
+            await widget._render_future
+            await pilot.pause()
+
+    app = ThreadedApp()
+    async with app.run_test(size=(20, 3)) as pilot:
+        static = app.query_one(ThreadedStatic)
+        await pilot.pause()
+        await wait_for_render(static)
+        assert screen_text(app) == "Hello"
+
+        # A renderable which can't finish rendering until the gate is open
+        gate = threading.Event()
+
+        class GatedRenderable:
+            def __rich_console__(self, console, options):
+                gate.wait(5)
+                yield "World"
+
+        static.update(GatedRenderable())
+        await pilot.pause()
+        assert static._render_future is not None
+        assert screen_text(app) == "Hello"
+        gate.set()
+        await wait_for_render(static)
+        assert screen_text(app) == "World"
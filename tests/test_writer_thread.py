@@ -0,0 +1,49 @@
+import io
+import threading
+
+from textual.drivers._writer_thread import WriterThread
+
+
+def test_writer_thread_metrics() -> None:
+    file = io.StringIO()
+    writer = WriterThread(file)
+    writer.start()
+    writer.write("Hello")
+    writer.write(", Wörld")
+    writer.stop()
+    assert file.getvalue() == "Hello, Wörld"
+    metrics = writer.metrics
+    assert metrics.bytes_written == 13
+    assert metrics.bytes_per_second > 0
+    assert metrics.flushes >= 1
+    assert metrics.max_backlog >= 1
+    assert writer.backlog == 0
+
+
+def test_writer_thread_write_does_not_block() -> None:
+    """Writes should never block, while the file is slow."""
+
+    class SlowFile(io.StringIO):
+        def __init__(self) -> None:
+            self.blocked = threading.Event()
+            self.unblock = threading.Event()
+            super().__init__()
+
+        def write(self, text: str) -> int:
+            self.blocked.set()
+            self.unblock.wait()
+            return super().write(text)
+
+    file = SlowFile()
+    writer = WriterThread(file)
+    writer.start()
+    writer.write("0")
+    assert file.blocked.wait(5)
+    for number in range(1, 1000):
+        writer.write(str(number))
+    assert writer.backlog == 1000
+    file.unblock.set()
+    writer.stop()
+    assert file.getvalue() == "".join(str(number) for number in range(1000))
+    assert writer.backlog == 0
+    assert writer.metrics.max_backlog == 999